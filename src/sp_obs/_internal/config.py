@@ -1,15 +1,15 @@
+import functools
+import importlib
+import importlib.util
+import os
 import threading
 import typing
 from os import environ
+from types import MappingProxyType
 import logging
 from typing import Protocol, Optional
 
-from sp_obs._internal.core.aiohttp.aiohttp import SpinalAioHttpClientInstrumentor
-from sp_obs._internal.core.httpx.httpx import SpinalHTTPXClientInstrumentor
-from sp_obs._internal.core.requests.requests import SpinalRequestsInstrumentor
-from sp_obs._internal.core.grpc.grpc import SpinalGrpcClientInstrumentor
-from sp_obs._internal.core.grpc.grpc_aio import SpinalGrpcAioClientInstrumentor
-from sp_obs._internal.scrubbing import DefaultScrubber
+from sp_obs._internal.scrubbing import DefaultScrubber, NoOpScrubber
 from sp_obs._internal.tracer import SpinalTracerProvider
 from opentelemetry.util.http import PARAMS_TO_REDACT
 
@@ -24,16 +24,108 @@ class SpinalScrubber(Protocol):
         ...
 
 
-_DEFAULT_SCHEDULE_DELAY_MILLIS = 5000
-_DEFAULT_MAX_EXPORT_BATCH_SIZE = 512
-_DEFAULT_EXPORT_TIMEOUT_MILLIS = 30000
-_DEFAULT_MAX_QUEUE_SIZE = 2048
+# Shared so building a config does not compile the scrubbing regex again. scrubber=False selects the no-op one
+_DEFAULT_SCRUBBER = DefaultScrubber()
+_NOOP_SCRUBBER = NoOpScrubber()
+
+_DEFAULT_SCHEDULE_DELAY_MILLIS = 1000
+_DEFAULT_MAX_EXPORT_BATCH_SIZE = 256
+_DEFAULT_EXPORT_TIMEOUT_MILLIS = 10000
+_DEFAULT_MAX_QUEUE_SIZE = 4096
+_DEFAULT_EXPORT_LATENCY_TARGET_MILLIS = 2000
+_DEFAULT_EXPORT_CONSUMERS = max(1, min((os.cpu_count() or 2) // 2, 4))
+_EXTRA_PARAMS_TO_REDACT = ("api_key", "serp_api_key")
 _ENV_VAR_INT_VALUE_ERROR_MESSAGE = "Unable to parse value for %s as integer. Defaulting to %s."
 
 SPINAL_PROCESS_MAX_QUEUE_SIZE = "SPINAL_PROCESS_MAX_QUEUE_SIZE"
 SPINAL_PROCESS_SCHEDULE_DELAY = "SPINAL_PROCESS_SCHEDULE_DELAY"
 SPINAL_PROCESS_MAX_EXPORT_BATCH_SIZE = "SPINAL_PROCESS_MAX_EXPORT_BATCH_SIZE"
 SPINAL_PROCESS_EXPORT_TIMEOUT = "SPINAL_PROCESS_EXPORT_TIMEOUT"
+SPINAL_PROCESS_EXPORT_LATENCY_TARGET = "SPINAL_PROCESS_EXPORT_LATENCY_TARGET"
+SPINAL_EXPORT_CONSUMERS = "SPINAL_EXPORT_CONSUMERS"
+SPINAL_PROFILE = "SPINAL_PROFILE"
+SPINAL_MAX_BODY_BYTES = "SPINAL_MAX_BODY_BYTES"
+SPINAL_CAPTURE_BODY = "SPINAL_CAPTURE_BODY"
+SPINAL_EXPORT_COMPRESSION = "SPINAL_EXPORT_COMPRESSION"
+SPINAL_RECORD_EXCEPTIONS = "SPINAL_RECORD_EXCEPTIONS"
+_EXPORT_COMPRESSIONS = ("none", "gzip")
+
+# Batch processing presets selectable via SPINAL_PROFILE. Each keeps max_export_batch_size <= max_queue_size // 2 so
+# the queue can keep absorbing a burst while a full batch is being exported.
+_BATCH_PROCESSING_PROFILES = {
+    "high_throughput": {
+        "max_queue_size": 8192,
+        "max_export_batch_size": 1024,
+        "schedule_delay_millis": 2000,
+        "export_timeout_millis": 30000,
+    },
+    "low_latency": {
+        "max_queue_size": 2048,
+        "max_export_batch_size": 128,
+        "schedule_delay_millis": 250,
+        "export_timeout_millis": 10000,
+    },
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_int_env(name: str, raw_value: str | None, default: int) -> int:
+    """Parse an integer env var value, memoised on the raw string so repeated configs skip the int() cast"""
+    if raw_value is None:
+        return default
+    try:
+        return int(raw_value)
+    except ValueError:
+        logger.exception(_ENV_VAR_INT_VALUE_ERROR_MESSAGE, name, default)
+        return default
+
+
+def _int_env(name: str, default: int) -> int:
+    return _parse_int_env(name, environ.get(name), default)
+
+
+# (name accepted by disabled_instrumentors, top-level library module, "module:Class" instrumentor paths)
+_INSTRUMENTORS = (
+    ("aiohttp", "aiohttp", ("sp_obs._internal.core.aiohttp.aiohttp:SpinalAioHttpClientInstrumentor",)),
+    ("httpx", "httpx", ("sp_obs._internal.core.httpx.httpx:SpinalHTTPXClientInstrumentor",)),
+    ("requests", "requests", ("sp_obs._internal.core.requests.requests:SpinalRequestsInstrumentor",)),
+    (
+        "grpc",
+        "grpc",
+        (
+            "sp_obs._internal.core.grpc.grpc:SpinalGrpcClientInstrumentor",
+            "sp_obs._internal.core.grpc.grpc_aio:SpinalGrpcAioClientInstrumentor",
+        ),
+    ),
+)
+
+
+def _load_instrumentor(path: str) -> type:
+    module_name, _, class_name = path.partition(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def _set_opentelemetry_log_level(level: int | str) -> None:
+    """
+    Set the opentelemetry logger level, skipping the call when it already matches. setLevel clears the cached
+    enabled state of every logger in the process, and leaving an unchanged level alone respects host app logging set-up
+    """
+    if isinstance(level, str):
+        level = logging.getLevelName(level)
+    otel_logger = logging.getLogger("opentelemetry")
+    if otel_logger.level != level:
+        otel_logger.setLevel(level)
+
+
+# (SpinalConfig attribute, env var, default) for each batch processing setting
+_BATCH_PROCESSING_ENV_DEFAULTS = (
+    ("max_queue_size", SPINAL_PROCESS_MAX_QUEUE_SIZE, _DEFAULT_MAX_QUEUE_SIZE),
+    ("max_export_batch_size", SPINAL_PROCESS_MAX_EXPORT_BATCH_SIZE, _DEFAULT_MAX_EXPORT_BATCH_SIZE),
+    ("schedule_delay_millis", SPINAL_PROCESS_SCHEDULE_DELAY, _DEFAULT_SCHEDULE_DELAY_MILLIS),
+    ("export_timeout_millis", SPINAL_PROCESS_EXPORT_TIMEOUT, _DEFAULT_EXPORT_TIMEOUT_MILLIS),
+    ("export_consumers", SPINAL_EXPORT_CONSUMERS, _DEFAULT_EXPORT_CONSUMERS),
+    ("export_latency_target_millis", SPINAL_PROCESS_EXPORT_LATENCY_TARGET, _DEFAULT_EXPORT_LATENCY_TARGET_MILLIS),
+)
 
 
 class SpinalConfig:
@@ -45,9 +137,51 @@ class SpinalConfig:
         api_key: API key for authentication. Can also be set via SPINAL_API_KEY env var
         headers: Optional custom headers for the HTTP request
         timeout: Request timeout in seconds (default: 30)
-        scrubber: Optional scrubber instance for sensitive data redaction
+        scrubber: Optional scrubber instance for sensitive data redaction. Defaults to a shared DefaultScrubber, pass
+            False to disable scrubbing
+        export_consumers: Number of concurrent HTTP requests used to export batches. With more than one, batches
+            that fail to export are reported by force_flush rather than by export. Can also be set via
+            SPINAL_EXPORT_CONSUMERS env var (default: half the CPU count, capped at 4)
+        export_latency_target_millis: Average export latency above which non-billing spans start being dropped
+            before they are queued. Can also be set via SPINAL_PROCESS_EXPORT_LATENCY_TARGET env var (default: 2000)
+        coalesce_by_trace: Group queued spans by trace before cutting export batches, so the spans of one request
+            (e.g. every provider call of an agent run) are sent together (default: False)
+        max_body_bytes: Most bytes of a response body kept in memory for export. Longer bodies are still passed
+            through to the caller in full, but the span is marked as truncated. Can also be set via
+            SPINAL_MAX_BODY_BYTES env var (default: 0, no limit)
+        capture_body: Keep provider response bodies for export. When off only the body size is recorded, so usage is
+            not parsed from the response. Can also be turned off by setting SPINAL_CAPTURE_BODY env var to 0
+            (default: True)
+        export_compression: Compression applied to export requests, "gzip" or "none". Can also be set via
+            SPINAL_EXPORT_COMPRESSION env var (default: "none")
+        opentelemetry_log_level: Level applied to the opentelemetry logger when the config is built. Can also be set
+            via OTEL_PYTHON_LOG_LEVEL env var (default: logging.ERROR)
+        record_exceptions: Record an exception event with the formatted traceback on failed requests. When off only
+            the exception type and message are kept. Can also be turned off by setting SPINAL_RECORD_EXCEPTIONS env
+            var to 0 (default: True)
+
+    Batch processing settings fall back to their SPINAL_PROCESS_* env vars, then to the preset selected by
+    SPINAL_PROFILE (high_throughput or low_latency), then to the defaults. Keep max_export_batch_size at or below
+    max_queue_size // 2, otherwise bursts are dropped while a full batch is exported.
     """
 
+    # Config is written once and then read on every export, so slots keep those reads off the instance __dict__
+    __slots__ = (
+        "endpoint",
+        "api_key",
+        "timeout",
+        "scrubber",
+        "headers",
+        *(attribute for attribute, _, _ in _BATCH_PROCESSING_ENV_DEFAULTS),
+        "set_global_tracer",
+        "coalesce_by_trace",
+        "max_body_bytes",
+        "capture_body",
+        "export_compression",
+        "record_exceptions",
+        "opentelemetry_log_level",
+    )
+
     def __init__(
         self,
         endpoint: typing.Optional[str] = None,
@@ -58,24 +192,65 @@ class SpinalConfig:
         max_export_batch_size: int | None = None,
         schedule_delay_millis: float | None = None,
         export_timeout_millis: float | None = None,
-        scrubber: Optional[SpinalScrubber] = None,
-        opentelemetry_log_level: str = logging.ERROR,
+        export_consumers: int | None = None,
+        export_latency_target_millis: float | None = None,
+        scrubber: SpinalScrubber | typing.Literal[False] | None = None,
+        opentelemetry_log_level: int | str | None = None,
         set_global_tracer: bool = True,
+        coalesce_by_trace: bool = False,
+        max_body_bytes: int | None = None,
+        capture_body: bool | None = None,
+        export_compression: str | None = None,
+        record_exceptions: bool | None = None,
     ):
         self.endpoint = endpoint or environ.get("SPINAL_TRACING_ENDPOINT") or "https://cloud.withspinal.com"
         self.api_key = api_key or environ.get("SPINAL_API_KEY", "")
-        self.headers = headers or {}
         self.timeout = timeout
-        self.scrubber = scrubber or DefaultScrubber()
-
-        self.headers = self.headers | {"X-SPINAL-API-KEY": self.api_key}
+        if scrubber is None:
+            scrubber = _DEFAULT_SCRUBBER
+        elif scrubber is False:
+            scrubber = _NOOP_SCRUBBER
+        self.scrubber = scrubber
+
+        # Merged once and frozen. The exporter hands this mapping straight to its HTTP client without copying it
+        self.headers: typing.Mapping[str, str] = MappingProxyType({**(headers or {}), "X-SPINAL-API-KEY": self.api_key})
+
+        batch_overrides = {
+            "max_queue_size": max_queue_size,
+            "max_export_batch_size": max_export_batch_size,
+            "schedule_delay_millis": schedule_delay_millis,
+            "export_timeout_millis": export_timeout_millis,
+            "export_consumers": export_consumers,
+            "export_latency_target_millis": export_latency_target_millis,
+        }
+        profile = environ.get(SPINAL_PROFILE)
+        profile_defaults = _BATCH_PROCESSING_PROFILES.get(profile, {})
+        if profile and not profile_defaults:
+            logger.warning(
+                "Unknown %s '%s'. Expected one of %s", SPINAL_PROFILE, profile, list(_BATCH_PROCESSING_PROFILES)
+            )
 
-        self.max_queue_size = max_queue_size or SpinalConfig._default_max_queue_size()
-        self.max_export_batch_size = max_export_batch_size or SpinalConfig._default_max_export_batch_size()
-        self.schedule_delay_millis = schedule_delay_millis or SpinalConfig._default_schedule_delay_millis()
-        self.export_timeout_millis = export_timeout_millis or SpinalConfig._default_export_timeout_millis()
+        for attribute, env_var, default in _BATCH_PROCESSING_ENV_DEFAULTS:
+            default = profile_defaults.get(attribute, default)
+            override = batch_overrides[attribute]
+            setattr(self, attribute, override if override is not None else _int_env(env_var, default))
 
         self.set_global_tracer = set_global_tracer
+        self.coalesce_by_trace = coalesce_by_trace
+        self.max_body_bytes = max_body_bytes if max_body_bytes is not None else _int_env(SPINAL_MAX_BODY_BYTES, 0)
+        self.capture_body = capture_body if capture_body is not None else environ.get(SPINAL_CAPTURE_BODY, "1") != "0"
+        self.export_compression = (export_compression or environ.get(SPINAL_EXPORT_COMPRESSION, "none")).lower()
+        if self.export_compression not in _EXPORT_COMPRESSIONS:
+            logger.warning(
+                "Unknown %s '%s'. Expected one of %s, defaulting to none",
+                SPINAL_EXPORT_COMPRESSION,
+                self.export_compression,
+                list(_EXPORT_COMPRESSIONS),
+            )
+            self.export_compression = "none"
+        self.record_exceptions = (
+            record_exceptions if record_exceptions is not None else environ.get(SPINAL_RECORD_EXCEPTIONS, "1") != "0"
+        )
 
         if not self.endpoint:
             raise ValueError("Spinal endpoint must be provided either via parameter or SPINAL_TRACING_ENDPOINT env var")
@@ -83,79 +258,23 @@ class SpinalConfig:
         if not self.api_key:
             raise ValueError("No API key provided. Set via parameter or SPINAL_API_KEY env var")
 
-        if not opentelemetry_log_level:
-            opentelemetry_log_level = environ.get("OTEL_PYTHON_LOG_LEVEL", logging.ERROR)
-        logging.getLogger("opentelemetry").setLevel(opentelemetry_log_level)
-
-    @staticmethod
-    def _default_max_queue_size():
-        try:
-            return int(environ.get(SPINAL_PROCESS_MAX_QUEUE_SIZE, _DEFAULT_MAX_QUEUE_SIZE))
-        except ValueError:
-            logger.exception(
-                _ENV_VAR_INT_VALUE_ERROR_MESSAGE,
-                SPINAL_PROCESS_MAX_QUEUE_SIZE,
-                _DEFAULT_MAX_QUEUE_SIZE,
-            )
-            return _DEFAULT_MAX_QUEUE_SIZE
-
-    @staticmethod
-    def _default_schedule_delay_millis():
-        try:
-            return int(environ.get(SPINAL_PROCESS_SCHEDULE_DELAY, _DEFAULT_SCHEDULE_DELAY_MILLIS))
-        except ValueError:
-            logger.exception(
-                _ENV_VAR_INT_VALUE_ERROR_MESSAGE,
-                SPINAL_PROCESS_SCHEDULE_DELAY,
-                _DEFAULT_SCHEDULE_DELAY_MILLIS,
-            )
-            return _DEFAULT_SCHEDULE_DELAY_MILLIS
-
-    @staticmethod
-    def _default_max_export_batch_size():
-        try:
-            return int(
-                environ.get(
-                    SPINAL_PROCESS_MAX_EXPORT_BATCH_SIZE,
-                    _DEFAULT_MAX_EXPORT_BATCH_SIZE,
-                )
-            )
-        except ValueError:
-            logger.exception(
-                _ENV_VAR_INT_VALUE_ERROR_MESSAGE,
-                SPINAL_PROCESS_MAX_EXPORT_BATCH_SIZE,
-                _DEFAULT_MAX_EXPORT_BATCH_SIZE,
-            )
-            return _DEFAULT_MAX_EXPORT_BATCH_SIZE
-
-    @staticmethod
-    def _default_export_timeout_millis():
-        try:
-            return int(environ.get(SPINAL_PROCESS_EXPORT_TIMEOUT, _DEFAULT_EXPORT_TIMEOUT_MILLIS))
-        except ValueError:
-            logger.exception(
-                _ENV_VAR_INT_VALUE_ERROR_MESSAGE,
-                SPINAL_PROCESS_EXPORT_TIMEOUT,
-                _DEFAULT_EXPORT_TIMEOUT_MILLIS,
-            )
-            return _DEFAULT_EXPORT_TIMEOUT_MILLIS
+        # Applied as the config is built. Building it again with the same level leaves the logger alone
+        self.opentelemetry_log_level = (
+            opentelemetry_log_level
+            if opentelemetry_log_level is not None
+            else environ.get("OTEL_PYTHON_LOG_LEVEL", logging.ERROR)
+        )
+        _set_opentelemetry_log_level(self.opentelemetry_log_level)
 
 
 class SpinalSDK:
-    """Singleton SDK instance that manages configuration and tracer provider"""
-
-    _instance: Optional["SpinalSDK"] = None
-    _lock = threading.Lock()
+    """SDK instance that manages configuration and tracer provider. A single module-level instance is shared."""
 
-    def __new__(cls):
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
-                    cls._instance.config: SpinalConfig | None = None
-                    cls._instance.tracer_provider: SpinalTracerProvider | None = None
-        return cls._instance
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._initialized = False
+        self.config: SpinalConfig | None = None
+        self.tracer_provider: SpinalTracerProvider | None = None
 
     def configure(
         self,
@@ -168,8 +287,16 @@ class SpinalSDK:
         max_export_batch_size: int | None = None,
         schedule_delay_millis: float | None = None,
         export_timeout_millis: float | None = None,
-        scrubber: SpinalScrubber | None = None,
+        export_consumers: int | None = None,
+        export_latency_target_millis: float | None = None,
+        scrubber: SpinalScrubber | typing.Literal[False] | None = None,
         set_global_tracer: bool = True,
+        coalesce_by_trace: bool = False,
+        max_body_bytes: int | None = None,
+        capture_body: bool | None = None,
+        export_compression: str | None = None,
+        record_exceptions: bool | None = None,
+        disabled_instrumentors: typing.Collection[str] = (),
     ) -> SpinalConfig:
         """
         Configures the global Spinal SDK settings and initializes the Spinal configuration.
@@ -196,17 +323,40 @@ class SpinalSDK:
             The delay in milliseconds between scheduled task executions. None if not set.
         export_timeout_millis: float | None
             Timeout in milliseconds for exporting operations. None if not configured.
-        scrubber: SpinalScrubber | None
-            A configuration scrubber for cleaning sensitive data. None to disable.
+        export_consumers: int | None
+            Number of batches that can be exported concurrently. None to use the default.
+        export_latency_target_millis: float | None
+            Average export latency above which non-billing spans are shed. None to use the default.
+        scrubber: SpinalScrubber | Literal[False] | None
+            A configuration scrubber for cleaning sensitive data. None to use the DefaultScrubber, False to disable.
         set_global_tracer: bool
             If set, will configure the global tracer provider to Spinals. Default is True.
             Turn off if you are using an observability framework that already has a global tracer provider.
+        coalesce_by_trace: bool
+            If set, queued spans are grouped by trace id before being split into export batches. Default is False.
+        max_body_bytes: int | None
+            Most bytes of each response body kept for export. None to use SPINAL_MAX_BODY_BYTES, 0 for no limit.
+        capture_body: bool | None
+            Keep response bodies for export. None to use SPINAL_CAPTURE_BODY, False to record only their size.
+        export_compression: str | None
+            "gzip" to compress export requests. None to use SPINAL_EXPORT_COMPRESSION, which defaults to "none".
+        record_exceptions: bool | None
+            Record exception events with tracebacks. None to use SPINAL_RECORD_EXCEPTIONS, False for type and message.
+        disabled_instrumentors: Collection[str]
+            Client libraries to leave uninstrumented. Any of "aiohttp", "httpx", "requests" and "grpc".
 
         Returns:
         SpinalConfig
             The updated Spinal configuration instance.
 
         """
+        # Reading the flag is the whole fast path once configured. The lock is only contended by concurrent first
+        # calls, and it is what stops those from building two tracer providers and instrumenting every library twice.
+        # functools.cache or an Event would not give that exclusion without a lock of their own
+        if self._initialized:
+            logger.debug("SDK already configured, returning existing configuration")
+            return self.config
+
         with self._lock:
             if self._initialized:
                 logger.debug("SDK already configured, returning existing configuration")
@@ -222,30 +372,70 @@ class SpinalSDK:
                 max_export_batch_size=max_export_batch_size,
                 schedule_delay_millis=schedule_delay_millis,
                 export_timeout_millis=export_timeout_millis,
+                export_consumers=export_consumers,
+                export_latency_target_millis=export_latency_target_millis,
                 set_global_tracer=set_global_tracer,
+                coalesce_by_trace=coalesce_by_trace,
+                max_body_bytes=max_body_bytes,
+                capture_body=capture_body,
+                export_compression=export_compression,
+                record_exceptions=record_exceptions,
             )
 
             # Setup auto instrumentation
             self.tracer_provider = SpinalTracerProvider(self.config)
-            SpinalAioHttpClientInstrumentor().instrument(tracer_provider=self.tracer_provider.provider)
-            SpinalHTTPXClientInstrumentor().instrument(tracer_provider=self.tracer_provider.provider)
-            SpinalRequestsInstrumentor().instrument(tracer_provider=self.tracer_provider.provider)
-            SpinalGrpcClientInstrumentor().instrument(tracer_provider=self.tracer_provider.provider)
-            SpinalGrpcAioClientInstrumentor().instrument(tracer_provider=self.tracer_provider.provider)
+            self._instrument_libraries(disabled_instrumentors)
 
-            # Add to params to redact util
-            PARAMS_TO_REDACT.append("api_key")
-            PARAMS_TO_REDACT.append("serp_api_key")
+            # Add to params to redact util. Guarded so repeated SDK set-up (tests, forked workers) never grows the list
+            for param in _EXTRA_PARAMS_TO_REDACT:
+                if param not in PARAMS_TO_REDACT:
+                    PARAMS_TO_REDACT.append(param)
 
             self._initialized = True
             logger.info(f"Spinal SDK configured with endpoint: {self.config.endpoint}")
             return self.config
 
-    def get_config(self) -> SpinalConfig:
-        """Get the global Spinal configuration"""
-        if not self._initialized:
-            return self.configure()
-        return self.config
+    def _instrument_libraries(self, disabled_instrumentors: typing.Collection[str]) -> None:
+        """
+        Instrument the supported client libraries. Instrumentors are imported here rather than at module level so
+        importing sp_obs stays cheap, and a library that is not installed only skips its own instrumentation.
+        """
+        provider = self.tracer_provider.provider
+
+        for name, library, instrumentor_paths in _INSTRUMENTORS:
+            if name in disabled_instrumentors:
+                continue
+
+            # find_spec checks for the library without paying for its import when it is missing
+            if importlib.util.find_spec(library) is None:
+                logger.debug("%s not installed, skipping instrumentation", name)
+                continue
+
+            try:
+                instrumentors = [_load_instrumentor(path) for path in instrumentor_paths]
+            except ImportError:
+                logger.debug("%s instrumentation unavailable, skipping", name, exc_info=True)
+                continue
+
+            for instrumentor in instrumentors:
+                instrumentor().instrument(
+                    tracer_provider=provider,
+                    max_body_bytes=self.config.max_body_bytes,
+                    capture_body=self.config.capture_body,
+                    record_exceptions=self.config.record_exceptions,
+                )
+
+    def get_config(self) -> Optional[SpinalConfig]:
+        """
+        Get the global Spinal configuration. If the SDK is not configured yet it is configured from the environment,
+        and None is returned when no API key is set there, so callers in an untraced environment are not handed a
+        ValueError on every call
+        """
+        if self._initialized:
+            return self.config
+        if not environ.get("SPINAL_API_KEY"):
+            return None
+        return self.configure()
 
     def get_tracer_provider(self) -> Optional[SpinalTracerProvider]:
         """Get the tracer provider, returns None if not configured"""
@@ -256,7 +446,7 @@ class SpinalSDK:
         return self._initialized
 
 
-# Create the singleton instance
+# Module-level SDK instance shared by the public API functions below
 _sdk = SpinalSDK()
 
 
@@ -270,6 +460,6 @@ def get_tracer_provider():
     return _sdk.get_tracer_provider()
 
 
-def get_config() -> SpinalConfig:
-    """Get the global Spinal configuration"""
+def get_config() -> Optional[SpinalConfig]:
+    """Get the global Spinal configuration, returns None if not configured and no API key is set"""
     return _sdk.get_config()
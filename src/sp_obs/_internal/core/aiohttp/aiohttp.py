@@ -1,16 +1,51 @@
 """aiohttp client instrumentation for Spinal observability."""
 
 import types
-from urllib.parse import urlparse
 
 import aiohttp
 import opentelemetry.instrumentation.aiohttp_client
-from opentelemetry import trace, context
+from opentelemetry import context
 from opentelemetry.trace import SpanKind, Status, StatusCode, get_tracer
-from opentelemetry.util.http import redact_url
 
-from sp_obs._internal.core.recognised_integrations import supported_host
-from sp_obs.utils import add_request_params_to_span
+from sp_obs._internal.core.recognised_integrations import CAPTURED_RESPONSE_HEADERS, supported_host
+from sp_obs.utils import (
+    add_request_params_to_span,
+    body_attribute,
+    extend_body_buffer,
+    record_span_exception,
+    redact_request_url,
+)
+
+
+# Response bodies are only buffered for content types the exporter parses, matched on these markers in the lower-cased
+# header so that "+json" vendor types, event streams and odd spellings still count. Anything else (audio, images, PDFs,
+# octet-streams) is counted but not kept in memory
+_CAPTURED_CONTENT_TYPE_MARKERS = ("json", "event-stream", "text/", "xml")
+
+
+def _captures_content_type(content_type: str) -> bool:
+    """Whether a response body of this content type is buffered. Bodies without a Content-Type are kept"""
+    if not content_type:
+        return True
+    content_type = content_type.lower()
+    return any(marker in content_type for marker in _CAPTURED_CONTENT_TYPE_MARKERS)
+
+
+def _finish_spinal_span(
+    trace_config_ctx: types.SimpleNamespace, status: Status | None = None, exception: BaseException | None = None
+) -> None:
+    """End the request's Spinal span once, whichever callback sees the request finish first"""
+    spinal_span = trace_config_ctx.spinal_span
+    if spinal_span is None or trace_config_ctx.spinal_span_ended:
+        return
+
+    if exception:
+        record_span_exception(spinal_span, exception, trace_config_ctx.spinal_record_exceptions)
+    elif status:
+        spinal_span.set_status(status)
+
+    spinal_span.end()
+    trace_config_ctx.spinal_span_ended = True
 
 
 class SpinalAioHttpClientInstrumentor(opentelemetry.instrumentation.aiohttp_client.AioHttpClientInstrumentor):
@@ -26,6 +61,10 @@ class SpinalAioHttpClientInstrumentor(opentelemetry.instrumentation.aiohttp_clie
         """
         provider = kwargs.get("tracer_provider")
         tracer = get_tracer(__name__, tracer_provider=provider)
+        # Set by SpinalSDK from SpinalConfig.max_body_bytes, capture_body and record_exceptions. 0 keeps whole bodies
+        max_body_bytes = kwargs.get("max_body_bytes", 0)
+        capture_body = kwargs.get("capture_body", True)
+        record_exceptions = kwargs.get("record_exceptions", True)
 
         # Store reference to original create_trace_config
         original_create_trace_config = opentelemetry.instrumentation.aiohttp_client.create_trace_config
@@ -47,27 +86,30 @@ class SpinalAioHttpClientInstrumentor(opentelemetry.instrumentation.aiohttp_clie
                 params: aiohttp.TraceRequestStartParams,
             ):
                 """Create Spinal span for supported integrations at request start."""
-                # Get URL and check if this is a supported integration
-                url = str(params.url)
-                redacted_url = redact_url(url)
-                location = urlparse(redacted_url)
+                # Every field the later callbacks read is set here, so they can read them directly rather than
+                # probing the context with hasattr on each chunk
+                trace_config_ctx.spinal_span = None
+                trace_config_ctx.spinal_response_buf = None
+                trace_config_ctx.spinal_response_size = 0
+                trace_config_ctx.spinal_capture_body = capture_body
+                trace_config_ctx.spinal_record_exceptions = record_exceptions
+                trace_config_ctx.spinal_span_ended = False
+                trace_config_ctx.response_stream_reader = None
 
-                integration_provider = supported_host(location.hostname)
+                # Check the host first. aiohttp hands us a parsed yarl URL, so unsupported hosts are skipped without
+                # redacting or re-parsing the URL
+                hostname = params.url.host
+                integration_provider = supported_host(hostname) if hostname else None
                 if not integration_provider:
                     # Not a supported integration, skip Spinal span creation
-                    trace_config_ctx.spinal_span = None
-                    trace_config_ctx.spinal_token = None
                     return
 
+                redacted_url = redact_request_url(str(params.url))
                 parent_context = context.get_current()
-                parent_span = trace.get_current_span(parent_context)
-                parent_start_time = (
-                    parent_span.start_time if parent_span and hasattr(parent_span, "start_time") else None
-                )
 
                 span_attributes = {
                     "http.url": redacted_url,
-                    "http.host": location.hostname,
+                    "http.host": hostname,
                     "spinal.provider": integration_provider,
                     "http.method": params.method,
                 }
@@ -76,25 +118,30 @@ class SpinalAioHttpClientInstrumentor(opentelemetry.instrumentation.aiohttp_clie
                     kind=SpanKind.CLIENT,
                     attributes=span_attributes,
                     context=parent_context,
-                    start_time=parent_start_time,
                 )
+                if not spinal_span.is_recording():
+                    # Nothing recorded on this span would be exported, so skip the header and body capture
+                    spinal_span.end()
+                    return
 
                 # Add request parameters to span
                 add_request_params_to_span(spinal_span, redacted_url)
 
+                # A str body is recorded as it is, and the exporter encodes it back to UTF-8
                 if hasattr(params, "data") and params.data:
                     if isinstance(params.data, bytes):
-                        spinal_span.set_attribute("spinal.request.binary_data", memoryview(params.data))
+                        spinal_span.set_attribute("spinal.request.binary_data", body_attribute(params.data))
                     elif isinstance(params.data, str):
-                        spinal_span.set_attribute("spinal.request.binary_data", memoryview(params.data.encode()))
+                        spinal_span.set_attribute("spinal.request.binary_data", params.data)
 
-                # Store span in context for later callbacks
+                # Store span in context for later callbacks. It is not made the current span: it runs alongside
+                # OpenTelemetry's own aiohttp span and nothing downstream reads it, so an attach/detach pair would only
+                # allocate a Context and Token per request
                 trace_config_ctx.spinal_span = spinal_span
-                trace_config_ctx.spinal_token = context.attach(trace.set_span_in_context(spinal_span))
 
-                # Initialize response chunks storage and tracking
-                trace_config_ctx.spinal_response_chunks = []
-                trace_config_ctx.spinal_span_ended = False
+                # Chunks are appended in place, so the body is never held twice as a list of chunks and their joined
+                # copy
+                trace_config_ctx.spinal_response_buf = bytearray()
 
             async def spinal_on_response_chunk_received(
                 session: aiohttp.ClientSession,
@@ -102,30 +149,28 @@ class SpinalAioHttpClientInstrumentor(opentelemetry.instrumentation.aiohttp_clie
                 params: aiohttp.TraceResponseChunkReceivedParams,
             ):
                 """Collect response body chunks as they arrive and end span when complete."""
-                if not hasattr(trace_config_ctx, "spinal_span") or trace_config_ctx.spinal_span is None:
-                    return
-
-                if getattr(trace_config_ctx, "spinal_span_ended", False):
+                if trace_config_ctx.spinal_span is None or trace_config_ctx.spinal_span_ended:
                     return
 
                 spinal_span = trace_config_ctx.spinal_span
                 stream_reader = trace_config_ctx.response_stream_reader
 
                 # Collect chunk
-                if hasattr(trace_config_ctx, "spinal_response_chunks"):
-                    trace_config_ctx.spinal_response_chunks.append(params.chunk)
+                response_buf = trace_config_ctx.spinal_response_buf
+                trace_config_ctx.spinal_response_size += len(params.chunk)
+                if trace_config_ctx.spinal_capture_body:
+                    extend_body_buffer(response_buf, params.chunk, max_body_bytes)
 
                 if stream_reader.at_eof():
-                    response_body = b"".join(trace_config_ctx.spinal_response_chunks)
-                    spinal_span.set_attribute("spinal.response.binary_data", memoryview(response_body))
-                    spinal_span.set_attribute("spinal.response.size", len(response_body))
-
-                    # Set span status and end
-                    spinal_span.set_status(Status(StatusCode.OK))
-                    if hasattr(trace_config_ctx, "spinal_token") and trace_config_ctx.spinal_token:
-                        context.detach(trace_config_ctx.spinal_token)
-                    spinal_span.end()
-                    trace_config_ctx.spinal_span_ended = True
+                    if response_buf:
+                        spinal_span.set_attribute("spinal.response.binary_data", body_attribute(response_buf))
+                        if trace_config_ctx.spinal_response_size > len(response_buf):
+                            spinal_span.set_attribute("spinal.response.truncated", True)
+                            spinal_span.set_attribute(
+                                "spinal.response.original_length", trace_config_ctx.spinal_response_size
+                            )
+                    spinal_span.set_attribute("spinal.response.size", trace_config_ctx.spinal_response_size)
+                    _finish_spinal_span(trace_config_ctx, Status(StatusCode.OK))
 
             async def spinal_on_request_end(
                 session: aiohttp.ClientSession,
@@ -133,37 +178,43 @@ class SpinalAioHttpClientInstrumentor(opentelemetry.instrumentation.aiohttp_clie
                 params: aiohttp.TraceRequestEndParams,
             ):
                 """Capture response metadata when headers are received."""
-                if not hasattr(trace_config_ctx, "spinal_span") or trace_config_ctx.spinal_span is None:
-                    return
-
-                if getattr(trace_config_ctx, "spinal_span_ended", False):
+                if trace_config_ctx.spinal_span is None or trace_config_ctx.spinal_span_ended:
                     return
 
                 trace_config_ctx.response_stream_reader = params.response.content
                 spinal_span = trace_config_ctx.spinal_span
 
+                content_length = None
                 if params.response:
-                    spinal_span.set_attribute("http.status_code", params.response.status)
+                    # Collected and set in one call, so the span lock is taken once rather than once per header
+                    response_attributes = {"http.status_code": params.response.status}
 
-                    # Capture response headers
+                    # Capture the response headers providers parse. The headers the callbacks need are picked up in
+                    # the same pass, since each CIMultiDict.get is its own case-insensitive walk over the headers
                     if hasattr(params.response, "headers"):
+                        content_type = ""
+                        content_encoding = ""
                         for header_name, header_value in params.response.headers.items():
-                            spinal_span.set_attribute(f"spinal.http.response.header.{header_name}", header_value)
-
-                        content_type = params.response.headers.get("content-type", "")
-                        encoding = params.response.headers.get("content-encoding", "")
-                        spinal_span.set_attribute("content-type", content_type)
-                        spinal_span.set_attribute("content-encoding", encoding)
+                            lower_name = header_name.lower()
+                            if lower_name == "content-type":
+                                content_type = header_value
+                            elif lower_name == "content-encoding":
+                                content_encoding = header_value
+                            elif lower_name == "content-length":
+                                content_length = header_value
+                            elif lower_name in CAPTURED_RESPONSE_HEADERS:
+                                response_attributes[f"spinal.http.response.header.{header_name}"] = header_value
+
+                        response_attributes["content-type"] = content_type
+                        response_attributes["content-encoding"] = content_encoding
+                        trace_config_ctx.spinal_capture_body = capture_body and _captures_content_type(content_type)
+
+                    spinal_span.set_attributes(response_attributes)
 
                 # Check if there's no body expected (Content-Length: 0 or status 204/304)
                 # In these cases, on_response_chunk_received won't be called, so end span here
-                content_length = params.response.headers.get("content-length")
                 if (content_length == "0") or (params.response and params.response.status in (204, 304)):
-                    spinal_span.set_status(Status(StatusCode.OK))
-                    if hasattr(trace_config_ctx, "spinal_token") and trace_config_ctx.spinal_token:
-                        context.detach(trace_config_ctx.spinal_token)
-                    spinal_span.end()
-                    trace_config_ctx.spinal_span_ended = True
+                    _finish_spinal_span(trace_config_ctx, Status(StatusCode.OK))
 
             async def spinal_on_request_exception(
                 session: aiohttp.ClientSession,
@@ -171,25 +222,7 @@ class SpinalAioHttpClientInstrumentor(opentelemetry.instrumentation.aiohttp_clie
                 params: aiohttp.TraceRequestExceptionParams,
             ):
                 """End Spinal span on request exception."""
-                if not hasattr(trace_config_ctx, "spinal_span") or trace_config_ctx.spinal_span is None:
-                    return
-
-                # Skip if span already ended
-                if getattr(trace_config_ctx, "spinal_span_ended", False):
-                    return
-
-                spinal_span = trace_config_ctx.spinal_span
-
-                # Record exception
-                if params.exception:
-                    spinal_span.record_exception(params.exception)
-                    spinal_span.set_status(Status(StatusCode.ERROR, str(params.exception)))
-
-                # Detach context and end span
-                if hasattr(trace_config_ctx, "spinal_token") and trace_config_ctx.spinal_token:
-                    context.detach(trace_config_ctx.spinal_token)
-                spinal_span.end()
-                trace_config_ctx.spinal_span_ended = True
+                _finish_spinal_span(trace_config_ctx, exception=params.exception)
 
             # Append our callbacks to the trace config
             # These run alongside the original OTel callbacks
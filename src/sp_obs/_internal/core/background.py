@@ -0,0 +1,39 @@
+"""
+A single background worker for instrumentation work that does not need to hold up the caller, such as turning a
+finished async response into its Spinal span. One worker keeps the spans in the order their responses completed.
+"""
+
+import os
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Callable
+
+_executor: ThreadPoolExecutor
+_pending: set[Future] = set()
+
+
+def _start_executor() -> None:
+    global _executor
+    _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="SpinalBackground")
+    _pending.clear()
+
+
+_start_executor()
+if hasattr(os, "register_at_fork"):
+    # Pool threads do not survive a fork, so the child needs its own
+    os.register_at_fork(after_in_child=_start_executor)
+
+
+def submit(fn: Callable[[], None]) -> None:
+    """Run fn on the background worker. Errors are left to fn, as nothing waits on its result"""
+    future = _executor.submit(fn)
+    _pending.add(future)
+    future.add_done_callback(_pending.discard)
+
+
+def wait_for_pending(timeout: float | None = None) -> bool:
+    """Wait for the work submitted so far, so its spans reach the processor before a flush or shutdown"""
+    pending = _pending.copy()
+    if not pending:
+        return True
+    _, not_done = wait(pending, timeout=timeout)
+    return not not_done
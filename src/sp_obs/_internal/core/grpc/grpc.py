@@ -15,7 +15,7 @@ import logging
 from weakref import WeakKeyDictionary
 
 import grpc
-from opentelemetry import context, trace
+from opentelemetry import context
 from opentelemetry.instrumentation.grpc import GrpcInstrumentorClient, _client
 from opentelemetry.trace import Status, StatusCode, get_tracer
 
@@ -23,16 +23,59 @@ from sp_obs._internal.constants import SPINAL_GRPC_REQUEST_SPAN_NAME
 from sp_obs._internal.core.grpc.grpc_integrations import match_grpc_service
 from sp_obs._internal.core.grpc.grpc_utils import (
     _add_response_metadata,
+    _attach_child_span,
+    _detach_child_span,
+    _get_child_span,
     _extract_grpc_metadata,
     _extract_service_name,
 )
 
 logger = logging.getLogger(__name__)
 
-# Store child spans keyed by parent span for completion in response_hook
+# Child spans of parent spans that cannot hold them as an attribute, for completion in response_hook
 _child_spans: WeakKeyDictionary = WeakKeyDictionary()
 
 
+def _wrap_trace_result(original_trace_result):
+    """Wrap OpenTelemetry's _trace_result, keeping the original on the wrapper so it can be restored"""
+
+    def wrapped_trace_result(self, span, rpc_info, result):
+        """
+        Wrapped _trace_result that handles grpc.Future responses for Spinal child spans.
+
+        When a gRPC call returns a Future (async operations), the response_hook is never
+        called. Instead, we add our own callback to the future to complete the child span.
+        """
+        if isinstance(result, grpc.Future):
+            child_span = _get_child_span(span, _child_spans)
+            if child_span:
+
+                def spinal_future_callback(future):
+                    """Callback to handle Future completion and update child span"""
+                    try:
+                        # Get response to ensure future completed (may raise exception if RPC failed)
+                        _ = future.result()
+
+                        # _add_response_metadata sets the status based on gRPC status code
+                        _add_response_metadata(child_span, span)
+                        child_span.end()
+
+                    except Exception as e:
+                        logger.error(f"Spinal Future callback error: {e}", exc_info=True)
+                        child_span.set_status(Status(StatusCode.ERROR, str(e)))
+                        child_span.end()
+                    finally:
+                        _detach_child_span(span, _child_spans)
+
+                # Add our callback to the Future
+                result.add_done_callback(spinal_future_callback)
+
+        return original_trace_result(self, span, rpc_info, result)
+
+    wrapped_trace_result._spinal_original = original_trace_result
+    return wrapped_trace_result
+
+
 class SpinalGrpcClientInstrumentor(GrpcInstrumentorClient):
     """
     Spinal's gRPC client instrumentor that wraps OpenTelemetry's gRPC instrumentation.
@@ -73,23 +116,22 @@ class SpinalGrpcClientInstrumentor(GrpcInstrumentorClient):
                 if not provider_name:
                     return
 
-                # Get current context and parent span timing
+                # Get current context. The span starts now rather than at its parent's start time
                 parent_context = context.get_current()
-                parent_span = trace.get_current_span(parent_context)
-                parent_start_time = (
-                    parent_span.start_time if parent_span and hasattr(parent_span, "start_time") else None
-                )
                 parent_attrs = _extract_grpc_metadata(span, provider_name)
 
                 spinal_span = tracer.start_span(
                     SPINAL_GRPC_REQUEST_SPAN_NAME,
                     context=parent_context,
-                    start_time=parent_start_time,
                     attributes=parent_attrs,
                 )
+                if not spinal_span.is_recording():
+                    # Not exported, so there is no response metadata worth collecting
+                    spinal_span.end()
+                    return
 
                 # Store child span reference for completion in response_hook
-                _child_spans[span] = spinal_span
+                _attach_child_span(span, spinal_span, _child_spans)
 
             except Exception as e:
                 logger.error(f"Spinal request_hook error: {e}", exc_info=True)
@@ -102,7 +144,7 @@ class SpinalGrpcClientInstrumentor(GrpcInstrumentorClient):
             (status, error messages) and ending the span.
             """
             # Get our child span if it exists
-            child_span = _child_spans.get(span)
+            child_span = _get_child_span(span, _child_spans)
 
             if child_span:
                 try:
@@ -115,7 +157,7 @@ class SpinalGrpcClientInstrumentor(GrpcInstrumentorClient):
                     child_span.set_status(Status(StatusCode.ERROR, str(e)))
                     child_span.end()
                 finally:
-                    del _child_spans[span]
+                    _detach_child_span(span, _child_spans)
 
             if user_response_hook:
                 try:
@@ -129,45 +171,16 @@ class SpinalGrpcClientInstrumentor(GrpcInstrumentorClient):
         super()._instrument(**kwargs)
 
         # Wrap _trace_result to handle grpc.Future responses
-        # The response_hook is NOT called for futures, so we need to handle them separately
-        original_trace_result = _client.OpenTelemetryClientInterceptor._trace_result
-
-        def wrapped_trace_result(self, span, rpc_info, result):
-            """
-            Wrapped _trace_result that handles grpc.Future responses for Spinal child spans.
-
-            When a gRPC call returns a Future (async operations), the response_hook is never
-            called. Instead, we add our own callback to the future to complete the child span.
-            """
-            if isinstance(result, grpc.Future):
-                child_span = _child_spans.get(span)
-                if child_span:
-
-                    def spinal_future_callback(future):
-                        """Callback to handle Future completion and update child span"""
-                        try:
-                            # Get response to ensure future completed (may raise exception if RPC failed)
-                            _ = future.result()
-
-                            # _add_response_metadata sets the status based on gRPC status code
-                            _add_response_metadata(child_span, span)
-                            child_span.end()
-
-                        except Exception as e:
-                            logger.error(f"Spinal Future callback error: {e}", exc_info=True)
-                            child_span.set_status(Status(StatusCode.ERROR, str(e)))
-                            child_span.end()
-                        finally:
-                            if span in _child_spans:
-                                del _child_spans[span]
-
-                    # Add our callback to the Future
-                    result.add_done_callback(spinal_future_callback)
-
-            return original_trace_result(self, span, rpc_info, result)
-
-        _client.OpenTelemetryClientInterceptor._trace_result = wrapped_trace_result
+        # The response_hook is NOT called for futures, so we need to handle them separately. The interceptor class is
+        # patched once, so instrumenting again does not stack another wrapper onto every RPC
+        trace_result = _client.OpenTelemetryClientInterceptor._trace_result
+        if not hasattr(trace_result, "_spinal_original"):
+            _client.OpenTelemetryClientInterceptor._trace_result = _wrap_trace_result(trace_result)
 
     def _uninstrument(self, **kwargs):
         """Remove instrumentation"""
         super()._uninstrument(**kwargs)
+
+        original_trace_result = getattr(_client.OpenTelemetryClientInterceptor._trace_result, "_spinal_original", None)
+        if original_trace_result is not None:
+            _client.OpenTelemetryClientInterceptor._trace_result = original_trace_result
@@ -14,7 +14,7 @@ This follows the same pattern as sync gRPC and HTTP instrumentors:
 import logging
 from weakref import WeakKeyDictionary
 
-from opentelemetry import context, trace
+from opentelemetry import context
 from opentelemetry.instrumentation.grpc import GrpcAioInstrumentorClient
 from opentelemetry.trace import Status, StatusCode, get_tracer
 
@@ -22,12 +22,16 @@ from sp_obs._internal.constants import SPINAL_GRPC_ASYNC_REQUEST_SPAN_NAME
 from sp_obs._internal.core.grpc.grpc_integrations import match_grpc_service
 from sp_obs._internal.core.grpc.grpc_utils import (
     _add_response_metadata,
+    _attach_child_span,
+    _detach_child_span,
+    _get_child_span,
     _extract_grpc_metadata,
     _extract_service_name,
 )
 
 logger = logging.getLogger(__name__)
 
+# Child spans of parent spans that cannot hold them as an attribute, for completion in response_hook
 _aio_child_spans: WeakKeyDictionary = WeakKeyDictionary()
 
 
@@ -73,23 +77,22 @@ class SpinalGrpcAioClientInstrumentor(GrpcAioInstrumentorClient):
                 if not provider_name:
                     return
 
-                # Get current context and parent span timing
+                # Get current context. The span starts now rather than at its parent's start time
                 parent_context = context.get_current()
-                parent_span = trace.get_current_span(parent_context)
-                parent_start_time = (
-                    parent_span.start_time if parent_span and hasattr(parent_span, "start_time") else None
-                )
                 parent_attrs = _extract_grpc_metadata(span, provider_name)
 
                 spinal_span = tracer.start_span(
                     SPINAL_GRPC_ASYNC_REQUEST_SPAN_NAME,
                     context=parent_context,
-                    start_time=parent_start_time,
                     attributes=parent_attrs,
                 )
+                if not spinal_span.is_recording():
+                    # Not exported, so there is no response metadata worth collecting
+                    spinal_span.end()
+                    return
 
                 # Store child span reference for completion in response_hook/callback
-                _aio_child_spans[span] = spinal_span
+                _attach_child_span(span, spinal_span, _aio_child_spans)
 
             except Exception as e:
                 logger.error(f"Spinal async request_hook error: {e}", exc_info=True)
@@ -104,7 +107,7 @@ class SpinalGrpcAioClientInstrumentor(GrpcAioInstrumentorClient):
             Note: For async calls, this is typically called from the done_callback
             after the RPC completes.
             """
-            child_span = _aio_child_spans.get(span)
+            child_span = _get_child_span(span, _aio_child_spans)
 
             if child_span:
                 try:
@@ -117,7 +120,7 @@ class SpinalGrpcAioClientInstrumentor(GrpcAioInstrumentorClient):
                     child_span.set_status(Status(StatusCode.ERROR, str(e)))
                     child_span.end()
                 finally:
-                    del _aio_child_spans[span]
+                    _detach_child_span(span, _aio_child_spans)
 
             if user_response_hook:
                 try:
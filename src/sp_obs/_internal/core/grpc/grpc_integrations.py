@@ -7,6 +7,8 @@ is being called.
 """
 
 import fnmatch
+import functools
+import re
 
 # Map gRPC service name patterns to provider identifiers
 GRPC_SERVICE_PATTERNS = {
@@ -20,6 +22,24 @@ GRPC_SERVICE_PATTERNS = {
 }
 
 
+def _compile_service_patterns(patterns: dict[str, str]) -> tuple[re.Pattern, dict[str, str]]:
+    """
+    Combine every glob into one alternation, ordered by specificity (more specific patterns first) so that
+    "google.cloud.documentai.*" matches before "google.cloud.*". Each alternative is a named group, and the group
+    that matched identifies the provider.
+    """
+    ordered = sorted(patterns.items(), key=lambda x: (-x[0].count("."), -len(x[0])))
+    group_providers = {f"p{index}": provider for index, (_, provider) in enumerate(ordered)}
+    regex = "|".join(f"(?P<p{index}>{fnmatch.translate(pattern)})" for index, (pattern, _) in enumerate(ordered))
+    # An empty registry compiles to a pattern that never matches
+    return re.compile(regex or r"(?!)"), group_providers
+
+
+_SERVICE_PATTERN, _GROUP_PROVIDERS = _compile_service_patterns(GRPC_SERVICE_PATTERNS)
+
+
+# Service names come from a small, fixed set of RPC definitions, so steady-state lookups are cache hits
+@functools.lru_cache(maxsize=1024)
 def match_grpc_service(service_name: str | None) -> str | None:
     """
     Match a gRPC service name against known patterns to identify the provider.
@@ -41,12 +61,23 @@ def match_grpc_service(service_name: str | None) -> str | None:
     if not service_name:
         return None
 
-    # Sort patterns by specificity (more specific patterns first)
-    # This ensures "google.cloud.documentai.*" matches before "google.cloud.*"
-    sorted_patterns = sorted(GRPC_SERVICE_PATTERNS.items(), key=lambda x: (-x[0].count("."), -len(x[0])))
+    match = _SERVICE_PATTERN.match(service_name)
+    if match is None:
+        return None
+    return _GROUP_PROVIDERS[match.lastgroup]
+
+
+def register_grpc_service_pattern(pattern: str, provider: str) -> None:
+    """
+    Add a gRPC service pattern to the registry. The patterns are compiled into one regex and lookups are cached, so
+    entries must be added here rather than directly to GRPC_SERVICE_PATTERNS for them to take effect.
 
-    for pattern, provider in sorted_patterns:
-        if fnmatch.fnmatch(service_name, pattern):
-            return provider
+    Args:
+        pattern: fnmatch-style service name pattern (e.g., "acme.ocr.*")
+        provider: Provider identifier recorded for matching services (e.g., "acme-ocr")
+    """
+    global _SERVICE_PATTERN, _GROUP_PROVIDERS
 
-    return None
+    GRPC_SERVICE_PATTERNS[pattern] = provider
+    _SERVICE_PATTERN, _GROUP_PROVIDERS = _compile_service_patterns(GRPC_SERVICE_PATTERNS)
+    match_grpc_service.cache_clear()
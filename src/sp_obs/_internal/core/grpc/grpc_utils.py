@@ -5,23 +5,58 @@ These utilities handle metadata extraction and response processing
 for both sync and async gRPC client instrumentors.
 """
 
+import functools
 from typing import Any
+from weakref import WeakKeyDictionary
 
 from opentelemetry.semconv._incubating.attributes.rpc_attributes import (
     RPC_GRPC_STATUS_CODE,
     RPC_METHOD,
     RPC_SERVICE,
+    RPC_SYSTEM,
 )
 from opentelemetry.trace import Status, StatusCode
 
 
+# Instance attribute holding a gRPC span's Spinal child span
+_CHILD_SPAN_ATTRIBUTE = "_spinal_child_span"
+
+
+def _attach_child_span(span, child_span, fallback: WeakKeyDictionary) -> None:
+    """
+    Associate a Spinal child span with its parent gRPC span. The child is stored on the parent span's instance dict,
+    which is a plain dict write, and only spans without one fall back to the weak-keyed registry
+    """
+    try:
+        span.__dict__[_CHILD_SPAN_ATTRIBUTE] = child_span
+    except AttributeError:
+        fallback[span] = child_span
+
+
+def _get_child_span(span, fallback: WeakKeyDictionary):
+    """Return the Spinal child span attached to a parent gRPC span, if any"""
+    instance_dict = getattr(span, "__dict__", None)
+    if instance_dict is not None and (child_span := instance_dict.get(_CHILD_SPAN_ATTRIBUTE)) is not None:
+        return child_span
+    return fallback.get(span)
+
+
+def _detach_child_span(span, fallback: WeakKeyDictionary) -> None:
+    """Drop the association made by _attach_child_span"""
+    instance_dict = getattr(span, "__dict__", None)
+    if instance_dict is not None and instance_dict.pop(_CHILD_SPAN_ATTRIBUTE, None) is not None:
+        return
+    fallback.pop(span, None)
+
+
+# The rpc.* attributes OpenTelemetry's gRPC client sets when it starts a span, which is when request hooks run
+_COPIED_RPC_ATTRIBUTES = (RPC_SYSTEM, RPC_GRPC_STATUS_CODE, RPC_METHOD, RPC_SERVICE)
+
+
 def _extract_service_name(span) -> str | None:
     """Extract gRPC service name from span attributes"""
-    if not span or not hasattr(span, "attributes"):
-        return None
-
-    attributes = span.attributes or {}
-    return attributes.get(RPC_SERVICE)
+    attributes = getattr(span, "attributes", None)
+    return attributes.get(RPC_SERVICE) if attributes is not None else None
 
 
 def _extract_grpc_metadata(span, provider_name: str) -> dict[str, Any]:
@@ -35,28 +70,36 @@ def _extract_grpc_metadata(span, provider_name: str) -> dict[str, Any]:
     Returns:
         Dictionary of metadata attributes to set on the child span
     """
-    if not span or not hasattr(span, "attributes"):
+    attributes = getattr(span, "attributes", None) if span else None
+    if attributes is None:
         return {}
 
-    attributes = span.attributes or {}
+    # A copy, because the cached dict is shared by every call with the same service and method
+    return dict(_build_grpc_metadata(provider_name, tuple(map(attributes.get, _COPIED_RPC_ATTRIBUTES))))
+
+
+@functools.lru_cache(maxsize=512)
+def _build_grpc_metadata(provider_name: str, rpc_values: tuple) -> dict[str, Any]:
+    """
+    Build the child span metadata from the values of _COPIED_RPC_ATTRIBUTES. Calls to one RPC method carry the same
+    values, so the dict is built once per provider, service and method
+    """
+    rpc_attributes = dict(zip(_COPIED_RPC_ATTRIBUTES, rpc_values))
     metadata = {
         "spinal.provider": provider_name,  # Required for processor filtering
     }
 
     # Copy gRPC-specific metadata
-    if RPC_SERVICE in attributes:
-        metadata["grpc.service"] = attributes[RPC_SERVICE]
+    if rpc_attributes[RPC_SERVICE] is not None:
+        metadata["grpc.service"] = rpc_attributes[RPC_SERVICE]
 
-    if RPC_METHOD in attributes:
-        metadata["grpc.method"] = attributes[RPC_METHOD]
+    if rpc_attributes[RPC_METHOD] is not None:
+        metadata["grpc.method"] = rpc_attributes[RPC_METHOD]
 
-    # Add any other relevant metadata from span attributes
-    # (e.g., timeout, peer address, etc.)
-    for key, value in attributes.items():
-        if key.startswith("rpc.") or key.startswith("grpc."):
-            # Only copy metadata, skip binary data attributes
-            if isinstance(value, (str, int, float, bool)):
-                metadata[key] = value
+    for key, value in rpc_attributes.items():
+        # Only copy metadata, skip binary data attributes
+        if isinstance(value, (str, int, float, bool)):
+            metadata[key] = value
 
     return metadata
 
@@ -73,7 +116,7 @@ def _add_response_metadata(child_span, parent_span):
         child_span: The Spinal child span to add metadata to
         parent_span: The parent OpenTelemetry gRPC span
     """
-    if not parent_span or not hasattr(parent_span, "attributes"):
+    if not parent_span or not hasattr(parent_span, "attributes") or not child_span.is_recording():
         return
 
     attributes = parent_span.attributes or {}
@@ -92,16 +135,20 @@ def _add_response_metadata(child_span, parent_span):
             child_span.set_status(Status(StatusCode.ERROR, error_desc))
             child_span.set_attribute("error", True)
 
-    # Add any error messages from parent span events
-    if hasattr(parent_span, "events") and parent_span.is_recording():
-        for event in parent_span.events:
-            if event.name == "exception" and event.attributes:
-                # Record exception details from event attributes
-                exc_type = event.attributes.get("exception.type")
-                exc_message = event.attributes.get("exception.message")
-                if exc_type or exc_message:
-                    child_span.set_attribute("error", True)
-                    if exc_type:
-                        child_span.set_attribute("error.type", exc_type)
-                    if exc_message:
-                        child_span.set_attribute("error.message", exc_message)
+    # A successful call has no exception events to copy
+    if grpc_status_code == 0:
+        return
+
+    # Add any error messages from parent span events. The SDK builds a new tuple on each events access, so read it once.
+    # Events are still available once the parent span has ended, so there is no is_recording() check
+    for event in getattr(parent_span, "events", None) or ():
+        if event.name == "exception" and event.attributes:
+            # Record exception details from event attributes
+            exc_type = event.attributes.get("exception.type")
+            exc_message = event.attributes.get("exception.message")
+            if exc_type or exc_message:
+                child_span.set_attribute("error", True)
+                if exc_type:
+                    child_span.set_attribute("error.type", exc_type)
+                if exc_message:
+                    child_span.set_attribute("error.message", exc_message)
@@ -0,0 +1,105 @@
+import logging
+
+import httpx
+from httpx import AsyncByteStream, SyncByteStream
+from opentelemetry import trace
+from opentelemetry.context import Context
+from opentelemetry.trace import Tracer, Status, StatusCode
+
+from sp_obs.utils import body_attribute, extend_body_buffer
+
+logger = logging.getLogger(__name__)
+
+
+class BaseStreamWrapper:
+    """
+    Response body capture shared by the sync and async stream wrappers. Subclasses only differ in how they iterate
+    the wrapped stream and in the name of the span they record
+    """
+
+    _span_name: str
+
+    def __init__(
+        self,
+        response: httpx.Response,
+        wrapped_stream: SyncByteStream | AsyncByteStream,
+        tracer: Tracer,
+        parent_context: Context,
+        parent_attributes: dict[str, str],
+        max_body_bytes: int = 0,
+        capture_body: bool = True,
+    ):
+        self._response = response
+        self._stream = wrapped_stream
+        self._tracer = tracer
+        self._parent_context = parent_context
+        self._parent_attributes = parent_attributes
+        # The response span covers the whole request, so it starts when the httpx span did. Read once here, as the
+        # parent is known as soon as the response arrives
+        self._parent_start_time = getattr(trace.get_current_span(parent_context), "start_time", None)
+        # Chunks are appended to one buffer rather than kept as separate bytes objects to be joined at the end
+        self._buffer = bytearray()
+        self._max_body_bytes = max_body_bytes
+        self._capture_body = capture_body
+        self._body_length = 0
+
+    def _capture_chunk(self, chunk: bytes) -> None:
+        self._body_length += len(chunk)
+        if self._capture_body:
+            extend_body_buffer(self._buffer, chunk, self._max_body_bytes)
+
+    def _process_complete(self):
+        """
+        Process the saved chunks and attach information to the span that will be sent to Spinal
+        """
+        if not self._buffer and not self._body_length:
+            return
+
+        try:
+            with self._tracer.start_as_current_span(
+                self._span_name,
+                context=self._parent_context,
+                attributes=self._build_attributes(),
+                start_time=self._parent_start_time,
+            ) as span:
+                span.set_status(Status(StatusCode.OK))
+
+        except Exception as e:
+            logger.error(f"Spinal error processing response: {e}")
+
+    def _build_attributes(self) -> dict:
+        """
+        Attributes are gathered first and passed as the span starts, so they are set in one go rather than taking the
+        span lock once per set_attribute. The parent attributes already carry http.host, set by the instrumentor when
+        it matched the provider, and the redacted http.url of the httpx span
+        """
+        headers = self._response.headers
+        request = self._response.request
+        attributes = dict(self._parent_attributes)
+        attributes["http.status_code"] = self._response.status_code
+
+        # Absent headers are left out rather than recorded as empty strings, which the exporter treats the same
+        if content_type := headers.get("content-type"):
+            attributes["content-type"] = content_type
+        if content_encoding := headers.get("content-encoding"):
+            attributes["content-encoding"] = content_encoding
+
+        # The body httpx already read is read directly, as the content property would raise for a request whose stream
+        # was never read. Multipart uploads are left out
+        request_content = getattr(request, "_content", None)
+        if request_content is None:
+            attributes["spinal.request.content_type"] = "streaming"
+        elif not isinstance(getattr(request, "stream", None), httpx._multipart.MultipartStream):
+            attributes["spinal.request.binary_data"] = body_attribute(request_content)
+
+        # The buffer is complete by now, so it is viewed rather than copied out
+        if self._capture_body:
+            attributes["spinal.response.binary_data"] = body_attribute(self._buffer)
+            if self._body_length > len(self._buffer):
+                attributes["spinal.response.truncated"] = True
+                attributes["spinal.response.original_length"] = self._body_length
+        else:
+            # Bodies are not kept, so only their size is recorded
+            attributes["spinal.response.size"] = self._body_length
+
+        return attributes
@@ -1,5 +1,4 @@
 import typing
-from urllib.parse import urlparse
 
 import httpx
 import opentelemetry.instrumentation.httpx
@@ -9,18 +8,20 @@ from httpx import AsyncByteStream, SyncByteStream
 from opentelemetry import context, trace
 from opentelemetry.semconv.trace import SpanAttributes
 from opentelemetry.trace import get_tracer
-from opentelemetry.util.http import redact_url
 
 from sp_obs._internal.core.httpx.async_stream import AsyncStreamWrapper
 from sp_obs._internal.core.httpx.sync_stream import SyncStreamWrapper
-from sp_obs._internal.core.recognised_integrations import supported_host
-from sp_obs.utils import add_request_params_to_span
+from sp_obs._internal.core.recognised_integrations import supported_host, url_hostname
+from sp_obs.utils import add_request_params_to_span, redact_request_url
 
 
 class SpinalHTTPXClientInstrumentor(opentelemetry.instrumentation.httpx.HTTPXClientInstrumentor):
     def _instrument(self, **kwargs):
         provider = kwargs.get("tracer_provider")
         tracer = get_tracer(__name__, tracer_provider=provider)
+        # Set by SpinalSDK from SpinalConfig.max_body_bytes and capture_body. 0 keeps whole bodies
+        max_body_bytes = kwargs.get("max_body_bytes", 0)
+        capture_body = kwargs.get("capture_body", True)
         super()._instrument(**kwargs)
 
         original_extract_response = opentelemetry.instrumentation.httpx._extract_response
@@ -35,21 +36,24 @@ class SpinalHTTPXClientInstrumentor(opentelemetry.instrumentation.httpx.HTTPXCli
             current_tracing_context = context.get_current()
             result = original_extract_response(response)
 
-            # Check to see if we have support for this type of span
+            # Check to see if we have support for this type of span. A response span under an httpx span that is not
+            # recording would not be exported either, so the body is not buffered for it
             httpx_span = trace.get_current_span(current_tracing_context)
-            httpx_attributes = getattr(httpx_span, "attributes", {}) if httpx_span else {}
+            httpx_attributes = getattr(httpx_span, "attributes", {}) if httpx_span.is_recording() else {}
             if httpx_attributes:
+                # Most httpx traffic in a service is not to a provider, so the host is checked before the URL is
+                # redacted and parsed
                 url = httpx_attributes.get(SpanAttributes.HTTP_URL)
-                redacted_url = redact_url(url)
-
-                location = urlparse(redacted_url)
-                integration_provider = supported_host(location.hostname)
+                hostname = url_hostname(url) if url else None
+                integration_provider = supported_host(hostname) if hostname else None
                 if not integration_provider:
                     return result
 
+                redacted_url = redact_request_url(url)
+
                 # Set parent span attributes which will be loaded into children upon creation
                 httpx_span.set_attribute("spinal.provider", integration_provider)
-                httpx_span.set_attribute("http.host", location.hostname)
+                httpx_span.set_attribute("http.host", hostname)
                 httpx_span.set_attribute(AISpanAttributes.LLM_SYSTEM, integration_provider)
                 add_request_params_to_span(httpx_span, redacted_url)
 
@@ -64,6 +68,8 @@ class SpinalHTTPXClientInstrumentor(opentelemetry.instrumentation.httpx.HTTPXCli
                     tracer=tracer,
                     parent_context=current_tracing_context,
                     parent_attributes=httpx_attributes,
+                    max_body_bytes=max_body_bytes,
+                    capture_body=capture_body,
                 )
             elif isinstance(stream, SyncByteStream):
                 wrapped_stream = SyncStreamWrapper(
@@ -72,6 +78,8 @@ class SpinalHTTPXClientInstrumentor(opentelemetry.instrumentation.httpx.HTTPXCli
                     tracer=tracer,
                     parent_context=current_tracing_context,
                     parent_attributes=httpx_attributes,
+                    max_body_bytes=max_body_bytes,
+                    capture_body=capture_body,
                 )
             else:
                 wrapped_stream = stream
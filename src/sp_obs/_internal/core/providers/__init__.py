@@ -1,44 +1,48 @@
+import importlib
+
 from sp_obs._internal.core.providers.base import BaseProvider
-from sp_obs._internal.core.providers.mistral import MistralProvider
-from sp_obs._internal.core.providers.openai import OpenAIProvider
-from sp_obs._internal.core.providers.anthropic import AnthropicProvider
-from sp_obs._internal.core.providers.firecrawl import FirecrawlProvider
-from sp_obs._internal.core.providers.scrapingbee import ScrapingBeeProvider
-from sp_obs._internal.core.providers.serpapi import SerpapiProvider
-from sp_obs._internal.core.providers.elevenlabs import ElevenLabsProvider
-from sp_obs._internal.core.providers.deepgram import DeepgramProvider
-from sp_obs._internal.core.providers.perplexity import PerplexityProvider
-from sp_obs._internal.core.providers.vertexai import VertexAIProvider
-from sp_obs._internal.core.providers.voyageai import VoyageAIProvider
+
+# Provider name -> "module:Class". Provider modules are imported the first time a span from that provider is exported,
+# so an application only loads the parsers for the providers it actually calls
+_PROVIDERS = {
+    "openai": "sp_obs._internal.core.providers.openai:OpenAIProvider",
+    "anthropic": "sp_obs._internal.core.providers.anthropic:AnthropicProvider",
+    "firecrawl": "sp_obs._internal.core.providers.firecrawl:FirecrawlProvider",
+    "scrapingbee": "sp_obs._internal.core.providers.scrapingbee:ScrapingBeeProvider",
+    "serpapi": "sp_obs._internal.core.providers.serpapi:SerpapiProvider",
+    "elevenlabs": "sp_obs._internal.core.providers.elevenlabs:ElevenLabsProvider",
+    "deepgram": "sp_obs._internal.core.providers.deepgram:DeepgramProvider",
+    "perplexity": "sp_obs._internal.core.providers.perplexity:PerplexityProvider",
+    "mistral": "sp_obs._internal.core.providers.mistral:MistralProvider",
+    "vertexai": "sp_obs._internal.core.providers.vertexai:VertexAIProvider",
+    "voyageai": "sp_obs._internal.core.providers.voyageai:VoyageAIProvider",
+}
+
+_PROVIDER_CLASSES = {path.partition(":")[2]: path for path in _PROVIDERS.values()}
 
 _provider_cache = {}
 
 
+def _load_provider_class(path: str) -> type[BaseProvider]:
+    module_name, _, class_name = path.partition(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def __getattr__(name: str):
+    """Provider classes stay importable from this package without importing every provider up front"""
+    if path := _PROVIDER_CLASSES.get(name):
+        return _load_provider_class(path)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def get_provider(provider_name: str) -> BaseProvider:
-    if provider_name not in _provider_cache:
-        if provider_name == "openai":
-            _provider_cache[provider_name] = OpenAIProvider()
-        elif provider_name == "anthropic":
-            _provider_cache[provider_name] = AnthropicProvider()
-        elif provider_name == "firecrawl":
-            _provider_cache[provider_name] = FirecrawlProvider()
-        elif provider_name == "scrapingbee":
-            _provider_cache[provider_name] = ScrapingBeeProvider()
-        elif provider_name == "serpapi":
-            _provider_cache[provider_name] = SerpapiProvider()
-        elif provider_name == "elevenlabs":
-            _provider_cache[provider_name] = ElevenLabsProvider()
-        elif provider_name == "deepgram":
-            _provider_cache[provider_name] = DeepgramProvider()
-        elif provider_name == "perplexity":
-            _provider_cache[provider_name] = PerplexityProvider()
-        elif provider_name == "mistral":
-            _provider_cache[provider_name] = MistralProvider()
-        elif provider_name == "vertexai":
-            _provider_cache[provider_name] = VertexAIProvider()
-        elif provider_name == "voyageai":
-            _provider_cache[provider_name] = VoyageAIProvider()
-        else:
-            raise ValueError(f"Invalid provider name: {provider_name}")
-
-    return _provider_cache[provider_name]
+    provider = _provider_cache.get(provider_name)
+    if provider is not None:
+        return provider
+
+    path = _PROVIDERS.get(provider_name)
+    if path is None:
+        raise ValueError(f"Invalid provider name: {provider_name}")
+
+    provider = _provider_cache[provider_name] = _load_provider_class(path)()
+    return provider
@@ -14,33 +14,10 @@ class AnthropicProvider(BaseProvider):
         response_attributes.pop("content", None)
         return response_attributes
 
-    def handle_event_stream(self, event_stream: str) -> dict[str, Any]:
+    def handle_event_stream(self, event_stream: bytes) -> dict[str, Any]:
         """
         Parse Anthropic Server-Sent Events format and extract the complete message.
         """
-        lines = event_stream.strip().split("\n")
-        events = []
-        current_event = {}
-
-        # Parse SSE lines into events
-        for line in lines:
-            if line.startswith("event:"):
-                if current_event:
-                    events.append(current_event)
-                current_event = {"event": line[6:].strip()}
-            elif line.startswith("data:"):
-                data_str = line[5:].strip()
-                try:
-                    current_event["data"] = orjson.loads(data_str)
-                except:  # noqa: E722
-                    current_event["data"] = data_str
-            elif line == "" and current_event:
-                events.append(current_event)
-                current_event = {}
-
-        if current_event:
-            events.append(current_event)
-
         # Initialize response structure
         response = {
             "id": None,
@@ -53,15 +30,29 @@ class AnthropicProvider(BaseProvider):
             "usage": {},
         }
 
-        # Track content blocks
+        # Track content blocks. Text deltas are collected per block and joined once at the end, since repeated += on a
+        # string held in a dict copies the whole text so far on every delta
         content_blocks = {}
 
-        # Process events
-        for event in events:
-            event_type = event.get("event")
-            data = event.get("data", {})
+        # Anthropic sends one data line per event, and every payload repeats the event name as its type. So the
+        # stream is split on data lines alone and each event is dispatched on its payload's type, without reading the
+        # event and blank lines in between. JSON escapes newlines inside strings, so a split can only land on a line
+        for event_data in (b"\n" + event_stream).split(b"\ndata:")[1:]:
+            try:
+                data = orjson.loads(event_data.partition(b"\n")[0])
+            except orjson.JSONDecodeError:
+                continue
+
+            event_type = data.get("type")
+            if event_type == "content_block_delta":
+                index = data.get("index", 0)
+                delta = data.get("delta", {})
+                if delta.get("type") == "text_delta":
+                    if index not in content_blocks:
+                        content_blocks[index] = {"type": "text", "parts": []}
+                    content_blocks[index]["parts"].append(delta.get("text", ""))
 
-            if event_type == "message_start":
+            elif event_type == "message_start":
                 message = data.get("message", {})
                 response["id"] = message.get("id")
                 response["model"] = message.get("model")
@@ -73,17 +64,9 @@ class AnthropicProvider(BaseProvider):
                 content_block = data.get("content_block", {})
                 content_blocks[index] = {
                     "type": content_block.get("type", "text"),
-                    "text": content_block.get("text", ""),
+                    "parts": [content_block.get("text", "")],
                 }
 
-            elif event_type == "content_block_delta":
-                index = data.get("index", 0)
-                delta = data.get("delta", {})
-                if delta.get("type") == "text_delta":
-                    if index not in content_blocks:
-                        content_blocks[index] = {"type": "text", "text": ""}
-                    content_blocks[index]["text"] += delta.get("text", "")
-
             elif event_type == "message_delta":
                 delta = data.get("delta", {})
                 if "stop_reason" in delta:
@@ -98,6 +81,6 @@ class AnthropicProvider(BaseProvider):
         # Build content array from content blocks
         for index in sorted(content_blocks.keys()):
             block = content_blocks[index]
-            response["content"].append({"type": block["type"], "text": block["text"]})
+            response["content"].append({"type": block["type"], "text": "".join(block["parts"])})
 
         return response
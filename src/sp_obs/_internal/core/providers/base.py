@@ -3,7 +3,7 @@ from typing import Any
 
 
 class BaseProvider(metaclass=ABCMeta):
-    def handle_event_stream(self, event_stream: str) -> dict[str, Any]:
+    def handle_event_stream(self, event_stream: bytes) -> dict[str, Any]:
         raise NotImplementedError
 
     @abstractmethod
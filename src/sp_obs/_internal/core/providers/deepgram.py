@@ -6,16 +6,19 @@ from sp_obs._internal.core.providers import BaseProvider
 class DeepgramProvider(BaseProvider):
     """Provider for Deepgram API"""
 
+    # Metadata fields that carry duration and the cost of the optional intelligence features, kept when present
+    _METADATA_FIELDS = ("duration", "summary_info", "sentiment_info", "topics_info", "intents_info")
+    # The transcript and the full metadata object are removed to avoid storing sensitive/unnecessary fields
+    _DROPPED_FIELDS = ("metadata", "results")
+
     def parse_response_attributes(self, response_attributes: dict[str, Any]) -> dict[str, Any]:
         """Parse response attributes to extract timing information for speech to text"""
 
-        # can pop results as duration is provided in metadata
-
-        # keep only valuable field from metadata if they exist , then delkete the metadata field
+        # keep only valuable field from metadata if they exist, then delete the metadata field
         if metadata := response_attributes.get("metadata"):
-            # Extract duration
-            if duration := metadata.get("duration"):
-                response_attributes["duration"] = duration
+            for field in self._METADATA_FIELDS:
+                if value := metadata.get(field):
+                    response_attributes[field] = value
 
             # Extract model name and architecture from model_info if its given
             if model_info := metadata.get("model_info"):
@@ -32,21 +35,7 @@ class DeepgramProvider(BaseProvider):
                         response_attributes["model_name"] = full_model_name
                         break
 
-            # Extract additional cost information if they exist
-            if summary_info := metadata.get("summary_info"):
-                response_attributes["summary_info"] = summary_info
-
-            if sentiment_info := metadata.get("sentiment_info"):
-                response_attributes["sentiment_info"] = sentiment_info
-
-            if topics_info := metadata.get("topics_info"):
-                response_attributes["topics_info"] = topics_info
-
-            if intents_info := metadata.get("intents_info"):
-                response_attributes["intents_info"] = intents_info
-
-        # remove full metadata object to avoid storing sensitive/unnecessary fields
-        response_attributes.pop("metadata", None)
-        response_attributes.pop("results", None)
+        for field in self._DROPPED_FIELDS:
+            response_attributes.pop(field, None)
 
         return response_attributes
@@ -6,6 +6,9 @@ from sp_obs._internal.core.providers import BaseProvider
 class ElevenLabsProvider(BaseProvider):
     """Provider for ElevenLabs API for text-to-speech and speech-to-text end points"""
 
+    # The transcript, dropped once the last word's timestamp has been read
+    _DROPPED_RESPONSE_FIELDS = ("words", "text")
+
     def parse_response_attributes(self, response_attributes: dict[str, Any]) -> dict[str, Any]:
         """Parse response attributes to extract timing information for speech to text"""
 
@@ -18,7 +21,7 @@ class ElevenLabsProvider(BaseProvider):
                 pass
 
         # Remove the words field after processing
-        response_attributes.pop("words", None)
-        response_attributes.pop("text", None)
+        for field in self._DROPPED_RESPONSE_FIELDS:
+            response_attributes.pop(field, None)
 
         return response_attributes
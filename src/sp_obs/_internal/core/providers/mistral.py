@@ -5,16 +5,20 @@ from sp_obs._internal.core.providers import BaseProvider
 class MistralProvider(BaseProvider):
     """Provider for Mistal API"""
 
+    # OCR document and chat completion content
+    _DROPPED_REQUEST_FIELDS = ("document", "messages", "response_format")
+    # OCR pages and chat completion choices
+    _DROPPED_RESPONSE_FIELDS = ("pages", "choices")
+
     def parse_request_attributes(self, request_attributes: dict[str, Any]) -> dict[str, Any]:
-        request_attributes.pop("document", None)  # For OCR content
-        request_attributes.pop("messages", None)  # For chat completion
-        request_attributes.pop("response_format", None)  # For chat completion
+        for field in self._DROPPED_REQUEST_FIELDS:
+            request_attributes.pop(field, None)
         return request_attributes
 
     def parse_response_attributes(self, response_attributes: dict[str, Any]) -> dict[str, Any]:
         """
         We only really care about the usage and model fields.
         """
-        response_attributes.pop("pages", None)  # For OCR content
-        response_attributes.pop("choices", None)  # For chat completion
+        for field in self._DROPPED_RESPONSE_FIELDS:
+            response_attributes.pop(field, None)
         return response_attributes
@@ -4,6 +4,11 @@ from orjson import orjson
 from sp_obs._internal.core.providers.base import BaseProvider
 
 
+# The only stream events the exporter reads
+_HANDLED_EVENTS = frozenset({b"response.completed", b"response.output_item.done"})
+_COMPLETED_EVENT = b"\nevent: response.completed\n"
+
+
 class OpenAIProvider(BaseProvider):
     """Provider for OpenAI API"""
 
@@ -14,50 +19,59 @@ class OpenAIProvider(BaseProvider):
         # remove the 'choices' field. Contains output from model
         response_attributes.pop("choices", None)
 
-        for output in response_attributes.get("output", []):
-            content = output.get("content", {})
-            for c in content:
-                c.pop("text", None)
-            output.pop("result", None)  # handles images
+        # Outputs and their content are stripped in place, and skipped when absent rather than iterating a fallback
+        if outputs := response_attributes.get("output"):
+            for output in outputs:
+                if content := output.get("content"):
+                    for c in content:
+                        c.pop("text", None)
+                output.pop("result", None)  # handles images
         return response_attributes
 
-    def handle_event_stream(self, event_stream: str) -> dict[str, Any]:
+    def handle_event_stream(self, event_stream: bytes) -> dict[str, Any]:
         """
         Parse Server-Sent Events format and extract the final response.
         """
-        lines = event_stream.strip().split("\n")
-        events = []
-        current_event = {}
-
-        for line in lines:
-            if line.startswith("event:"):
-                if current_event:
-                    events.append(current_event)
-                current_event = {"event": line[6:].strip()}
-            elif line.startswith("data:"):
-                data_str = line[5:].strip()
+        # The completed response is the last event of a finished stream and holds everything the exporter needs, so it
+        # is looked for from the end first and only its data line is parsed
+        completed = event_stream.rfind(_COMPLETED_EVENT)
+        if completed == -1 and event_stream.startswith(_COMPLETED_EVENT[1:]):
+            completed = 0
+        if completed != -1:
+            data_start = event_stream.find(b"data:", completed)
+            if data_start != -1:
+                data_end = event_stream.find(b"\n", data_start)
                 try:
-                    current_event["data"] = orjson.loads(data_str)
-                except:  # noqa: E722
-                    current_event["data"] = data_str
-            elif line == "" and current_event:
-                events.append(current_event)
-                current_event = {}
-
-        if current_event:
-            events.append(current_event)
-
-        # Find the completed response
-        for event in reversed(events):
-            if event.get("event") == "response.completed" and isinstance(event.get("data"), dict):
-                return event["data"].get("response", {})
-
-        # If no completed response, try to reconstruct from output items
-        response_attributes = {"output": []}
-
-        for event in events:
-            if event.get("event") == "response.output_item.done" and isinstance(event.get("data"), dict):
-                item = event["data"].get("item")
-                if item:
-                    response_attributes["output"].append(item)
-        return response_attributes
+                    data = orjson.loads(event_stream[data_start + 5 : data_end if data_end != -1 else None])
+                except orjson.JSONDecodeError:
+                    data = None
+
+                if isinstance(data, dict):
+                    return data.get("response", {})
+
+        # Otherwise events are handled in one pass as their data line is read, rather than first collecting every event.
+        # Only the completed response and finished output items are used, so the other payloads (mostly text deltas)
+        # are never parsed, and the stream is left as soon as the completed response is found
+        output = []
+        event_type = None
+        for line in event_stream.split(b"\n"):
+            if line.startswith(b"data:"):
+                if event_type in _HANDLED_EVENTS:
+                    try:
+                        data = orjson.loads(line[5:])
+                    except orjson.JSONDecodeError:
+                        data = None
+
+                    if isinstance(data, dict):
+                        if event_type == b"response.completed":
+                            return data.get("response", {})
+                        if item := data.get("item"):
+                            output.append(item)
+
+                event_type = None
+
+            elif line.startswith(b"event:"):
+                event_type = line[6:].strip()
+
+        # If no completed response, reconstruct it from the output items
+        return {"output": output}
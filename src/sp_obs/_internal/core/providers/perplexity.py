@@ -13,19 +13,31 @@ class PerplexityProvider(BaseProvider):
 
         return final_response_attributes
 
-    def handle_event_stream(self, event_stream: str) -> dict[str, Any]:
+    def handle_event_stream(self, event_stream: bytes) -> dict[str, Any]:
         """
         Parse Server-Sent Events format and extract the final response.
         """
+        # Every chunk repeats the model and the usage so far, so the last one normally holds the final values. It is
+        # parsed on its own first, and the stream is only read in full when it lacks them
+        payload = _last_data_payload(event_stream)
+        if payload:
+            try:
+                obj = orjson.loads(payload)
+            except orjson.JSONDecodeError:
+                obj = None
+
+            if isinstance(obj, dict) and obj.get("usage") and obj.get("model"):
+                return {"usage": obj["usage"], "model": obj["model"]}
+
         usage = None
         model = None
-        lines = event_stream.split("\n")
+        lines = event_stream.split(b"\n")
 
         for line in lines:
-            if not line or not line.startswith("data:"):
+            if not line or not line.startswith(b"data:"):
                 continue
             data = line[5:].strip()  # Remove "data: " prefix
-            if data == "[DONE]":
+            if data == b"[DONE]":
                 break
 
             obj = orjson.loads(data)
@@ -40,3 +52,19 @@ class PerplexityProvider(BaseProvider):
         }
 
         return final_response_attributes
+
+
+def _last_data_payload(event_stream: bytes) -> bytes | None:
+    """Return the payload of the last data line before the [DONE] marker, if there is one"""
+    end = len(event_stream)
+    while (start := event_stream.rfind(b"data:", 0, end)) != -1:
+        end = start
+        # Skip matches that are not at the start of a line, such as "data:" inside a JSON string
+        if start and event_stream[start - 1] != ord("\n"):
+            continue
+
+        line_end = event_stream.find(b"\n", start)
+        payload = event_stream[start + 5 : line_end if line_end != -1 else None].strip()
+        if payload != b"[DONE]":
+            return payload
+    return None
@@ -9,13 +9,16 @@ logger = logging.getLogger(__name__)
 class VertexAIProvider(BaseProvider):
     """Provider for GCP Vertex AI API"""
 
+    # Mistral OCR document and chat completion content
+    _DROPPED_REQUEST_FIELDS = ("document", "messages", "response_format")
+    _DROPPED_RESPONSE_FIELDS = ("candidates", "candidatesTokensDetails")
+
     def parse_request_attributes(self, request_attributes: dict[str, Any]) -> dict[str, Any]:
-        request_attributes.pop("document", None)  # For Mistral OCR content
-        request_attributes.pop("messages", None)  # For Mistral chat completion
-        request_attributes.pop("response_format", None)  # For Mistral chat completion
+        for field in self._DROPPED_REQUEST_FIELDS:
+            request_attributes.pop(field, None)
         return request_attributes
 
     def parse_response_attributes(self, response_attributes: dict[str, Any]) -> dict[str, Any]:
-        response_attributes.pop("candidates", None)
-        response_attributes.pop("candidatesTokensDetails", None)
+        for field in self._DROPPED_RESPONSE_FIELDS:
+            response_attributes.pop(field, None)
         return response_attributes
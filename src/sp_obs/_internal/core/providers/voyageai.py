@@ -6,7 +6,10 @@ from sp_obs._internal.core.providers import BaseProvider
 class VoyageAIProvider(BaseProvider):
     """Provider for Voyage AI API"""
 
+    # Returned data from embeddings and reranking, and the object type
+    _DROPPED_RESPONSE_FIELDS = ("data", "object")
+
     def parse_response_attributes(self, response_attributes: dict[str, Any]) -> dict[str, Any]:
-        response_attributes.pop("data", None)  # returned data from embeddings and reranking
-        response_attributes.pop("object", None)  # object type
+        for field in self._DROPPED_RESPONSE_FIELDS:
+            response_attributes.pop(field, None)
         return response_attributes
@@ -1,3 +1,5 @@
+import functools
+
 GEN_AI_INTEGRATION = {
     "api.openai.com": "openai",
     "api.anthropic.com": "anthropic",
@@ -16,12 +18,43 @@ TOOLS_INTEGRATION = {
 
 INTEGRATIONS = GEN_AI_INTEGRATION | TOOLS_INTEGRATION
 
+# Lower-cased response headers read by a provider's parse_response_headers. The exporter drops every other
+# spinal.http.response.header.* attribute, so instrumentation does not need to record them
+CAPTURED_RESPONSE_HEADERS = frozenset({"spb-cost"})
+
+_VERTEX_SUFFIX = "aiplatform.googleapis.com"
+
 
+# Services call the same few hosts over and over, and most of them are not providers, so the lookup is cached per
+# hostname rather than repeating the suffix check for every request to an unsupported host
+@functools.lru_cache(maxsize=1024)
 def supported_host(hostname: str) -> str | None:
     if standard_host := INTEGRATIONS.get(hostname):
         return standard_host
 
-    if hostname.find("aiplatform.googleapis.com") != -1:
+    # Vertex AI is served from aiplatform.googleapis.com and its regional variants such as
+    # us-central1-aiplatform.googleapis.com, so only the end of the hostname is compared
+    if hostname.endswith(_VERTEX_SUFFIX):
         return "vertexai"
 
     return None
+
+
+def url_hostname(url: str) -> str:
+    """
+    Lower-cased hostname of an absolute URL, without userinfo or port. The host is sliced straight out of the string,
+    so instrumentation can rule out unsupported hosts before paying for a full parse and redaction of the URL
+    """
+    start = url.find("://")
+    start = start + 3 if start != -1 else 0
+    end = len(url)
+    for delimiter in "/?#":
+        index = url.find(delimiter, start, end)
+        if index != -1:
+            end = index
+
+    host = url[start:end].rpartition("@")[2]
+    if host.startswith("["):
+        # IPv6 literal, whose colons are not a port separator
+        return host[1 : host.find("]")].lower()
+    return host.partition(":")[0].lower()
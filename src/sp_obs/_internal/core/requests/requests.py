@@ -1,19 +1,53 @@
-import io
+import weakref
 from functools import wraps
-from urllib.parse import urlparse
 import opentelemetry.instrumentation.requests
 from opentelemetry.trace import Status, StatusCode, get_tracer
-from opentelemetry.util.http import redact_url
 from requests import PreparedRequest, Session
 
-from sp_obs._internal.core.recognised_integrations import supported_host
-from sp_obs.utils import add_request_params_to_span
+from sp_obs._internal.core.recognised_integrations import CAPTURED_RESPONSE_HEADERS, supported_host, url_hostname
+from sp_obs.utils import (
+    add_request_params_to_span,
+    body_attribute,
+    extend_body_buffer,
+    record_span_exception,
+    redact_request_url,
+)
+
+
+def _end_streaming_span(response) -> None:
+    """
+    End the span of a streaming response. Called both when the body has been read and when the response is closed.
+    The span is ended through its finalizer, which only ever runs once
+    """
+    finalizer = response.__dict__.pop("_spinal_span_finalizer", None)
+    if finalizer is not None:
+        finalizer()
 
 
 class SpinalRequestsInstrumentor(opentelemetry.instrumentation.requests.RequestsInstrumentor):
     def _instrument(self, **kwargs):
         provider = kwargs.get("tracer_provider")
         tracer = get_tracer(__name__, tracer_provider=provider)
+        # Set by SpinalSDK from SpinalConfig.max_body_bytes, capture_body and record_exceptions. 0 keeps whole bodies
+        max_body_bytes = kwargs.get("max_body_bytes", 0)
+        capture_body = kwargs.get("capture_body", True)
+        record_exceptions = kwargs.get("record_exceptions", True)
+
+        def record_response_body(span, body: bytes | bytearray, length: int) -> None:
+            """
+            Record a response body holding at most max_body_bytes of a body that was length bytes long. A cut body is
+            marked as truncated with its original length, as the httpx and aiohttp instrumentors do. With capture_body
+            off only the length is recorded
+            """
+            attributes = {"spinal.response.size": length}
+            if not capture_body:
+                span.set_attributes(attributes)
+                return
+            attributes["spinal.response.binary_data"] = body_attribute(body)
+            if length > len(body):
+                attributes["spinal.response.truncated"] = True
+                attributes["spinal.response.original_length"] = length
+            span.set_attributes(attributes)
 
         def wrap_raw_stream(response, span):
             """Wrap the raw response stream for direct raw access"""
@@ -22,24 +56,31 @@ class SpinalRequestsInstrumentor(opentelemetry.instrumentation.requests.Requests
             class CapturingRaw:
                 def __init__(self, raw):
                     self._raw = raw
-                    self._captured_data = io.BytesIO()
+                    # Reads are appended to one buffer, up to max_body_bytes, while the whole length is counted
+                    self._captured_data = bytearray()
+                    self._captured_length = 0
 
                 def read(self, amt=None):
                     data = self._raw.read(amt)
                     if data:
-                        self._captured_data.write(data)
-                        if not hasattr(response, "_captured_chunks"):
-                            response._captured_chunks = []
-                        response._captured_chunks.append(data)
-                    else:
-                        # EOF reached - update span with captured content
-                        response._captured_content = self._captured_data.getvalue()
+                        self._captured_length += len(data)
+                        if capture_body:
+                            extend_body_buffer(self._captured_data, data, max_body_bytes)
+                    elif not response._capture_completed:
+                        # EOF reached - update span with the captured content. Later reads at EOF leave it alone
                         response._capture_completed = True
-                        # Update span with the captured data
-                        span.set_attribute("spinal.response.binary_data", memoryview(response._captured_content))
-                        span.set_attribute("spinal.response.size", len(response._captured_content))
+                        record_response_body(span, self._captured_data, self._captured_length)
+                        self._captured_data = bytearray()
                     return data
 
+                def close(self):
+                    # Response.close closes the raw stream when the body was not read in full, so the span ends when
+                    # the response is released rather than waiting for the body to be read
+                    try:
+                        return self._raw.close()
+                    finally:
+                        _end_streaming_span(response)
+
                 def __getattr__(self, name):
                     return getattr(self._raw, name)
 
@@ -51,109 +92,109 @@ class SpinalRequestsInstrumentor(opentelemetry.instrumentation.requests.Requests
             # Store original methods
             original_iter_content = response.iter_content
 
-            # Initialize capture storage
-            response._captured_chunks = []
+            # A response that is never read in full nor closed still ends its span once it is garbage collected, so
+            # its usage is not lost
+            response._spinal_span_finalizer = weakref.finalize(response, span.end)
+            # Initialize capture storage. Chunks are appended to one buffer rather than kept as separate bytes
+            # objects to be joined at the end, up to max_body_bytes, while the whole length is counted
+            response._captured_buffer = bytearray()
+            response._captured_length = 0
             response._capture_completed = False
 
             @wraps(original_iter_content)
             def wrapped_iter_content(chunk_size=1, decode_unicode=False):
                 """Wrapped iter_content that captures chunks"""
                 for chunk in original_iter_content(chunk_size, decode_unicode):
-                    response._captured_chunks.append(chunk)
+                    data = chunk.encode() if isinstance(chunk, str) else chunk
+                    response._captured_length += len(data)
+                    if capture_body:
+                        extend_body_buffer(response._captured_buffer, data, max_body_bytes)
                     yield chunk
 
-                response._captured_content = b"".join(response._captured_chunks)
                 response._capture_completed = True
-                response._captured_chunks = []
-
-                span.set_attribute("spinal.response.binary_data", memoryview(response._captured_content))
-                span.set_attribute("spinal.response.size", len(response._captured_content))
+                record_response_body(span, response._captured_buffer, response._captured_length)
+                response._captured_buffer = bytearray()
                 span.set_attribute("spinal.response.capture_method", "iter_content")
                 # End the span now that we have the complete response
-                span.end()
+                _end_streaming_span(response)
 
             # Wrap raw access too
-            if hasattr(response, "raw") and response.raw:
+            if getattr(response, "raw", None):
                 wrap_raw_stream(response, span)
             response.iter_content = wrapped_iter_content
 
-            # Also wrap the content property for mixed access patterns
-            original_content_property = response.__class__.content.fget
-
-            def content_getter(self):
-                content = original_content_property(self)
-                if not span.is_recording():
-                    return content
-
-                span.set_attribute("spinal.response.binary_data", memoryview(content))
-                span.set_attribute("spinal.response.size", len(content))
-                span.set_attribute("spinal.response.capture_method", "content_property")
-                return content
-
-            # Create a new property descriptor for this specific response instance
-            response.__class__.content = property(content_getter)
+            # Response.content reads the body through self.iter_content, which is the wrapper above, so content
+            # access is captured as well without patching the content property of the Response class
 
         def wrap_session_send(original_send):
             @wraps(original_send)
             def wrapped_send(self, request: PreparedRequest, **kwargs):
-                redacted_url = redact_url(request.url)
-                url = urlparse(redacted_url)
+                # Requests to hosts that are not a provider are sent as they are, without a span or capturing their
+                # body. The host is checked before the URL is redacted and parsed
+                hostname = url_hostname(request.url) if request.url else None
+                integration_provider = supported_host(hostname) if hostname else None
+                if not integration_provider:
+                    return original_send(self, request, **kwargs)
+
+                redacted_url = redact_request_url(request.url)
 
                 span = tracer.start_span(
                     "spinal.requests",
-                    attributes={"http.url": redacted_url, "spinal.provider": supported_host(url.hostname)},
+                    attributes={"http.url": redacted_url, "spinal.provider": integration_provider},
                 )
                 span.__enter__()  # Manually enter the span context
                 try:
                     response = original_send(self, request, **kwargs)
                     headers = response.headers
-                    content_type = headers.get("content-type", "")
-                    encoding = headers.get("content-encoding", "")
-
-                    # Save response headers
-                    for headers, values in headers.items():
-                        span.set_attribute(f"spinal.http.response.header.{headers}", values)
-
-                    span.set_attribute("content-type", content_type)
-                    span.set_attribute("content-encoding", encoding)
-                    span.set_attribute("http.status_code", response.status_code)
-                    span.set_attribute("http.url", redacted_url)
-                    span.set_attribute("http.host", url.hostname)
+
+                    # Only the response headers a provider reads are recorded, as the exporter drops the rest. The
+                    # attributes are set in one call rather than taking the span lock once per set_attribute
+                    attributes = {
+                        f"spinal.http.response.header.{name}": value
+                        for name, value in headers.items()
+                        if name.lower() in CAPTURED_RESPONSE_HEADERS
+                    }
+                    attributes["content-type"] = headers.get("content-type", "")
+                    attributes["content-encoding"] = headers.get("content-encoding", "")
+                    attributes["http.status_code"] = response.status_code
+                    attributes["http.host"] = hostname
+                    span.set_attributes(attributes)
                     add_request_params_to_span(span, redacted_url)
 
-                    if request.body:
-                        span.set_attribute("spinal.request.binary_data", memoryview(request.body))
+                    # A request body is parsed as a whole by the exporter, so one over max_body_bytes is left out
+                    # rather than cut, and only its size is recorded. A str body is recorded as it is, measured in
+                    # characters, and the exporter encodes it back to UTF-8
+                    body = request.body
+                    if isinstance(body, (bytes, str)):
+                        if max_body_bytes and len(body) > max_body_bytes:
+                            span.set_attribute("spinal.request.size", len(body))
+                        else:
+                            span.set_attribute(
+                                "spinal.request.binary_data", body_attribute(body) if isinstance(body, bytes) else body
+                            )
+                    elif body is not None:
+                        # Generators and files are streamed to the connection, so they cannot be read here
+                        span.set_attribute("spinal.request.content_type", "streaming")
 
                     is_streaming = kwargs.get("stream", self.stream)
                     if is_streaming:
                         wrap_streaming_response(response, span)
                         span.set_attribute("spinal.response.streaming", True)
-                        # Ensure cleanup if the stream is not consumed
-                        response._spinal_span = span
-
-                        def cleanup_span():
-                            if hasattr(response, "_spinal_span"):
-                                response._spinal_span.end()
-                                delattr(response, "_spinal_span")
-
-                        import weakref
-
-                        weakref.finalize(response, cleanup_span)
-                        # Don't end the span here - let the streaming wrapper or finalizer handle it
+                        # Don't end the span here. It ends once the body has been read or the response is closed
                         span.set_status(Status(StatusCode.OK))
                         return response
                     else:
-                        if hasattr(response, "_content") and response._content is not None:
-                            span.set_attribute("spinal.response.binary_data", memoryview(response._content))
-                            span.set_attribute("spinal.response.size", len(response._content))
+                        if (content := getattr(response, "_content", None)) is not None:
+                            # The body is already in memory, so a cut one is a view of its start rather than a copy
+                            body = memoryview(content)[:max_body_bytes] if max_body_bytes else content
+                            record_response_body(span, body, len(content))
                             span.set_attribute("spinal.response.streaming", False)
                         span.set_status(Status(StatusCode.OK))
                         span.end()  # End span for non-streaming responses
                         return response
 
                 except Exception as e:
-                    span.record_exception(e)
-                    span.set_status(Status(StatusCode.ERROR))
+                    record_span_exception(span, e, record_exceptions)
                     span.end()  # End span on exception
                     raise
 
@@ -1,22 +1,45 @@
 import gzip
+import importlib.util
 import logging
+import os
+import re
+import threading
+import time
 import typing
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from types import MappingProxyType
 
 import orjson
 
 import httpx
-from typing import Any, Optional
+from typing import Any, Mapping, Optional, Sequence
 
 if typing.TYPE_CHECKING:
-    from sp_obs._internal.config import SpinalConfig
+    from sp_obs._internal.config import SpinalConfig, SpinalScrubber
 
 from opentelemetry.sdk.trace import ReadableSpan
 from opentelemetry.sdk.trace.export import SpanExportResult, SpanExporter
 from opentelemetry.instrumentation.utils import suppress_instrumentation
 from sp_obs._internal.core.providers import get_provider
+from sp_obs._internal.scrubbing import DefaultScrubber, NoOpScrubber
 
 logger = logging.getLogger(__name__)
 
+# Weight of the latest request in the exponentially weighted average of export latency
+_EXPORT_LATENCY_EWMA_ALPHA = 0.2
+# Attributes that make a span's request or response body need decoding before export
+_BODY_ATTRIBUTES = ("spinal.request.binary_data", "spinal.response.binary_data", "spinal.response.size")
+# Response headers recorded by instrumentation, handed to the provider rather than exported as they are
+_RESPONSE_HEADER_PREFIX = "spinal.http.response.header."
+# Audio responses are summarised by size and format rather than decoded. One precompiled search rather than a
+# substring test per format
+_AUDIO_CONTENT_TYPE = re.compile(r"audio/(?:mpeg|mp3|wav|ogg|pcm|flac)").search
+_KEEPALIVE_EXPIRY_SECONDS = 30
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+# Batches smaller than this are sent uncompressed even with gzip export compression, as they gain little from it
+_GZIP_MIN_BYTES = 1024
+_GZIP_HEADERS = MappingProxyType({"Content-Encoding": "gzip"})
+
 
 class SpinalSpanExporter(SpanExporter):
     """Exports spans to a custom HTTP endpoint (Singleton)"""
@@ -33,72 +56,164 @@ class SpinalSpanExporter(SpanExporter):
         if not self._initialized:
             self.config = config
             self._shutdown = False
+            consumers = max(1, self.config.export_consumers)
             self._session = httpx.Client(
                 headers=self.config.headers,
                 timeout=self.config.timeout,
+                # One kept-alive connection per export consumer. Exports are usually about a second apart, which the
+                # default 5s expiry can miss on quiet services, so connections are kept for longer, though still under
+                # the 60s idle timeout common on load balancers
+                limits=httpx.Limits(max_keepalive_connections=consumers, keepalive_expiry=_KEEPALIVE_EXPIRY_SECONDS),
+                # Concurrent exports share one connection over HTTP/2 when h2 is installed (httpx[http2])
+                http2=_HTTP2_AVAILABLE,
             )
+            # Bodies are encoded up front, so the content type is set once rather than by httpx on every request
+            self._session.headers["Content-Type"] = "application/json"
+
+            self._export_latency_millis = 0.0
+            self._start_export_pool()
+            if hasattr(os, "register_at_fork"):
+                # Pool threads do not survive a fork, so the child needs its own
+                os.register_at_fork(after_in_child=self._start_export_pool)
             self.__class__._initialized = True
 
+    def _start_export_pool(self) -> None:
+        """
+        With more than one consumer, batches are POSTed from a small pool so the batch worker can move on to the next
+        batch while earlier requests are still in flight. The semaphore caps the number of in-flight requests.
+        """
+        consumers = max(1, self.config.export_consumers)
+        self._executor = (
+            ThreadPoolExecutor(max_workers=consumers, thread_name_prefix="SpinalSpanExport") if consumers > 1 else None
+        )
+        self._in_flight = threading.BoundedSemaphore(consumers)
+        self._pending: set[Future] = set()
+        # Pool threads finish their requests concurrently, so the latency average and the count of batches that failed
+        # since the last flush are only updated under this lock
+        self._send_lock = threading.Lock()
+        self._failed_batches = 0
+
+    @property
+    def export_latency_millis(self) -> float:
+        """Exponentially weighted moving average of how long each export request takes"""
+        return self._export_latency_millis
+
     def export(self, spans: list[ReadableSpan]) -> SpanExportResult:
+        """
+        With a single consumer the result is that of the POST. With an export pool, SUCCESS means the batch was handed
+        to the pool, and batches whose POST then fails are reported by the next force_flush, which returns False
+        """
         if self._shutdown:
             return SpanExportResult.FAILURE
 
         try:
-            span_data = []
-            for span in spans:
-                attributes = dict(span.attributes)
-                attributes = self.decode_request_binary_data(attributes)
-                attributes = self.decode_response_binary_data(attributes)
-                if self.config.scrubber:
-                    attributes = self.config.scrubber.scrub_attributes(attributes)
-
-                span_dict = {
-                    "name": span.name,
-                    "trace_id": format(span.get_span_context().trace_id, "032x"),
-                    "span_id": format(span.get_span_context().span_id, "016x"),
-                    "parent_span_id": format(span.parent.span_id, "016x") if span.parent else None,
-                    "start_time": span.start_time,
-                    "end_time": span.end_time,
-                    "status": {"status_code": span.status.status_code.name, "description": span.status.description}
-                    if span.status
-                    else None,
-                    "attributes": attributes,
-                    "events": [
-                        {
-                            "name": event.name,
-                            "timestamp": event.timestamp,
-                            "attributes": dict(event.attributes) if event.attributes else {},
-                        }
-                        for event in span.events
-                    ]
-                    if span.events
-                    else [],
-                    "links": [
-                        {
-                            "context": {
-                                "trace_id": format(link.context.trace_id, "032x"),
-                                "span_id": format(link.context.span_id, "016x"),
-                            },
-                            "attributes": dict(link.attributes) if link.attributes else {},
-                        }
-                        for link in span.links
-                    ]
-                    if span.links
-                    else [],
-                    "instrumentation_info": {
-                        "name": span.instrumentation_scope.name,
-                        "version": span.instrumentation_scope.version,
-                    }
-                    if span.instrumentation_scope
-                    else None,
+            scrubber = self.config.scrubber
+            if isinstance(scrubber, NoOpScrubber):
+                scrubber = None
+
+            # Each span is encoded as soon as its dict is built, so only one span's decoded attributes are held at a
+            # time rather than the whole batch's. The pool then only ever holds a single bytes object per batch
+            encoded = bytearray(b'{"spans":[')
+            for index, span in enumerate(spans):
+                if index:
+                    encoded += b","
+                encoded += orjson.dumps(
+                    self._span_to_dict(span, scrubber), default=_encode_mapping, option=orjson.OPT_NON_STR_KEYS
+                )
+            encoded += b"]}"
+            headers = None
+            if self.config.export_compression == "gzip" and len(encoded) >= _GZIP_MIN_BYTES:
+                # The fastest level, which already shrinks the repetitive span JSON several times over
+                body = gzip.compress(encoded, compresslevel=1)
+                headers = _GZIP_HEADERS
+            else:
+                body = bytes(encoded)
+            del encoded
+            if self._executor is None:
+                return self._send(body, len(spans), headers)
+
+            self._in_flight.acquire()
+            future = self._executor.submit(self._send_pooled, body, len(spans), headers)
+            self._pending.add(future)
+            future.add_done_callback(self._on_send_done)
+            return SpanExportResult.SUCCESS
+
+        except Exception as e:
+            logger.error(f"Error exporting spans: {e}")
+            return SpanExportResult.FAILURE
+
+    def _span_to_dict(self, span: ReadableSpan, scrubber: Optional["SpinalScrubber"]) -> dict[str, Any]:
+        """Build the JSON-ready form of a span, with its request and response bodies decoded and scrubbed"""
+        # The span's read-only attributes are only copied right before something changes them: decoding pops the body
+        # attributes, and a custom scrubber may edit them in place. The default scrubber builds a new dict of its own,
+        # and without a scrubber they are encoded as they are
+        attributes = span.attributes
+        copied = False
+        if any(key in attributes for key in _BODY_ATTRIBUTES):
+            attributes = self.decode_request_binary_data(dict(attributes))
+            attributes = self.decode_response_binary_data(attributes)
+            copied = True
+        if scrubber:
+            if not copied and not isinstance(scrubber, DefaultScrubber):
+                attributes = dict(attributes)
+            attributes = scrubber.scrub_attributes(attributes)
+
+        span_context = span.get_span_context()
+        return {
+            "name": span.name,
+            "trace_id": _trace_id_hex(span_context.trace_id),
+            "span_id": _span_id_hex(span_context.span_id),
+            "parent_span_id": _span_id_hex(span.parent.span_id) if span.parent else None,
+            "start_time": span.start_time,
+            "end_time": span.end_time,
+            "status": {"status_code": span.status.status_code.name, "description": span.status.description}
+            if span.status
+            else None,
+            "attributes": attributes,
+            "events": [
+                {
+                    "name": event.name,
+                    "timestamp": event.timestamp,
+                    "attributes": dict(event.attributes) if event.attributes else {},
+                }
+                for event in span.events
+            ]
+            if span.events
+            else [],
+            "links": [
+                {
+                    "context": {
+                        "trace_id": _trace_id_hex(link.context.trace_id),
+                        "span_id": _span_id_hex(link.context.span_id),
+                    },
+                    "attributes": dict(link.attributes) if link.attributes else {},
                 }
-                span_data.append(span_dict)
+                for link in span.links
+            ]
+            if span.links
+            else [],
+            "instrumentation_info": {
+                "name": span.instrumentation_scope.name,
+                "version": span.instrumentation_scope.version,
+            }
+            if span.instrumentation_scope
+            else None,
+        }
 
+    def _send(self, body: bytes, span_count: int, headers: Mapping[str, str] | None = None) -> SpanExportResult:
+        start = time.perf_counter()
+        try:
             with suppress_instrumentation():
-                response = self._session.post(self.config.endpoint, json={"spans": span_data})
+                response = self._session.post(
+                    self.config.endpoint,
+                    content=body,
+                    headers=headers,
+                )
 
             if 200 <= response.status_code < 300:
-                logger.debug(f"Successfully exported {len(spans)} spans to {self.config.endpoint}")
+                logger.debug("Successfully exported %d spans to %s", span_count, self.config.endpoint)
+                if span_count >= self.config.max_export_batch_size:
+                    logger.debug("Exported a full batch of spans. Consider raising max_queue_size if spans are dropped")
                 return SpanExportResult.SUCCESS
             else:
                 logger.error(f"Failed to export spans. Status: {response.status_code}, Response: {response.text}")
@@ -108,6 +223,36 @@ class SpinalSpanExporter(SpanExporter):
             logger.error(f"Error exporting spans: {e}")
             return SpanExportResult.FAILURE
 
+        finally:
+            elapsed_millis = (time.perf_counter() - start) * 1000
+            with self._send_lock:
+                self._export_latency_millis += _EXPORT_LATENCY_EWMA_ALPHA * (
+                    elapsed_millis - self._export_latency_millis
+                )
+
+    def _send_pooled(self, body: bytes, span_count: int, headers: Mapping[str, str] | None = None) -> None:
+        # Failures are counted before the future completes, so a force_flush waiting on it always sees them
+        if self._send(body, span_count, headers) is not SpanExportResult.SUCCESS:
+            with self._send_lock:
+                self._failed_batches += 1
+
+    def _on_send_done(self, future: Future) -> None:
+        self._pending.discard(future)
+        self._in_flight.release()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        """
+        Wait for batches that are still being POSTed by the export pool. Returns False if any did not finish in time,
+        or if a batch handed to the pool since the last flush failed to export
+        """
+        pending = self._pending.copy()
+        not_done = wait(pending, timeout=timeout_millis / 1000).not_done if pending else ()
+        with self._send_lock:
+            failed_batches, self._failed_batches = self._failed_batches, 0
+        if failed_batches:
+            logger.error("%d span batches failed to export since the last flush", failed_batches)
+        return not not_done and not failed_batches
+
     def decode_request_binary_data(self, attributes: dict[str, Any]) -> dict[str, Any]:
         """
         Decode the binary data from the request attributes and update the attributes with the resultant data.
@@ -125,11 +270,11 @@ class SpinalSpanExporter(SpanExporter):
             dict[str, Any]: The updated attributes dictionary containing the decoded binary data as
             request parameters. If no binary data is found, the original attributes are returned.
         """
-        raw_data_mv: memoryview | None = attributes.pop("spinal.request.binary_data", None)
-        if not raw_data_mv:
+        raw_data = attributes.pop("spinal.request.binary_data", None)
+        if not raw_data:
             return attributes
 
-        binary_data = bytes(raw_data_mv)
+        binary_data = _body_bytes(raw_data)
         request_attributes = orjson.loads(binary_data)
         request_input = request_attributes.get("input", [])
         if isinstance(request_input, list):
@@ -145,14 +290,15 @@ class SpinalSpanExporter(SpanExporter):
 
     def decode_response_binary_data(self, attributes: dict[str, Any]) -> dict[str, Any]:
         """
-        Attributes will have a field called 'raw_binary_data'. This is a memoryview, and we need to change into
-        a list of attributes. Bear in mind, these bytes could also be compressed.
+        Attributes will have a field called 'spinal.response.binary_data' holding the body bytes, and we need to
+        change it into a list of attributes. Bear in mind, these bytes could also be compressed.
         """
-        raw_data_mv: memoryview | None = attributes.pop("spinal.response.binary_data", None)
-        if not raw_data_mv:
+        raw_data = attributes.pop("spinal.response.binary_data", None)
+        # Instrumentation records only the size of bodies it does not buffer, such as audio
+        if not raw_data and not attributes.get("spinal.response.size"):
             return attributes
 
-        binary_data = bytes(raw_data_mv)
+        binary_data = _body_bytes(raw_data) if raw_data else b""
         content_encoding = attributes.get("content-encoding", "")
         if content_encoding == "gzip":
             try:
@@ -164,45 +310,91 @@ class SpinalSpanExporter(SpanExporter):
         response_attributes = {}
         provider = get_provider(attributes.get("spinal.provider"))
         content_type = attributes.get("content-type", "")
-        if any(
-            audio_type in content_type
-            for audio_type in ["audio/mpeg", "audio/mp3", "audio/wav", "audio/ogg", "audio/pcm", "audio/flac"]
-        ):
+        # Text bodies are only parsed when one was captured. With SPINAL_CAPTURE_BODY=0 just their size is recorded
+        if _AUDIO_CONTENT_TYPE(content_type):
             # For audio, we don't decode to text - store metadata instead
             response_attributes = {
-                "audio_size_bytes": len(binary_data),
+                "audio_size_bytes": len(binary_data) or attributes.get("spinal.response.size"),
                 "audio_format": content_type,
             }
 
-        elif "text/event-stream" in content_type:
-            text_data = safe_decode(binary_data)
-            response_attributes = provider.handle_event_stream(event_stream=text_data)
+        elif binary_data and "text/event-stream" in content_type:
+            # Event streams are always UTF-8, and orjson reads the payloads straight from bytes, so the whole stream is
+            # not decoded first
+            response_attributes = provider.handle_event_stream(event_stream=binary_data)
 
-        elif "application/json" in content_type:
-            text_data = safe_decode(binary_data)
+        elif binary_data and "application/json" in content_type:
+            # orjson reads UTF-8 bytes directly, so the body is only decoded to text when that fails, either to retry
+            # it in another encoding or to keep it as raw content
             try:
-                response_attributes = orjson.loads(text_data)
-            except Exception as e:
-                response_attributes = {"raw_content": text_data, "parse_error": str(e), "content_type": content_type}
+                response_attributes = orjson.loads(binary_data)
+            except orjson.JSONDecodeError:
+                text_data = safe_decode(binary_data)
+                try:
+                    response_attributes = orjson.loads(text_data)
+                except orjson.JSONDecodeError as e:
+                    response_attributes = {
+                        "raw_content": text_data,
+                        "parse_error": str(e),
+                        "content_type": content_type,
+                    }
 
         response_attributes = provider.parse_response_attributes(response_attributes)
 
-        # Lets scrub response headers for this provider
-        all_response_headers = {
-            k: attributes.pop(k) for k in list(attributes.keys()) if k.startswith("spinal.http.response.header.")
-        }
-        response_headers = provider.parse_response_headers(all_response_headers)
-
-        return attributes | response_attributes | response_headers
+        # Lets scrub response headers for this provider. Headers and the other attributes are split in one pass, and
+        # the result is built up in that dict rather than copied again by chained merges
+        merged_attributes = {}
+        all_response_headers = {}
+        for key, value in attributes.items():
+            if key.startswith(_RESPONSE_HEADER_PREFIX):
+                all_response_headers[key] = value
+            else:
+                merged_attributes[key] = value
+        merged_attributes.update(response_attributes)
+        merged_attributes.update(provider.parse_response_headers(all_response_headers))
+        return merged_attributes
 
     def shutdown(self) -> None:
         self.force_flush()
 
         self._shutdown = True
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
         if hasattr(self, "_session"):
             self._session.close()
 
 
+def _encode_mapping(value: Any) -> dict:
+    # orjson only encodes dicts, so span attributes passed through as their read-only mapping are converted as they
+    # are written
+    if isinstance(value, Mapping):
+        return dict(value)
+    raise TypeError
+
+
+# IDs are written as zero-padded lower-case hex. Going through to_bytes and hex is a few times faster than format()
+def _trace_id_hex(trace_id: int) -> str:
+    return trace_id.to_bytes(16, "big").hex()
+
+
+def _span_id_hex(span_id: int) -> str:
+    return span_id.to_bytes(8, "big").hex()
+
+
+def _body_bytes(raw_data: bytes | str | Sequence[int]) -> bytes:
+    """
+    Turn a recorded body attribute back into bytes. Instrumentation sets bodies as a memoryview, which OpenTelemetry
+    stores as a tuple of ints in every supported version. Bytes are used as they are, rather than copied again. A str
+    comes from a body set as bytes on OpenTelemetry before 1.45, which decodes bytes attributes, or from a str request
+    body, and is encoded back to UTF-8
+    """
+    if isinstance(raw_data, bytes):
+        return raw_data
+    if isinstance(raw_data, str):
+        return raw_data.encode()
+    return bytes(raw_data)
+
+
 def safe_decode(binary_data: bytes) -> str:
     """
     Safely decode binary data to string, trying multiple encodings if UTF-8 fails.
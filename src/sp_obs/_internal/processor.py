@@ -1,11 +1,15 @@
 import logging
+import os
+import random
+import threading
 import typing
+import weakref
 
 from opentelemetry import baggage, trace
-from opentelemetry.sdk.trace import ReadableSpan, Span
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
+from opentelemetry.sdk.trace import ReadableSpan, Span, SpanProcessor
 
 from sp_obs._internal import SPINAL_NAMESPACE
+from sp_obs._internal.core import background
 
 if typing.TYPE_CHECKING:
     from sp_obs._internal.config import SpinalConfig
@@ -14,16 +18,33 @@ from sp_obs._internal.exporter import SpinalSpanExporter
 
 logger = logging.getLogger(__name__)
 
+# Some spans are always admitted so export latency keeps being measured while the exporter is slow
+_MAX_DROP_PROBABILITY = 0.9
 
-class SpinalSpanProcessor(BatchSpanProcessor):
-    """Processes spans and forwards them to the custom exporter"""
+
+def _trace_id(span: ReadableSpan) -> int:
+    return span.context.trace_id
+
+
+class SpinalSpanProcessor(SpanProcessor):
+    """
+    Processes spans and forwards them to the custom exporter
+
+    Spans are batched here rather than in OpenTelemetry's BatchSpanProcessor. The producer path in on_end is a plain
+    list.append (atomic under the GIL), and a background worker drains the list in batches. The worker removes a batch
+    with a slice copy followed by a slice delete rather than swapping in a new list: a producer that read the list
+    reference just before a swap would otherwise append into a buffer that is already being exported, losing the span.
+
+    When the exporter's average latency climbs above export_latency_target_millis, non-billing spans are shed with a
+    probability that grows with the overshoot, so a slow collector is not left to fill the queue.
+    """
 
     def __init__(
         self,
         config: "SpinalConfig",
     ):
         """
-        Necessary arguments for the BatchSpanProcessor class:
+        Necessary configuration for batching:
             max_queue_size: int
                 The maximum number of spans allowed in the queue. When the queue is full, additional spans are dropped.
 
@@ -36,14 +57,112 @@ class SpinalSpanProcessor(BatchSpanProcessor):
             export_timeout_millis: float
                 The timeout in milliseconds for exporting spans.
         """
+        if config.max_queue_size <= 0:
+            raise ValueError("max_queue_size must be a positive integer.")
+        if config.schedule_delay_millis <= 0:
+            raise ValueError("schedule_delay_millis must be positive.")
+        if config.max_export_batch_size <= 0:
+            raise ValueError("max_export_batch_size must be a positive integer.")
+        if config.max_export_batch_size > config.max_queue_size:
+            raise ValueError("max_export_batch_size must be less than or equal to max_queue_size.")
+
         self.exporter = SpinalSpanExporter(config)
-        super().__init__(
-            self.exporter,
-            max_queue_size=config.max_queue_size,
-            schedule_delay_millis=config.schedule_delay_millis,
-            max_export_batch_size=config.max_export_batch_size,
-            export_timeout_millis=config.export_timeout_millis,
-        )
+        self._max_queue_size = config.max_queue_size
+        self._max_export_batch_size = config.max_export_batch_size
+        self._schedule_delay = config.schedule_delay_millis / 1e3
+        self._export_timeout_millis = config.export_timeout_millis
+        self._export_latency_target_millis = config.export_latency_target_millis
+        self._drop_probability = 0.0
+        self._dropped_low_priority_spans = 0
+        self._coalesce_by_trace = config.coalesce_by_trace
+
+        self._queue: list[ReadableSpan] = []
+        self._dropped_spans = 0
+        self._shutdown = False
+        self._export_lock = threading.Lock()
+        self._worker_awaken = threading.Event()
+        self._worker_thread = self._start_worker()
+
+        if hasattr(os, "register_at_fork"):
+            weak_reinit = weakref.WeakMethod(self._at_fork_reinit)
+
+            def _after_in_child() -> None:
+                if reinit := weak_reinit():
+                    reinit()
+
+            os.register_at_fork(after_in_child=_after_in_child)
+
+    @property
+    def dropped_spans(self) -> int:
+        """Number of spans dropped because the queue was full. Approximate under heavy contention"""
+        return self._dropped_spans
+
+    @property
+    def dropped_low_priority_spans(self) -> int:
+        """Number of non-billing spans shed because export latency was above target"""
+        return self._dropped_low_priority_spans
+
+    def _start_worker(self) -> threading.Thread:
+        worker_thread = threading.Thread(name="SpinalSpanProcessor", target=self._worker, daemon=True)
+        worker_thread.start()
+        return worker_thread
+
+    def _at_fork_reinit(self) -> None:
+        """The worker thread does not survive a fork, so restart it with an empty queue in the child"""
+        self._export_lock = threading.Lock()
+        self._worker_awaken = threading.Event()
+        self._queue = []
+        self._worker_thread = self._start_worker()
+
+    def _worker(self) -> None:
+        while not self._shutdown:
+            # Woken early by on_end once a full batch is queued, and by shutdown
+            self._worker_awaken.wait(self._schedule_delay)
+            self._worker_awaken.clear()
+            if self._shutdown:
+                break
+            self._export_queued()
+
+        self._export_queued()
+
+    def _export_queued(self) -> None:
+        """Export everything currently queued, in batches of at most max_export_batch_size"""
+        with self._export_lock:
+            queue = self._queue
+            batch_size = self._max_export_batch_size
+
+            if self._coalesce_by_trace:
+                # Take a snapshot and stable-sort it so each trace's spans are contiguous and share a request where
+                # possible. Spans arrive mostly clustered by trace already, which is close to Timsort's best case.
+                count = len(queue)
+                pending = queue[:count]
+                del queue[:count]
+                pending.sort(key=_trace_id)
+                for start in range(0, count, batch_size):
+                    self._export_batch(pending[start : start + batch_size])
+
+            while queue:
+                count = min(batch_size, len(queue))
+                # A fresh slice is deliberate. Refilling a preallocated buffer (buf[:] = queue[:count]) still builds the
+                # slice first and measures about twice as slow, and the exporter does not hold on to the batch list.
+                batch = queue[:count]
+                del queue[:count]
+                self._export_batch(batch)
+
+            self._update_drop_probability()
+
+    def _export_batch(self, batch: list[ReadableSpan]) -> None:
+        try:
+            self.exporter.export(batch)
+        except Exception:
+            logger.exception("Exception while exporting spans")
+
+    def _update_drop_probability(self) -> None:
+        target = self._export_latency_target_millis
+        if target <= 0:
+            return
+        overshoot = (self.exporter.export_latency_millis - target) / target
+        self._drop_probability = min(max(0.0, overshoot), _MAX_DROP_PROBABILITY)
 
     def _should_process(self, span: ReadableSpan | Span) -> bool:
         """
@@ -74,12 +193,48 @@ class SpinalSpanProcessor(BatchSpanProcessor):
         if not self._should_process(span):
             return
 
-        # Do not call the super().on_end as that function respects the sampling rate.
-        self._batch_processor.emit(span)
+        if self._shutdown:
+            return
+
+        if (
+            self._drop_probability
+            and not span.attributes.get("is_billing_span")
+            and random.random() < self._drop_probability
+        ):
+            self._dropped_low_priority_spans += 1
+            return
+
+        # Spans are queued regardless of the sampling decision
+        queue = self._queue
+        if len(queue) >= self._max_queue_size:
+            self._dropped_spans += 1
+            logger.debug("Span queue full, dropping span")
+            return
+
+        queue.append(span)
+        if len(queue) >= self._max_export_batch_size and not self._worker_awaken.is_set():
+            self._worker_awaken.set()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        """Export everything queued and wait for any batches still in flight"""
+        if self._shutdown:
+            return False
+
+        # Spans still being recorded off the event loop are waited for, so they make it into this flush
+        background.wait_for_pending(timeout_millis / 1e3)
+        self._export_queued()
+        return self.exporter.force_flush(timeout_millis)
 
     def shutdown(self) -> None:
         """Shutdown the processor"""
-        self.force_flush()
+        if self._shutdown:
+            return
+
+        # The worker exports whatever is still queued before it exits, including spans still being recorded off the
+        # event loop
+        background.wait_for_pending(self._export_timeout_millis / 1e3)
+        self._shutdown = True
+        self._worker_awaken.set()
+        self._worker_thread.join(self._export_timeout_millis / 1e3)
 
         self.exporter.shutdown()
-        super().shutdown()
@@ -1,9 +1,20 @@
 import re
 import typing
 
+# Upper bound on memoised key lookups, so attribute payloads with unbounded key sets (e.g. ids used as keys) cannot grow
+# the cache without limit. Keys beyond it are still matched, just not remembered
+_MAX_CACHED_KEYS = 4096
+
 
 class DefaultScrubber:
-    """Default implementation of SpinalScrubber with basic sensitive patterns"""
+    """
+    Default implementation of SpinalScrubber with basic sensitive patterns
+
+    Attribute keys come from a small, repeating vocabulary, so the outcome of matching each key is memoised and the
+    regex only runs the first time a key is seen.
+    """
+
+    __slots__ = ("patterns", "_compiled_pattern", "_compiled_protected_patterns", "_redactions")
 
     SENSITIVE_PATTERNS = [
         r"password",
@@ -50,6 +61,8 @@ class DefaultScrubber:
 
         # Compile all patterns into a single regex, and ensure case is ignored
         self._compiled_pattern = re.compile("|".join(f"({pattern})" for pattern in self.patterns), re.IGNORECASE)
+        # key -> replacement value, or None when the key is not sensitive
+        self._redactions: dict[str, str | None] = {}
 
     def scrub_attributes(self, attributes: dict[str, typing.Any]) -> dict[str, typing.Any]:
         """
@@ -64,10 +77,16 @@ class DefaultScrubber:
         if not attributes:
             return attributes
 
+        redactions = self._redactions
         scrubbed = {}
         for key, value in attributes.items():
-            if self._is_sensitive_key(key):
-                scrubbed[key] = f"[Scrubbed due to {self._get_matched_pattern(key)}]"
+            try:
+                redaction = redactions[key]
+            except KeyError:
+                redaction = self._redaction_for(key)
+
+            if redaction is not None:
+                scrubbed[key] = redaction
             elif isinstance(value, dict):
                 scrubbed[key] = self.scrub_attributes(value)
             elif isinstance(value, list):
@@ -77,6 +96,12 @@ class DefaultScrubber:
 
         return scrubbed
 
+    def _redaction_for(self, key: str) -> str | None:
+        redaction = f"[Scrubbed due to {self._get_matched_pattern(key)}]" if self._is_sensitive_key(key) else None
+        if len(self._redactions) < _MAX_CACHED_KEYS:
+            self._redactions[key] = redaction
+        return redaction
+
     def _is_sensitive_key(self, key: str) -> bool:
         return bool(self._compiled_pattern.search(key))
 
@@ -91,5 +116,7 @@ class DefaultScrubber:
 class NoOpScrubber:
     """A no-op scrubber that passes through all attributes unchanged"""
 
+    __slots__ = ()
+
     def scrub_attributes(self, attributes: dict[str, typing.Any]) -> dict[str, typing.Any]:
         return attributes
@@ -62,5 +62,5 @@ class SpinalTracerProvider:
             if isinstance(global_provider, ProxyTracerProvider):
                 trace.set_tracer_provider(provider)
 
-        logger.debug(f"Created isolated tracer provider for service: {service_name}")
+        logger.debug("Created isolated tracer provider for service: %s", service_name)
         return provider
@@ -30,8 +30,9 @@ def add_billing_event(success: bool, **kwargs):
         ValueError
             Raised if the global tracing provider is not set.
     """
-    provider = get_tracer_provider().provider
-    if isinstance(provider, ProxyTracerProvider):
+    tracer_provider = get_tracer_provider()
+    provider = tracer_provider.provider if tracer_provider is not None else None
+    if provider is None or isinstance(provider, ProxyTracerProvider):
         raise ValueError(
             "Cannot add billing event - spinal tracing provider is not set. Please call sp_obs.configure() first"
         )
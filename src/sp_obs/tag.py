@@ -79,7 +79,7 @@ class tag:
 
         # Attach the updated context and save the token
         self.token = context.attach(current_context)
-        logger.debug(f"Added tags to baggage: {baggage_to_add}")
+        logger.debug("Added tags to baggage: %s", baggage_to_add)
 
     def __enter__(self):
         """Enter the context manager"""
@@ -1,8 +1,8 @@
 import warnings
 from functools import wraps
 from urllib.parse import parse_qsl, urlparse
-from opentelemetry.trace import Span
-from opentelemetry.util.http import PARAMS_TO_REDACT
+from opentelemetry.trace import Span, Status, StatusCode
+from opentelemetry.util.http import PARAMS_TO_REDACT, redact_url
 
 
 def deprecated(replacement=None):
@@ -26,11 +26,57 @@ def deprecated(replacement=None):
     return decorator
 
 
+def redact_request_url(url: str) -> str:
+    """
+    Redact credentials and sensitive query parameters from a URL. Most provider URLs have neither, so redact_url and
+    its parsing are skipped for URLs without a userinfo or query separator, which it would return unchanged
+    """
+    if "?" not in url and "@" not in url:
+        return url
+    return redact_url(url)
+
+
 def add_request_params_to_span(span: Span, url: str):
     """Add request parameters to span attributes"""
+    if "?" not in url:
+        return
+
     parsed_url = urlparse(url)
     params = dict(parse_qsl(parsed_url.query))
 
     for query_parameter, value in params.items():
         if query_parameter not in PARAMS_TO_REDACT:
             span.set_attribute(f"spinal.http.request.query.{query_parameter}", value)
+
+
+def record_span_exception(span: Span, exception: BaseException, record_exceptions: bool = True):
+    """
+    Mark span as failed by exception. An exception event with the formatted traceback is recorded unless
+    record_exceptions is off (SpinalConfig.record_exceptions), in which case only the exception type and message are
+    kept
+    """
+    if record_exceptions:
+        span.record_exception(exception)
+        span.set_status(Status(StatusCode.ERROR, str(exception)))
+        return
+
+    error_type = type(exception).__name__
+    span.set_attribute("error.type", error_type)
+    span.set_status(Status(StatusCode.ERROR, f"{error_type}: {exception}"))
+
+
+def body_attribute(body: bytes | bytearray | memoryview) -> memoryview:
+    """
+    Body bytes in the form they are set as a span attribute. OpenTelemetry before 1.45 decodes bytes attributes to str
+    and drops bodies that are not UTF-8, such as gzip, whereas a memoryview is stored as a tuple of its byte values in
+    every version
+    """
+    return memoryview(body)
+
+
+def extend_body_buffer(buffer: bytearray, chunk: bytes, max_body_bytes: int) -> None:
+    """Append a response chunk to a captured body, keeping at most max_body_bytes of it. 0 means no limit"""
+    if not max_body_bytes:
+        buffer.extend(chunk)
+    elif (room := max_body_bytes - len(buffer)) > 0:
+        buffer.extend(chunk[:room])
@@ -98,6 +98,15 @@ class TestAddBillingEvent:
             assert "Cannot add billing event - spinal tracing provider is not set" in str(exc_info.value)
             assert "Please call sp_obs.configure() first" in str(exc_info.value)
 
+    def test_add_billing_event_before_configure(self):
+        """Test add_billing_event raises ValueError when the SDK was never configured.
+
+        Tests that a missing tracer provider gives the same error as an unset one.
+        """
+        with patch("sp_obs.billing.get_tracer_provider", return_value=None):
+            with pytest.raises(ValueError, match=r"Please call sp_obs.configure\(\) first"):
+                add_billing_event(success=True, amount=50.0)
+
     def test_add_billing_event_with_empty_kwargs(self):
         """Test add_billing_event works with no additional attributes.
 
@@ -2,12 +2,14 @@
 Unit tests for configuration module
 """
 
+import logging
+
 import pytest
 import os
 from unittest.mock import patch
 
-from sp_obs._internal.config import SpinalConfig, SpinalSDK, configure, get_config
-from sp_obs import DefaultScrubber
+from sp_obs._internal.config import SpinalConfig, SpinalSDK, _set_opentelemetry_log_level, configure, get_config
+from sp_obs import DefaultScrubber, NoOpScrubber
 
 
 class TestSpinalConfig:
@@ -49,10 +51,10 @@ class TestSpinalConfig:
         assert config.endpoint == "https://env.example.com"
         assert config.api_key == "env-key"
         assert config.timeout == 5  # default
-        assert config.max_export_batch_size == 512  # default
-        assert config.max_queue_size == 2048  # default
-        assert config.schedule_delay_millis == 5000  # default
-        assert config.export_timeout_millis == 30000  # default
+        assert config.max_export_batch_size == 256  # default
+        assert config.max_queue_size == 4096  # default
+        assert config.schedule_delay_millis == 1000  # default
+        assert config.export_timeout_millis == 10000  # default
 
     def test_config_with_default_endpoint(self):
         """Test configuration with default endpoint.
@@ -102,6 +104,18 @@ class TestSpinalConfig:
         config = SpinalConfig(endpoint="https://api.example.com", api_key="test-key")
         assert isinstance(config.scrubber, DefaultScrubber)
 
+    def test_config_shares_default_scrubbers(self):
+        """Test configuration reuses the shared default and no-op scrubbers.
+
+        Tests that configs share one DefaultScrubber and that scrubber=False disables scrubbing.
+        """
+        first = SpinalConfig(endpoint="https://api.example.com", api_key="test-key")
+        second = SpinalConfig(endpoint="https://api.example.com", api_key="test-key")
+        disabled = SpinalConfig(endpoint="https://api.example.com", api_key="test-key", scrubber=False)
+
+        assert first.scrubber is second.scrubber
+        assert isinstance(disabled.scrubber, NoOpScrubber)
+
     @patch.dict(
         os.environ,
         {
@@ -133,7 +147,45 @@ class TestSpinalConfig:
         config = SpinalConfig()
 
         # Should fall back to default when env var is invalid
-        assert config.max_queue_size == 2048  # default
+        assert config.max_queue_size == 4096  # default
+
+    @patch.dict(os.environ, {"SPINAL_MAX_BODY_BYTES": "1048576", "SPINAL_API_KEY": "test-key"})
+    def test_config_max_body_bytes(self):
+        """Test that max_body_bytes is read from SPINAL_MAX_BODY_BYTES unless passed explicitly."""
+        assert SpinalConfig().max_body_bytes == 1048576
+        assert SpinalConfig(max_body_bytes=0).max_body_bytes == 0
+
+    @patch.dict(os.environ, {"SPINAL_CAPTURE_BODY": "0", "SPINAL_API_KEY": "test-key"})
+    def test_config_capture_body(self):
+        """Test that SPINAL_CAPTURE_BODY=0 turns off body capture unless it is passed explicitly."""
+        assert SpinalConfig().capture_body is False
+        assert SpinalConfig(capture_body=True).capture_body is True
+
+    @patch.dict(os.environ, {"SPINAL_RECORD_EXCEPTIONS": "0", "SPINAL_API_KEY": "test-key"})
+    def test_config_record_exceptions(self):
+        """Test that SPINAL_RECORD_EXCEPTIONS=0 turns off exception events unless it is passed explicitly."""
+        assert SpinalConfig().record_exceptions is False
+        assert SpinalConfig(record_exceptions=True).record_exceptions is True
+
+    @patch.dict(os.environ, {"SPINAL_EXPORT_COMPRESSION": "GZIP", "SPINAL_API_KEY": "test-key"})
+    def test_config_export_compression(self):
+        """Test that export compression is read from SPINAL_EXPORT_COMPRESSION, and unknown values fall back to none."""
+        assert SpinalConfig().export_compression == "gzip"
+        assert SpinalConfig(export_compression="none").export_compression == "none"
+        assert SpinalConfig(export_compression="zstd").export_compression == "none"
+
+    @patch.dict(os.environ, {"SPINAL_PROFILE": "low_latency", "SPINAL_API_KEY": "test-key"})
+    def test_config_profile_presets(self):
+        """Test configuration uses the batch processing preset selected by SPINAL_PROFILE.
+
+        Tests that the preset replaces the defaults but explicit values still take precedence.
+        """
+        config = SpinalConfig(max_queue_size=1000)
+
+        assert config.max_queue_size == 1000
+        assert config.max_export_batch_size == 128
+        assert config.schedule_delay_millis == 250
+        assert config.export_timeout_millis == 10000
 
     def test_config_headers_merge(self):
         """Test configuration properly merges custom headers.
@@ -145,6 +197,19 @@ class TestSpinalConfig:
 
         assert config.headers["Custom-Header"] == "custom-value"
         assert config.headers["X-SPINAL-API-KEY"] == "test-key"
+        assert "X-SPINAL-API-KEY" not in custom_headers
+
+        # Merged headers are frozen once built
+        with pytest.raises(TypeError):
+            config.headers["Another-Header"] = "value"
+
+    def test_config_uses_slots(self):
+        """Test that config attributes are fixed slots rather than an instance dict"""
+        config = SpinalConfig(endpoint="https://api.example.com", api_key="test-key")
+
+        assert not hasattr(config, "__dict__")
+        with pytest.raises(AttributeError):
+            config.unknown_setting = True
 
 
 class TestGlobalConfiguration:
@@ -168,8 +233,8 @@ class TestGlobalConfiguration:
         """
         # Mock the instrumentation to avoid actual setup
         with patch("sp_obs._internal.config.SpinalTracerProvider"):
-            with patch("sp_obs._internal.config.SpinalHTTPXClientInstrumentor"):
-                with patch("sp_obs._internal.config.SpinalRequestsInstrumentor"):
+            with patch("sp_obs._internal.core.httpx.httpx.SpinalHTTPXClientInstrumentor"):
+                with patch("sp_obs._internal.core.requests.requests.SpinalRequestsInstrumentor"):
                     config = configure(
                         endpoint="https://api.example.com",
                         api_key="test-key",
@@ -192,8 +257,8 @@ class TestGlobalConfiguration:
         """
         # Mock the instrumentation to avoid actual setup
         with patch("sp_obs._internal.config.SpinalTracerProvider"):
-            with patch("sp_obs._internal.config.SpinalHTTPXClientInstrumentor"):
-                with patch("sp_obs._internal.config.SpinalRequestsInstrumentor"):
+            with patch("sp_obs._internal.core.httpx.httpx.SpinalHTTPXClientInstrumentor"):
+                with patch("sp_obs._internal.core.requests.requests.SpinalRequestsInstrumentor"):
                     # Patch the global config to None to simulate first call
                     config = get_config()
 
@@ -202,6 +267,20 @@ class TestGlobalConfiguration:
                     assert config.endpoint == "https://cloud.withspinal.com"  # default
                     assert config.api_key == "test-key"
 
+    @patch.dict(os.environ, {}, clear=True)
+    def test_get_config_without_api_key_returns_none(self):
+        """Test get_config does not raise when unconfigured and no API key is set.
+
+        Tests that get_config() returns None and leaves the SDK unconfigured.
+        """
+        from sp_obs._internal.config import _sdk
+
+        with patch("sp_obs._internal.config.SpinalTracerProvider") as mock_tracer_provider:
+            assert get_config() is None
+
+        mock_tracer_provider.assert_not_called()
+        assert not _sdk.is_configured()
+
     def test_get_config_returns_existing(self):
         """Test get_config returns existing configuration.
 
@@ -209,8 +288,8 @@ class TestGlobalConfiguration:
         """
         # Mock the instrumentation to avoid actual setup
         with patch("sp_obs._internal.config.SpinalTracerProvider"):
-            with patch("sp_obs._internal.config.SpinalHTTPXClientInstrumentor"):
-                with patch("sp_obs._internal.config.SpinalRequestsInstrumentor"):
+            with patch("sp_obs._internal.core.httpx.httpx.SpinalHTTPXClientInstrumentor"):
+                with patch("sp_obs._internal.core.requests.requests.SpinalRequestsInstrumentor"):
                     # Set up global config first by calling configure
                     test_config = configure(endpoint="https://test.com", api_key="test-key")
 
@@ -227,8 +306,8 @@ class TestGlobalConfiguration:
         """
         # Mock the instrumentation to avoid actual setup
         with patch("sp_obs._internal.config.SpinalTracerProvider"):
-            with patch("sp_obs._internal.config.SpinalHTTPXClientInstrumentor"):
-                with patch("sp_obs._internal.config.SpinalRequestsInstrumentor"):
+            with patch("sp_obs._internal.core.httpx.httpx.SpinalHTTPXClientInstrumentor"):
+                with patch("sp_obs._internal.core.requests.requests.SpinalRequestsInstrumentor"):
                     # First configuration
                     config1 = configure(endpoint="https://api1.example.com", api_key="key1")
 
@@ -249,8 +328,10 @@ class TestGlobalConfiguration:
         Tests that configure() properly initializes tracer provider and instrumentors.
         """
         with patch("sp_obs._internal.config.SpinalTracerProvider") as mock_tracer_provider:
-            with patch("sp_obs._internal.config.SpinalHTTPXClientInstrumentor") as mock_httpx_instrumentor:
-                with patch("sp_obs._internal.config.SpinalRequestsInstrumentor") as mock_requests_instrumentor:
+            with patch("sp_obs._internal.core.httpx.httpx.SpinalHTTPXClientInstrumentor") as mock_httpx_instrumentor:
+                with patch(
+                    "sp_obs._internal.core.requests.requests.SpinalRequestsInstrumentor"
+                ) as mock_requests_instrumentor:
                     mock_httpx_instance = mock_httpx_instrumentor.return_value
                     mock_requests_instance = mock_requests_instrumentor.return_value
 
@@ -264,3 +345,74 @@ class TestGlobalConfiguration:
                     mock_requests_instrumentor.assert_called_once()
                     mock_httpx_instance.instrument.assert_called_once()
                     mock_requests_instance.instrument.assert_called_once()
+
+    def test_configure_skips_disabled_instrumentors(self):
+        """Test configure leaves disabled client libraries uninstrumented.
+
+        Tests that instrumentors named in disabled_instrumentors are never created.
+        """
+        with patch("sp_obs._internal.config.SpinalTracerProvider"):
+            with patch("sp_obs._internal.core.httpx.httpx.SpinalHTTPXClientInstrumentor") as mock_httpx_instrumentor:
+                with patch(
+                    "sp_obs._internal.core.requests.requests.SpinalRequestsInstrumentor"
+                ) as mock_requests_instrumentor:
+                    configure(
+                        endpoint="https://api.example.com",
+                        api_key="test-key",
+                        disabled_instrumentors=["requests", "aiohttp", "grpc"],
+                    )
+
+                    mock_httpx_instrumentor.return_value.instrument.assert_called_once()
+                    mock_requests_instrumentor.assert_not_called()
+
+    def test_configure_leaves_unchanged_log_level_alone(self):
+        """Test configure only sets the opentelemetry log level when it differs.
+
+        Tests that an already matching level is not reset, and a different one is applied.
+        """
+        otel_logger = logging.getLogger("opentelemetry")
+        otel_logger.setLevel(logging.ERROR)
+
+        with patch("sp_obs._internal.config.SpinalTracerProvider"):
+            with patch("sp_obs._internal.core.httpx.httpx.SpinalHTTPXClientInstrumentor"):
+                with patch("sp_obs._internal.core.requests.requests.SpinalRequestsInstrumentor"):
+                    with patch.object(otel_logger, "setLevel") as mock_set_level:
+                        configure(endpoint="https://api.example.com", api_key="test-key")
+
+                    mock_set_level.assert_not_called()
+
+                    _set_opentelemetry_log_level("WARNING")
+                    assert otel_logger.level == logging.WARNING
+                    otel_logger.setLevel(logging.ERROR)
+
+    def test_config_applies_log_level(self):
+        """Test that building a SpinalConfig directly still applies its opentelemetry log level."""
+        otel_logger = logging.getLogger("opentelemetry")
+        try:
+            SpinalConfig(api_key="test-key", opentelemetry_log_level=logging.WARNING)
+            assert otel_logger.level == logging.WARNING
+        finally:
+            otel_logger.setLevel(logging.ERROR)
+
+    def test_configure_skips_uninstalled_libraries(self):
+        """Test configure skips libraries that are not installed.
+
+        Tests that an instrumentor is never imported when its library cannot be found.
+        """
+        with patch("sp_obs._internal.config.SpinalTracerProvider"):
+            with patch("sp_obs._internal.core.httpx.httpx.SpinalHTTPXClientInstrumentor") as mock_httpx_instrumentor:
+                with patch(
+                    "sp_obs._internal.core.requests.requests.SpinalRequestsInstrumentor"
+                ) as mock_requests_instrumentor:
+                    with patch(
+                        "sp_obs._internal.config.importlib.util.find_spec",
+                        side_effect=lambda name: None if name == "requests" else object(),
+                    ):
+                        configure(
+                            endpoint="https://api.example.com",
+                            api_key="test-key",
+                            disabled_instrumentors=["aiohttp", "grpc"],
+                        )
+
+                    mock_httpx_instrumentor.return_value.instrument.assert_called_once()
+                    mock_requests_instrumentor.assert_not_called()
@@ -110,7 +110,16 @@ class MockHttpxRequest:
 
     def __init__(self, url: str, content: bytes = b""):
         self.url = url
-        self.content = content
+        self._content = content
+
+    @property
+    def content(self) -> bytes:
+        """Like httpx, the body read into _content"""
+        return self._content
+
+    @content.setter
+    def content(self, content: bytes):
+        self._content = content
 
 
 class MockRequestsResponse:
@@ -5,7 +5,12 @@ from unittest.mock import Mock, patch
 import types
 
 import opentelemetry.instrumentation.aiohttp_client
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.sampling import ALWAYS_OFF
+from yarl import URL
 from sp_obs._internal.core.aiohttp.aiohttp import SpinalAioHttpClientInstrumentor
+from sp_obs.utils import record_span_exception
 
 
 class TestSpinalAioHttpClientInstrumentor:
@@ -101,17 +106,20 @@ class TestSpinalAioHttpClientInstrumentor:
 
                     # Create mock params for non-integration URL
                     mock_params = Mock()
-                    mock_params.url = "https://httpbin.org/get"
+                    mock_params.url = URL("https://httpbin.org/get")
                     mock_params.method = "GET"
 
                     trace_config_ctx = types.SimpleNamespace()
 
                     # Call the callback
-                    await spinal_on_request_start(None, trace_config_ctx, mock_params)
+                    with patch("sp_obs._internal.core.aiohttp.aiohttp.redact_request_url") as mock_redact_url:
+                        await spinal_on_request_start(None, trace_config_ctx, mock_params)
+
+                    # Verify the URL was never redacted for an unsupported host
+                    mock_redact_url.assert_not_called()
 
                     # Verify no Spinal span was created
                     assert trace_config_ctx.spinal_span is None
-                    assert trace_config_ctx.spinal_token is None
 
                     # Verify tracer.start_span was not called
                     mock_tracer.start_span.assert_not_called()
@@ -151,14 +159,18 @@ class TestSpinalAioHttpClientInstrumentor:
 
                     # Create mock params for Voyage AI URL
                     mock_start_params = Mock()
-                    mock_start_params.url = "https://api.voyageai.com/v1/embeddings"
+                    mock_start_params.url = URL("https://api.voyageai.com/v1/embeddings")
                     mock_start_params.method = "POST"
                     mock_start_params.data = b'{"input": ["test"]}'
 
                     mock_end_params = Mock()
                     mock_end_params.response = Mock()
                     mock_end_params.response.status = 200
-                    mock_end_params.response.headers = {"content-type": "application/json"}
+                    mock_end_params.response.headers = {
+                        "content-type": "application/json",
+                        "Set-Cookie": "session=abc",
+                        "Spb-cost": "5",
+                    }
 
                     # Mock the StreamReader with at_eof() method
                     mock_stream_reader = Mock()
@@ -173,9 +185,9 @@ class TestSpinalAioHttpClientInstrumentor:
                     # Call on_request_start
                     await spinal_on_request_start(None, trace_config_ctx, mock_start_params)
 
-                    # Verify Spinal span was created
+                    # Verify Spinal span was created without becoming the current span
                     assert trace_config_ctx.spinal_span is not None
-                    assert trace_config_ctx.spinal_token is not None
+                    assert trace.get_current_span() is not trace_config_ctx.spinal_span
 
                     # Call on_request_end to capture headers and store stream_reader
                     await spinal_on_request_end(None, trace_config_ctx, mock_end_params)
@@ -195,6 +207,12 @@ class TestSpinalAioHttpClientInstrumentor:
                     assert attributes.get("spinal.provider") == "voyageai"
                     assert attributes.get("http.host") == "api.voyageai.com"
                     assert attributes.get("http.status_code") == 200
+                    assert attributes.get("spinal.response.size") == len(b'{"result": "test"}')
+                    assert bytes(attributes.get("spinal.response.binary_data")) == b'{"result": "test"}'
+
+                    # Only headers a provider parses are recorded
+                    assert attributes.get("spinal.http.response.header.Spb-cost") == "5"
+                    assert "spinal.http.response.header.Set-Cookie" not in attributes
 
     @pytest.mark.asyncio
     async def test_spinal_callbacks_handle_exceptions(self, mock_tracer_provider, real_tracer, in_memory_span_exporter):
@@ -228,7 +246,7 @@ class TestSpinalAioHttpClientInstrumentor:
 
                     # Create mock params
                     mock_start_params = Mock()
-                    mock_start_params.url = "https://api.voyageai.com/v1/embeddings"
+                    mock_start_params.url = URL("https://api.voyageai.com/v1/embeddings")
                     mock_start_params.method = "POST"
                     mock_start_params.data = b'{"input": ["test"]}'
 
@@ -260,3 +278,253 @@ class TestSpinalAioHttpClientInstrumentor:
                     assert len(span.events) > 0
                     exception_event = span.events[0]
                     assert exception_event.name == "exception"
+
+                    # A second outcome for the same request does not end the span again
+                    await spinal_on_request_exception(None, trace_config_ctx, mock_exception_params)
+                    assert len(in_memory_span_exporter.get_finished_spans()) == 1
+                    assert len(span.events) == 1
+
+    @pytest.mark.asyncio
+    async def test_spinal_callbacks_without_exception_events(
+        self, mock_tracer_provider, real_tracer, in_memory_span_exporter
+    ):
+        """Test that record_exceptions=False keeps failed requests free of exception events."""
+        with patch("sp_obs._internal.core.aiohttp.aiohttp.get_tracer", return_value=real_tracer):
+            mock_base_trace_config = Mock()
+            mock_base_trace_config.on_request_start = []
+            mock_base_trace_config.on_request_end = []
+            mock_base_trace_config.on_response_chunk_received = []
+            mock_base_trace_config.on_request_exception = []
+
+            with patch(
+                "opentelemetry.instrumentation.aiohttp_client.create_trace_config",
+                return_value=mock_base_trace_config,
+            ):
+                with patch("opentelemetry.instrumentation.aiohttp_client.AioHttpClientInstrumentor._instrument"):
+                    instrumentor = SpinalAioHttpClientInstrumentor()
+                    instrumentor._instrument(tracer_provider=mock_tracer_provider, record_exceptions=False)
+                    trace_config = opentelemetry.instrumentation.aiohttp_client.create_trace_config()
+
+                    mock_start_params = Mock()
+                    mock_start_params.url = URL("https://api.voyageai.com/v1/embeddings")
+                    mock_start_params.method = "POST"
+                    mock_start_params.data = None
+
+                    trace_config_ctx = types.SimpleNamespace()
+                    await trace_config.on_request_start[-1](None, trace_config_ctx, mock_start_params)
+                    await trace_config.on_request_exception[-1](
+                        None, trace_config_ctx, Mock(exception=ConnectionError("connection reset"))
+                    )
+
+                    span = in_memory_span_exporter.get_finished_spans()[0]
+                    assert not span.events
+                    assert span.attributes.get("error.type") == "ConnectionError"
+
+    @pytest.mark.asyncio
+    async def test_spinal_callbacks_skip_binary_bodies(
+        self, mock_tracer_provider, real_tracer, in_memory_span_exporter
+    ):
+        """Test that binary response bodies are counted but not buffered.
+
+        Tests that an audio response records its size without the body bytes.
+        """
+        with patch("sp_obs._internal.core.aiohttp.aiohttp.get_tracer", return_value=real_tracer):
+            mock_base_trace_config = Mock()
+            mock_base_trace_config.on_request_start = []
+            mock_base_trace_config.on_request_end = []
+            mock_base_trace_config.on_response_chunk_received = []
+            mock_base_trace_config.on_request_exception = []
+
+            with patch(
+                "opentelemetry.instrumentation.aiohttp_client.create_trace_config",
+                return_value=mock_base_trace_config,
+            ):
+                with patch("opentelemetry.instrumentation.aiohttp_client.AioHttpClientInstrumentor._instrument"):
+                    instrumentor = SpinalAioHttpClientInstrumentor()
+                    instrumentor._instrument(tracer_provider=mock_tracer_provider)
+                    trace_config = opentelemetry.instrumentation.aiohttp_client.create_trace_config()
+
+                    spinal_on_request_start = trace_config.on_request_start[-1]
+                    spinal_on_request_end = trace_config.on_request_end[-1]
+                    spinal_on_response_chunk_received = trace_config.on_response_chunk_received[-1]
+
+                    mock_start_params = Mock()
+                    mock_start_params.url = URL("https://api.elevenlabs.io/v1/text-to-speech/voice")
+                    mock_start_params.method = "POST"
+                    mock_start_params.data = b'{"text": "hello"}'
+
+                    mock_stream_reader = Mock()
+                    mock_stream_reader.at_eof.side_effect = [False, True]
+                    mock_end_params = Mock()
+                    mock_end_params.response.status = 200
+                    mock_end_params.response.headers = {"content-type": "audio/mpeg"}
+                    mock_end_params.response.content = mock_stream_reader
+
+                    trace_config_ctx = types.SimpleNamespace()
+                    await spinal_on_request_start(None, trace_config_ctx, mock_start_params)
+                    await spinal_on_request_end(None, trace_config_ctx, mock_end_params)
+                    for chunk in (b"\xff\xfb" * 100, b"\xff\xfb" * 50):
+                        await spinal_on_response_chunk_received(None, trace_config_ctx, Mock(chunk=chunk))
+
+                    assert trace_config_ctx.spinal_response_buf == bytearray()
+
+                    attributes = dict(in_memory_span_exporter.get_finished_spans()[0].attributes)
+                    assert "spinal.response.binary_data" not in attributes
+                    assert attributes.get("spinal.response.size") == 300
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "headers",
+        [
+            {"Content-Type": "Application/JSON"},
+            {"content-type": "application/vnd.api+json; charset=utf-8"},
+            {"content-type": "Text/Event-Stream;charset=UTF-8"},
+            {},
+        ],
+    )
+    async def test_spinal_callbacks_buffer_parsed_bodies(
+        self, mock_tracer_provider, real_tracer, in_memory_span_exporter, headers
+    ):
+        """Test that bodies the exporter parses are buffered whatever the content type's casing or suffix.
+
+        Tests that responses without a content type are buffered as well.
+        """
+        with patch("sp_obs._internal.core.aiohttp.aiohttp.get_tracer", return_value=real_tracer):
+            mock_base_trace_config = Mock()
+            mock_base_trace_config.on_request_start = []
+            mock_base_trace_config.on_request_end = []
+            mock_base_trace_config.on_response_chunk_received = []
+            mock_base_trace_config.on_request_exception = []
+
+            with patch(
+                "opentelemetry.instrumentation.aiohttp_client.create_trace_config",
+                return_value=mock_base_trace_config,
+            ):
+                with patch("opentelemetry.instrumentation.aiohttp_client.AioHttpClientInstrumentor._instrument"):
+                    instrumentor = SpinalAioHttpClientInstrumentor()
+                    instrumentor._instrument(tracer_provider=mock_tracer_provider)
+                    trace_config = opentelemetry.instrumentation.aiohttp_client.create_trace_config()
+
+                    spinal_on_request_start = trace_config.on_request_start[-1]
+                    spinal_on_request_end = trace_config.on_request_end[-1]
+                    spinal_on_response_chunk_received = trace_config.on_response_chunk_received[-1]
+
+                    mock_start_params = Mock()
+                    mock_start_params.url = URL("https://api.openai.com/v1/responses")
+                    mock_start_params.method = "POST"
+                    mock_start_params.data = None
+
+                    mock_stream_reader = Mock()
+                    mock_stream_reader.at_eof.side_effect = [False, True]
+                    mock_end_params = Mock()
+                    mock_end_params.response.status = 200
+                    mock_end_params.response.headers = headers
+                    mock_end_params.response.content = mock_stream_reader
+
+                    trace_config_ctx = types.SimpleNamespace()
+                    await spinal_on_request_start(None, trace_config_ctx, mock_start_params)
+                    await spinal_on_request_end(None, trace_config_ctx, mock_end_params)
+                    for chunk in (b'{"usage": ', b"{}}"):
+                        await spinal_on_response_chunk_received(None, trace_config_ctx, Mock(chunk=chunk))
+
+                    attributes = dict(in_memory_span_exporter.get_finished_spans()[0].attributes)
+                    assert bytes(attributes["spinal.response.binary_data"]) == b'{"usage": {}}'
+
+    @pytest.mark.asyncio
+    async def test_spinal_callbacks_read_mixed_case_headers(
+        self, mock_tracer_provider, real_tracer, in_memory_span_exporter
+    ):
+        """Test that response headers are matched case-insensitively.
+
+        Tests that an empty response with mixed-case headers is recorded and ended at request end.
+        """
+        with patch("sp_obs._internal.core.aiohttp.aiohttp.get_tracer", return_value=real_tracer):
+            mock_base_trace_config = Mock()
+            mock_base_trace_config.on_request_start = []
+            mock_base_trace_config.on_request_end = []
+            mock_base_trace_config.on_response_chunk_received = []
+            mock_base_trace_config.on_request_exception = []
+
+            with patch(
+                "opentelemetry.instrumentation.aiohttp_client.create_trace_config",
+                return_value=mock_base_trace_config,
+            ):
+                with patch("opentelemetry.instrumentation.aiohttp_client.AioHttpClientInstrumentor._instrument"):
+                    instrumentor = SpinalAioHttpClientInstrumentor()
+                    instrumentor._instrument(tracer_provider=mock_tracer_provider)
+                    trace_config = opentelemetry.instrumentation.aiohttp_client.create_trace_config()
+
+                    spinal_on_request_start = trace_config.on_request_start[-1]
+                    spinal_on_request_end = trace_config.on_request_end[-1]
+
+                    mock_start_params = Mock()
+                    mock_start_params.url = URL("https://api.voyageai.com/v1/embeddings")
+                    mock_start_params.method = "POST"
+                    mock_start_params.data = None
+
+                    mock_end_params = Mock()
+                    mock_end_params.response.status = 200
+                    mock_end_params.response.headers = {
+                        "Content-Type": "application/json",
+                        "Content-Encoding": "gzip",
+                        "Content-Length": "0",
+                    }
+
+                    trace_config_ctx = types.SimpleNamespace()
+                    await spinal_on_request_start(None, trace_config_ctx, mock_start_params)
+                    await spinal_on_request_end(None, trace_config_ctx, mock_end_params)
+
+                    finished_spans = in_memory_span_exporter.get_finished_spans()
+                    assert len(finished_spans) == 1
+                    assert finished_spans[0].attributes.get("content-type") == "application/json"
+                    assert finished_spans[0].attributes.get("content-encoding") == "gzip"
+
+    @pytest.mark.asyncio
+    async def test_spinal_callbacks_skip_non_recording_spans(self, mock_tracer_provider):
+        """Test that sampled-out Spinal spans skip request and response capture.
+
+        Tests that a non-recording span is ended at request start and later callbacks do nothing.
+        """
+        sampled_out_tracer = TracerProvider(sampler=ALWAYS_OFF).get_tracer(__name__)
+        with patch("sp_obs._internal.core.aiohttp.aiohttp.get_tracer", return_value=sampled_out_tracer):
+            mock_base_trace_config = Mock()
+            mock_base_trace_config.on_request_start = []
+            mock_base_trace_config.on_request_end = []
+            mock_base_trace_config.on_response_chunk_received = []
+            mock_base_trace_config.on_request_exception = []
+
+            with patch(
+                "opentelemetry.instrumentation.aiohttp_client.create_trace_config",
+                return_value=mock_base_trace_config,
+            ):
+                with patch("opentelemetry.instrumentation.aiohttp_client.AioHttpClientInstrumentor._instrument"):
+                    instrumentor = SpinalAioHttpClientInstrumentor()
+                    instrumentor._instrument(tracer_provider=mock_tracer_provider)
+                    trace_config = opentelemetry.instrumentation.aiohttp_client.create_trace_config()
+
+                    mock_start_params = Mock()
+                    mock_start_params.url = URL("https://api.voyageai.com/v1/embeddings")
+                    mock_start_params.method = "POST"
+                    mock_start_params.data = b'{"input": ["test"]}'
+
+                    trace_config_ctx = types.SimpleNamespace()
+                    with patch("sp_obs._internal.core.aiohttp.aiohttp.add_request_params_to_span") as mock_add_params:
+                        await trace_config.on_request_start[-1](None, trace_config_ctx, mock_start_params)
+
+                    mock_add_params.assert_not_called()
+                    assert trace_config_ctx.spinal_span is None
+
+                    # Later callbacks find no span and return without touching the response
+                    await trace_config.on_request_end[-1](None, trace_config_ctx, Mock())
+
+
+def test_record_span_exception_without_event(real_tracer, in_memory_span_exporter):
+    """Test that with record_exceptions off the exception type and message are kept but no event"""
+    span = real_tracer.start_span("spinal.aiohttp")
+    record_span_exception(span, ConnectionError("connection reset"), record_exceptions=False)
+    span.end()
+
+    finished_span = in_memory_span_exporter.get_finished_spans()[0]
+    assert not finished_span.events
+    assert finished_span.attributes.get("error.type") == "ConnectionError"
+    assert finished_span.status.description == "ConnectionError: connection reset"
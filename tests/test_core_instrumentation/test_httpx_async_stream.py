@@ -2,7 +2,9 @@
 
 import asyncio
 import pytest
-from unittest.mock import Mock, AsyncMock
+from unittest.mock import AsyncMock, Mock
+
+from sp_obs._internal.core import background
 from sp_obs._internal.core.httpx.async_stream import AsyncStreamWrapper
 
 from .utils.span_helpers import (
@@ -36,7 +38,7 @@ class TestAsyncStreamWrapper:
         assert wrapper._tracer == mock_tracer
         assert wrapper._parent_context == mock_context
         assert wrapper._parent_attributes == parent_attributes
-        assert wrapper._chunks == []
+        assert wrapper._buffer == bytearray()
 
     @pytest.mark.asyncio
     async def test_aiter_returns_async_iterator(
@@ -89,7 +91,7 @@ class TestAsyncStreamWrapper:
         )
 
         # Mock _process_complete to avoid span creation during test
-        wrapper._process_complete = AsyncMock()
+        wrapper._process_complete = Mock()
 
         # Iterate through wrapper
         collected_chunks = []
@@ -100,9 +102,10 @@ class TestAsyncStreamWrapper:
         assert collected_chunks == test_chunks
 
         # Verify chunks were stored internally
-        assert wrapper._chunks == test_chunks
+        assert wrapper._buffer == b"".join(test_chunks)
 
-        # Verify _process_complete was called
+        # Verify _process_complete was handed to the background worker
+        background.wait_for_pending()
         wrapper._process_complete.assert_called_once()
 
     @pytest.mark.asyncio
@@ -132,7 +135,7 @@ class TestAsyncStreamWrapper:
         )
 
         # Mock _process_complete
-        wrapper._process_complete = AsyncMock()
+        wrapper._process_complete = Mock()
 
         # Iterate through wrapper
         collected_chunks = []
@@ -141,10 +144,11 @@ class TestAsyncStreamWrapper:
 
         # Verify no chunks collected
         assert collected_chunks == []
-        assert wrapper._chunks == []
+        assert wrapper._buffer == bytearray()
 
-        # _process_complete should still be called
-        wrapper._process_complete.assert_called_once()
+        # There is nothing to record, so no work is handed to the background worker
+        background.wait_for_pending()
+        wrapper._process_complete.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_process_complete_creates_span_with_correct_attributes(
@@ -168,7 +172,11 @@ class TestAsyncStreamWrapper:
         mock_httpx_response.request._content = b"async request data"
         mock_httpx_response.request.content = b"async request data"
 
-        parent_attributes = {"async_parent": "async_value"}
+        parent_attributes = {
+            "async_parent": "async_value",
+            "http.host": "api.anthropic.com",
+            "http.url": "https://api.anthropic.com/v1/messages",
+        }
 
         wrapper = AsyncStreamWrapper(
             response=mock_httpx_response,
@@ -179,10 +187,10 @@ class TestAsyncStreamWrapper:
         )
 
         # Simulate chunks being collected
-        wrapper._chunks = test_chunks
+        wrapper._buffer = bytearray(b"".join(test_chunks))
 
         # Call _process_complete
-        await wrapper._process_complete()
+        wrapper._process_complete()
 
         # Get the created span
         finished_spans = in_memory_span_exporter.get_finished_spans()
@@ -234,8 +242,8 @@ class TestAsyncStreamWrapper:
             parent_attributes={},
         )
 
-        wrapper._chunks = test_chunks
-        await wrapper._process_complete()
+        wrapper._buffer = bytearray(b"".join(test_chunks))
+        wrapper._process_complete()
 
         # Should still create span
         finished_spans = in_memory_span_exporter.get_finished_spans()
@@ -267,10 +275,10 @@ class TestAsyncStreamWrapper:
         )
 
         # No chunks collected
-        assert wrapper._chunks == []
+        assert wrapper._buffer == bytearray()
 
         # Call _process_complete
-        await wrapper._process_complete()
+        wrapper._process_complete()
 
         # Should not create any spans
         finished_spans = in_memory_span_exporter.get_finished_spans()
@@ -295,40 +303,64 @@ class TestAsyncStreamWrapper:
             parent_attributes={},
         )
 
-        wrapper._chunks = [b"test"]
+        wrapper._buffer = bytearray(b"test")
 
         # Should not raise exception
-        await wrapper._process_complete()
+        wrapper._process_complete()
 
         # Should log error
         assert "Spinal error processing response" in caplog.text
 
-    def test_getattr_delegates_to_wrapped_stream(
-        self, mock_async_stream, mock_httpx_response, mock_tracer, mock_context
-    ):
-        """Test that __getattr__ delegates to the wrapped stream.
+    @pytest.mark.asyncio
+    async def test_aclose_closes_wrapped_stream(self, mock_httpx_response, mock_tracer, mock_context):
+        """Test that aclose is forwarded to the wrapped stream.
 
-        Tests that attribute access and method calls are properly delegated to the wrapped stream.
+        httpx releases the pooled connection when the response stream is closed.
         """
-        # Set up mock stream with a test attribute
-        mock_async_stream.test_attribute = "async_test_value"
-        mock_async_stream.test_method = Mock(return_value="async_method_result")
+        wrapped_stream = Mock()
+        wrapped_stream.aclose = AsyncMock()
 
         wrapper = AsyncStreamWrapper(
             response=mock_httpx_response,
-            wrapped_stream=mock_async_stream,
+            wrapped_stream=wrapped_stream,
             tracer=mock_tracer,
             parent_context=mock_context,
             parent_attributes={},
         )
 
-        # Test attribute access
-        assert wrapper.test_attribute == "async_test_value"
+        await wrapper.aclose()
+
+        wrapped_stream.aclose.assert_awaited_once_with()
+
+    @pytest.mark.asyncio
+    async def test_body_under_max_body_bytes_not_truncated(
+        self, mock_httpx_response, real_tracer, mock_context, in_memory_span_exporter
+    ):
+        """Test that a body within max_body_bytes is kept whole and not marked as truncated."""
+
+        async def test_stream():
+            yield b"small"
+            yield b"body"
+
+        mock_httpx_response.headers = {"content-type": "application/json"}
+        mock_httpx_response.status_code = 200
+        mock_httpx_response.request.url = "https://api.anthropic.com/v1/messages"
+
+        wrapper = AsyncStreamWrapper(
+            response=mock_httpx_response,
+            wrapped_stream=test_stream(),
+            tracer=real_tracer,
+            parent_context=mock_context,
+            parent_attributes={},
+            max_body_bytes=9,
+        )
+
+        assert [chunk async for chunk in wrapper] == [b"small", b"body"]
+        background.wait_for_pending()
 
-        # Test method call
-        result = wrapper.test_method("async_arg", kwarg="async_kwarg")
-        assert result == "async_method_result"
-        mock_async_stream.test_method.assert_called_once_with("async_arg", kwarg="async_kwarg")
+        span_attrs = in_memory_span_exporter.get_finished_spans()[0].attributes
+        assert bytes(span_attrs["spinal.response.binary_data"]) == b"smallbody"
+        assert "spinal.response.truncated" not in span_attrs
 
     @pytest.mark.asyncio
     async def test_full_async_iteration_workflow(
@@ -380,6 +412,9 @@ class TestAsyncStreamWrapper:
         # Verify chunks were collected correctly
         assert collected_chunks == test_chunks
 
+        # Spans are recorded on the background worker once each stream completes
+        background.wait_for_pending()
+
         # Verify span was created
         finished_spans = in_memory_span_exporter.get_finished_spans()
         assert len(finished_spans) == 1
@@ -454,6 +489,9 @@ class TestAsyncStreamWrapper:
         # Verify chunks match
         assert collected == chunk_data
 
+        # Spans are recorded on the background worker once each stream completes
+        background.wait_for_pending()
+
         # If there were any chunks, should have created a span
         if chunk_data and any(chunk_data):
             finished_spans = in_memory_span_exporter.get_finished_spans()
@@ -548,6 +586,9 @@ class TestAsyncStreamWrapper:
         # Verify all streams completed
         assert len(results) == 3
 
+        # Spans are recorded on the background worker once each stream completes
+        background.wait_for_pending()
+
         # Verify spans were created for each stream
         finished_spans = in_memory_span_exporter.get_finished_spans()
         assert len(finished_spans) == 3
@@ -184,3 +184,35 @@ class TestSpinalHTTPXClientInstrumentor:
                         mock_span.set_attribute.assert_any_call("http.host", "api.anthropic.com")
                         mock_span.set_attribute.assert_any_call(AISpanAttributes.LLM_SYSTEM, "anthropic")
                         mock_span.set_attribute.assert_any_call("spinal.provider", "anthropic")
+
+    def test_non_recording_span_not_buffered(self, mock_tracer_provider, mock_tracer):
+        """Test that responses under a non-recording httpx span are left unwrapped.
+
+        Tests that the body is not buffered when the Spinal span could not be exported.
+        """
+        with patch("sp_obs._internal.core.httpx.httpx.get_tracer", return_value=mock_tracer):
+            instrumentor = SpinalHTTPXClientInstrumentor()
+
+            mock_span = Mock()
+            mock_span.is_recording.return_value = False
+            mock_span.attributes = {SpanAttributes.HTTP_URL: "https://api.openai.com/v1/test"}
+
+            response = Mock(spec=httpx.Response)
+            stream = Mock(spec=SyncByteStream)
+            response.stream = stream
+
+            with patch("sp_obs._internal.core.httpx.httpx.context.get_current"):
+                with patch("sp_obs._internal.core.httpx.httpx.trace.get_current_span", return_value=mock_span):
+                    with patch(
+                        "sp_obs._internal.core.httpx.httpx.opentelemetry.instrumentation.httpx._extract_response",
+                        return_value="result",
+                    ):
+                        instrumentor._instrument(tracer_provider=mock_tracer_provider)
+
+                        import opentelemetry.instrumentation.httpx
+
+                        wrapped_extract = opentelemetry.instrumentation.httpx._extract_response
+                        assert wrapped_extract(response) == "result"
+
+                        mock_span.set_attribute.assert_not_called()
+                        assert response.stream is stream
@@ -1,8 +1,10 @@
 """Tests for HTTPX sync stream wrapper."""
 
+import httpx
 import pytest
 from unittest.mock import Mock
 
+from opentelemetry import trace
 
 from sp_obs._internal.core.httpx.sync_stream import SyncStreamWrapper
 
@@ -37,7 +39,7 @@ class TestSyncStreamWrapper:
         assert wrapper._tracer == mock_tracer
         assert wrapper._parent_context == mock_context
         assert wrapper._parent_attributes == parent_attributes
-        assert wrapper._chunks == []
+        assert wrapper._buffer == bytearray()
 
     def test_iter_collects_chunks(self, mock_sync_stream, mock_httpx_response, mock_tracer, mock_context):
         """Test that __iter__ collects all chunks from the wrapped stream.
@@ -66,7 +68,7 @@ class TestSyncStreamWrapper:
         assert collected_chunks == test_chunks
 
         # Verify chunks were stored internally
-        assert wrapper._chunks == test_chunks
+        assert wrapper._buffer == b"".join(test_chunks)
 
         # Verify _process_complete was called
         wrapper._process_complete.assert_called_once()
@@ -95,7 +97,7 @@ class TestSyncStreamWrapper:
 
         # Verify no chunks collected
         assert collected_chunks == []
-        assert wrapper._chunks == []
+        assert wrapper._buffer == bytearray()
 
         # _process_complete should still be called
         wrapper._process_complete.assert_called_once()
@@ -118,7 +120,11 @@ class TestSyncStreamWrapper:
         mock_httpx_response.request.content = b"request data"
         mock_httpx_response.request.stream = b""
 
-        parent_attributes = {"parent_attr": "parent_value"}
+        parent_attributes = {
+            "parent_attr": "parent_value",
+            "http.host": "api.openai.com",
+            "http.url": "https://api.openai.com/v1/test",
+        }
 
         wrapper = SyncStreamWrapper(
             response=mock_httpx_response,
@@ -129,7 +135,7 @@ class TestSyncStreamWrapper:
         )
 
         # Simulate chunks being collected
-        wrapper._chunks = test_chunks
+        wrapper._buffer = bytearray(b"".join(test_chunks))
 
         # Call _process_complete
         wrapper._process_complete()
@@ -154,6 +160,8 @@ class TestSyncStreamWrapper:
         assert_span_attributes(span, expected_attributes)
         assert_binary_data_captured(span, len(expected_response_data))
         assert_request_data_captured(span, len(b"request data"))
+        assert bytes(span.attributes["spinal.response.binary_data"]) == expected_response_data
+        assert bytes(span.attributes["spinal.request.binary_data"]) == b"request data"
 
     def test_process_complete_handles_empty_chunks(
         self, mock_sync_stream, mock_httpx_response, real_tracer, mock_context, in_memory_span_exporter
@@ -171,7 +179,7 @@ class TestSyncStreamWrapper:
         )
 
         # No chunks collected
-        assert wrapper._chunks == []
+        assert wrapper._buffer == bytearray()
 
         # Call _process_complete
         wrapper._process_complete()
@@ -203,7 +211,7 @@ class TestSyncStreamWrapper:
             parent_attributes={},
         )
 
-        wrapper._chunks = test_chunks
+        wrapper._buffer = bytearray(b"".join(test_chunks))
         wrapper._process_complete()
 
         # Should still create span with available attributes
@@ -213,9 +221,9 @@ class TestSyncStreamWrapper:
         span = finished_spans[0]
         span_attrs = dict(span.attributes) if span.attributes else {}
 
-        # Should have default values for missing headers
-        assert span_attrs.get("content-type") == ""
-        assert span_attrs.get("content-encoding") == ""
+        # Missing headers are left out of the span
+        assert "content-type" not in span_attrs
+        assert "content-encoding" not in span_attrs
         assert span_attrs["http.status_code"] == 200
 
     def test_process_complete_handles_exceptions(
@@ -236,7 +244,7 @@ class TestSyncStreamWrapper:
             parent_attributes={},
         )
 
-        wrapper._chunks = [b"test"]
+        wrapper._buffer = bytearray(b"test")
 
         # Should not raise exception
         wrapper._process_complete()
@@ -244,32 +252,24 @@ class TestSyncStreamWrapper:
         # Should log error
         assert "Spinal error processing response" in caplog.text
 
-    def test_getattr_delegates_to_wrapped_stream(
-        self, mock_sync_stream, mock_httpx_response, mock_tracer, mock_context
-    ):
-        """Test that __getattr__ delegates to the wrapped stream.
+    def test_close_closes_wrapped_stream(self, mock_httpx_response, mock_tracer, mock_context):
+        """Test that close is forwarded to the wrapped stream.
 
-        Tests that attribute access is delegated to the wrapped stream.
+        httpx releases the pooled connection when the response stream is closed.
         """
-        # Set up mock stream with a test attribute
-        mock_sync_stream.test_attribute = "test_value"
-        mock_sync_stream.test_method = Mock(return_value="method_result")
+        wrapped_stream = Mock()
 
         wrapper = SyncStreamWrapper(
             response=mock_httpx_response,
-            wrapped_stream=mock_sync_stream,
+            wrapped_stream=wrapped_stream,
             tracer=mock_tracer,
             parent_context=mock_context,
             parent_attributes={},
         )
 
-        # Test attribute access
-        assert wrapper.test_attribute == "test_value"
+        wrapper.close()
 
-        # Test method call
-        result = wrapper.test_method("arg1", kwarg="kwarg1")
-        assert result == "method_result"
-        mock_sync_stream.test_method.assert_called_once_with("arg1", kwarg="kwarg1")
+        wrapped_stream.close.assert_called_once_with()
 
     def test_full_iteration_workflow(self, mock_httpx_response, real_tracer, mock_context, in_memory_span_exporter):
         """Test the complete workflow from iteration to span creation.
@@ -327,6 +327,85 @@ class TestSyncStreamWrapper:
         span_attrs = dict(span.attributes) if span.attributes else {}
         assert span_attrs["parent_key"] == "parent_val"
 
+    def test_body_capped_at_max_body_bytes(
+        self, mock_httpx_response, real_tracer, mock_context, in_memory_span_exporter
+    ):
+        """Test that a body over max_body_bytes is truncated on the span but passed through in full."""
+        test_chunks = [b"a" * 6, b"b" * 6, b"c" * 6]
+        mock_httpx_response.headers = {"content-type": "application/json"}
+        mock_httpx_response.status_code = 200
+        mock_httpx_response.request.url = "https://api.openai.com/v1/test"
+
+        wrapper = SyncStreamWrapper(
+            response=mock_httpx_response,
+            wrapped_stream=iter(test_chunks),
+            tracer=real_tracer,
+            parent_context=mock_context,
+            parent_attributes={},
+            max_body_bytes=8,
+        )
+
+        assert list(wrapper) == test_chunks
+
+        span_attrs = in_memory_span_exporter.get_finished_spans()[0].attributes
+        assert bytes(span_attrs["spinal.response.binary_data"]) == b"aaaaaabb"
+        assert span_attrs["spinal.response.truncated"] is True
+        assert span_attrs["spinal.response.original_length"] == 18
+
+    def test_body_not_captured(self, mock_httpx_response, real_tracer, mock_context, in_memory_span_exporter):
+        """Test that with capture_body off only the size of the body is recorded."""
+        wrapper = SyncStreamWrapper(
+            response=mock_httpx_response,
+            wrapped_stream=iter([b"not", b"kept"]),
+            tracer=real_tracer,
+            parent_context=mock_context,
+            parent_attributes={},
+            capture_body=False,
+        )
+
+        assert list(wrapper) == [b"not", b"kept"]
+        assert wrapper._buffer == bytearray()
+
+        span_attrs = in_memory_span_exporter.get_finished_spans()[0].attributes
+        assert span_attrs["spinal.response.size"] == 7
+        assert "spinal.response.binary_data" not in span_attrs
+
+    def test_unread_request_body_marked_streaming(
+        self, mock_httpx_response, real_tracer, mock_context, in_memory_span_exporter
+    ):
+        """Test that a request body httpx streamed without reading, such as a multipart upload, is not captured."""
+        mock_httpx_response.request = httpx.Request(
+            "POST", "https://api.openai.com/v1/files", files={"file": b"upload"}
+        )
+        wrapper = SyncStreamWrapper(
+            response=mock_httpx_response,
+            wrapped_stream=iter([b"{}"]),
+            tracer=real_tracer,
+            parent_context=mock_context,
+            parent_attributes={},
+        )
+        list(wrapper)
+
+        span_attrs = in_memory_span_exporter.get_finished_spans()[0].attributes
+        assert "spinal.request.binary_data" not in span_attrs
+        assert span_attrs["spinal.request.content_type"] == "streaming"
+
+    def test_response_span_starts_with_parent(self, mock_httpx_response, real_tracer, in_memory_span_exporter):
+        """Test that the response span is back-dated to the start of the httpx span it belongs to."""
+        with real_tracer.start_as_current_span("POST") as parent_span:
+            wrapper = SyncStreamWrapper(
+                response=mock_httpx_response,
+                wrapped_stream=iter([b"body"]),
+                tracer=real_tracer,
+                parent_context=trace.set_span_in_context(parent_span),
+                parent_attributes={},
+            )
+            list(wrapper)
+
+        response_span, finished_parent = in_memory_span_exporter.get_finished_spans()
+        assert response_span.start_time == finished_parent.start_time
+        assert response_span.parent.span_id == finished_parent.context.span_id
+
     @pytest.mark.parametrize(
         "chunk_data",
         [
@@ -1,5 +1,8 @@
 """Tests for Requests instrumentation wrapper."""
 
+import gc
+import io
+
 import pytest
 from unittest.mock import Mock, patch
 
@@ -46,17 +49,21 @@ class TestSpinalRequestsInstrumentor:
     def test_wrapped_send_creates_spans(
         self, mock_tracer_provider, real_tracer, mock_requests_response, in_memory_span_exporter
     ):
-        """Test that wrapped send creates spans for all requests.
+        """Test that wrapped send creates spans for provider requests.
 
-        Tests that the wrapped Session.send method creates spans for all HTTP requests.
+        Tests that the wrapped Session.send method creates spans for HTTP requests to a recognised provider.
         """
         with patch("sp_obs._internal.core.requests.requests.get_tracer", return_value=real_tracer):
             instrumentor = SpinalRequestsInstrumentor()
 
             # Mock the response
-            mock_requests_response.headers = {"content-type": "application/json"}
+            mock_requests_response.headers = {
+                "content-type": "application/json",
+                "Spb-cost": "5",
+                "x-request-id": "abc",
+            }
             mock_requests_response.status_code = 200
-            mock_requests_response.url = "https://httpbin.org/get"
+            mock_requests_response.url = "https://api.openai.com/v1/models"
             mock_requests_response._content = b"response data"
             mock_requests_response._content_consumed = True
 
@@ -74,7 +81,7 @@ class TestSpinalRequestsInstrumentor:
                     session = Session()
                     session.stream = False  # Non-streaming
                     request = PreparedRequest()
-                    request.url = "https://httpbin.org/get"
+                    request.url = "https://api.openai.com/v1/models"
                     request.body = b"test request body"
 
                     # Call wrapped send
@@ -88,9 +95,37 @@ class TestSpinalRequestsInstrumentor:
                     assert_span_name(span, "spinal.requests")
 
                     # Verify basic attributes
-                    expected_attrs = {"http.status_code": 200, "http.host": "httpbin.org"}
+                    expected_attrs = {"http.status_code": 200, "http.host": "api.openai.com"}
                     assert_span_attributes(span, expected_attrs)
 
+                    # Only the response headers read by a provider are recorded
+                    assert span.attributes["spinal.http.response.header.Spb-cost"] == "5"
+                    assert "spinal.http.response.header.x-request-id" not in span.attributes
+
+    def test_unsupported_host_is_not_traced(self, mock_tracer_provider, real_tracer, in_memory_span_exporter):
+        """Test that requests to hosts that are not a provider are sent without a span."""
+        with patch("sp_obs._internal.core.requests.requests.get_tracer", return_value=real_tracer):
+            instrumentor = SpinalRequestsInstrumentor()
+
+            response = requests.Response()
+            original_send = Mock(return_value=response)
+
+            with patch("opentelemetry.instrumentation.requests.RequestsInstrumentor._instrument"):
+                with patch.object(Session, "send", original_send):
+                    instrumentor._instrument(tracer_provider=mock_tracer_provider)
+
+                    session = Session()
+                    request = PreparedRequest()
+                    request.url = "https://httpbin.org/get"
+                    request.body = None
+
+                    assert Session.send(session, request, stream=True) is response
+                    original_send.assert_called_once_with(session, request, stream=True)
+
+                    # No span was recorded and the response was left unwrapped
+                    assert in_memory_span_exporter.get_finished_spans() == ()
+                    assert not hasattr(response, "_spinal_span_finalizer")
+
     def test_response_data_capture(self, mock_tracer_provider, real_tracer, in_memory_span_exporter):
         """Test response content capture.
 
@@ -184,7 +219,209 @@ class TestSpinalRequestsInstrumentor:
                     # Verify streaming setup was applied
                     # Note: For streaming, span is not ended immediately
                     finished_spans = in_memory_span_exporter.get_finished_spans()
-                    assert len([s for s in finished_spans if s.name == "spinal.requests"]) == 1
+                    spans = [s for s in finished_spans if s.name == "spinal.requests"]
+                    assert len(spans) == 1
+
+                    # The consumed chunks are recorded as one body
+                    assert bytes(spans[0].attributes["spinal.response.binary_data"]) == b"chunk1chunk2"
+                    assert spans[0].attributes["spinal.response.size"] == len(b"chunk1chunk2")
+
+    def test_streaming_content_access(self, mock_tracer_provider, real_tracer, in_memory_span_exporter):
+        """Test that reading content from a streaming response is captured without patching the Response class."""
+        with patch("sp_obs._internal.core.requests.requests.get_tracer", return_value=real_tracer):
+            instrumentor = SpinalRequestsInstrumentor()
+            content_property = requests.Response.content
+
+            response = requests.Response()
+            response.status_code = 200
+            response.headers["content-type"] = "application/json"
+            response.raw = io.BytesIO(b'{"id": "resp_1"}')
+            original_send = Mock(return_value=response)
+
+            with patch("opentelemetry.instrumentation.requests.RequestsInstrumentor._instrument"):
+                with patch.object(Session, "send", original_send):
+                    instrumentor._instrument(tracer_provider=mock_tracer_provider)
+
+                    session = Session()
+                    request = PreparedRequest()
+                    request.url = "https://api.openai.com/v1/responses"
+                    request.body = None
+
+                    assert Session.send(session, request, stream=True).content == b'{"id": "resp_1"}'
+
+                    assert requests.Response.content is content_property
+                    spans = in_memory_span_exporter.get_finished_spans()
+                    assert len(spans) == 1
+                    assert bytes(spans[0].attributes["spinal.response.binary_data"]) == b'{"id": "resp_1"}'
+
+    def test_streaming_span_ends_on_close(self, mock_tracer_provider, real_tracer, in_memory_span_exporter):
+        """Test that closing a streaming response before its body is read ends the span once."""
+        with patch("sp_obs._internal.core.requests.requests.get_tracer", return_value=real_tracer):
+            instrumentor = SpinalRequestsInstrumentor()
+
+            response = requests.Response()
+            response.status_code = 200
+            response.headers["content-type"] = "text/event-stream"
+            raw = io.BytesIO(b"data: {}\n\n")
+            response.raw = raw
+            original_send = Mock(return_value=response)
+
+            with patch("opentelemetry.instrumentation.requests.RequestsInstrumentor._instrument"):
+                with patch.object(Session, "send", original_send):
+                    instrumentor._instrument(tracer_provider=mock_tracer_provider)
+
+                    session = Session()
+                    request = PreparedRequest()
+                    request.url = "https://api.openai.com/v1/responses"
+                    request.body = None
+
+                    Session.send(session, request, stream=True).close()
+                    response.close()
+
+                    assert raw.closed
+                    assert len(in_memory_span_exporter.get_finished_spans()) == 1
+
+    def test_abandoned_streaming_span_ends_on_collection(
+        self, mock_tracer_provider, real_tracer, in_memory_span_exporter
+    ):
+        """Test that a streaming response that is neither read nor closed ends its span once collected."""
+        with patch("sp_obs._internal.core.requests.requests.get_tracer", return_value=real_tracer):
+            instrumentor = SpinalRequestsInstrumentor()
+
+            def original_send(*args, **kwargs):
+                # A fresh response per call, so nothing in the test keeps it alive
+                response = requests.Response()
+                response.status_code = 200
+                response.headers["content-type"] = "text/event-stream"
+                response.raw = io.BytesIO(b"data: {}\n\n")
+                return response
+
+            with patch("opentelemetry.instrumentation.requests.RequestsInstrumentor._instrument"):
+                with patch.object(Session, "send", original_send):
+                    instrumentor._instrument(tracer_provider=mock_tracer_provider)
+
+                    session = Session()
+                    request = PreparedRequest()
+                    request.url = "https://api.openai.com/v1/responses"
+                    request.body = None
+
+                    Session.send(session, request, stream=True)
+                    assert not in_memory_span_exporter.get_finished_spans()
+
+                    gc.collect()
+
+                    assert len(in_memory_span_exporter.get_finished_spans()) == 1
+
+    @pytest.mark.parametrize("read", ["non_streaming", "iter_content", "raw"])
+    def test_response_body_capped(self, mock_tracer_provider, real_tracer, in_memory_span_exporter, read):
+        """Test response bodies past max_body_bytes are cut and marked as truncated, however they are read."""
+        with patch("sp_obs._internal.core.requests.requests.get_tracer", return_value=real_tracer):
+            instrumentor = SpinalRequestsInstrumentor()
+
+            response = requests.Response()
+            response.status_code = 200
+            response.headers["content-type"] = "application/json"
+            if read == "non_streaming":
+                response._content = b'{"id": "resp_1"}'
+            else:
+                response.raw = io.BytesIO(b'{"id": "resp_1"}')
+            original_send = Mock(return_value=response)
+
+            with patch("opentelemetry.instrumentation.requests.RequestsInstrumentor._instrument"):
+                with patch.object(Session, "send", original_send):
+                    instrumentor._instrument(tracer_provider=mock_tracer_provider, max_body_bytes=4)
+
+                    session = Session()
+                    request = PreparedRequest()
+                    request.url = "https://api.openai.com/v1/responses"
+                    request.body = None
+
+                    sent = Session.send(session, request, stream=read != "non_streaming")
+                    if read == "iter_content":
+                        assert b"".join(sent.iter_content(chunk_size=5)) == b'{"id": "resp_1"}'
+                    elif read == "raw":
+                        while sent.raw.read(5):
+                            pass
+                        sent.close()
+
+                    span = in_memory_span_exporter.get_finished_spans()[0]
+                    assert bytes(span.attributes["spinal.response.binary_data"]) == b'{"id'
+                    assert span.attributes["spinal.response.truncated"] is True
+                    assert span.attributes["spinal.response.original_length"] == 16
+                    assert span.attributes["spinal.response.size"] == 16
+
+    @pytest.mark.parametrize("read", ["non_streaming", "iter_content", "raw"])
+    def test_response_body_not_captured(self, mock_tracer_provider, real_tracer, in_memory_span_exporter, read):
+        """Test that with capture_body off only the size of the response body is recorded, however it is read."""
+        with patch("sp_obs._internal.core.requests.requests.get_tracer", return_value=real_tracer):
+            instrumentor = SpinalRequestsInstrumentor()
+
+            response = requests.Response()
+            response.status_code = 200
+            response.headers["content-type"] = "application/json"
+            if read == "non_streaming":
+                response._content = b'{"id": "resp_1"}'
+            else:
+                response.raw = io.BytesIO(b'{"id": "resp_1"}')
+            original_send = Mock(return_value=response)
+
+            with patch("opentelemetry.instrumentation.requests.RequestsInstrumentor._instrument"):
+                with patch.object(Session, "send", original_send):
+                    instrumentor._instrument(tracer_provider=mock_tracer_provider, capture_body=False)
+
+                    session = Session()
+                    request = PreparedRequest()
+                    request.url = "https://api.openai.com/v1/responses"
+                    request.body = None
+
+                    sent = Session.send(session, request, stream=read != "non_streaming")
+                    if read == "iter_content":
+                        assert b"".join(sent.iter_content(chunk_size=5)) == b'{"id": "resp_1"}'
+                    elif read == "raw":
+                        while sent.raw.read(5):
+                            pass
+                        sent.close()
+
+                    span = in_memory_span_exporter.get_finished_spans()[0]
+                    assert "spinal.response.binary_data" not in span.attributes
+                    assert span.attributes["spinal.response.size"] == 16
+
+    @pytest.mark.parametrize(
+        "body,max_body_bytes,expected_attrs",
+        [
+            (b'{"model": "gpt-4o"}', 0, {"spinal.request.binary_data": b'{"model": "gpt-4o"}'}),
+            ('{"model": "gpt-4o"}', 0, {"spinal.request.binary_data": '{"model": "gpt-4o"}'}),
+            (b'{"model": "gpt-4o"}', 8, {"spinal.request.size": 19}),
+            (iter([b"chunk"]), 0, {"spinal.request.content_type": "streaming"}),
+        ],
+    )
+    def test_request_body_capture(
+        self, mock_tracer_provider, real_tracer, in_memory_span_exporter, body, max_body_bytes, expected_attrs
+    ):
+        """Test request bodies are recorded in full, and only their size past max_body_bytes."""
+        with patch("sp_obs._internal.core.requests.requests.get_tracer", return_value=real_tracer):
+            instrumentor = SpinalRequestsInstrumentor()
+
+            response = requests.Response()
+            response.status_code = 200
+            response._content = b"{}"
+            original_send = Mock(return_value=response)
+
+            with patch("opentelemetry.instrumentation.requests.RequestsInstrumentor._instrument"):
+                with patch.object(Session, "send", original_send):
+                    instrumentor._instrument(tracer_provider=mock_tracer_provider, max_body_bytes=max_body_bytes)
+
+                    session = Session()
+                    request = PreparedRequest()
+                    request.url = "https://api.openai.com/v1/responses"
+                    request.body = body
+
+                    Session.send(session, request)
+
+                    span = in_memory_span_exporter.get_finished_spans()[0]
+                    assert_span_attributes(span, expected_attrs)
+                    if "spinal.request.binary_data" not in expected_attrs:
+                        assert "spinal.request.binary_data" not in span.attributes
 
     def test_exception_handling(self, mock_tracer_provider, real_tracer, in_memory_span_exporter):
         """Test exception handling and error status recording.
@@ -245,7 +482,7 @@ class TestSpinalRequestsInstrumentor:
             with patch("opentelemetry.instrumentation.requests.RequestsInstrumentor._instrument"):
                 with patch.object(Session, "send", original_send):
                     # Mock redact_url to test it's being used
-                    with patch("sp_obs._internal.core.requests.requests.redact_url") as mock_redact:
+                    with patch("sp_obs.utils.redact_url") as mock_redact:
                         mock_redact.return_value = "https://api.openai.com/v1/***"
 
                         instrumentor._instrument(tracer_provider=mock_tracer_provider)
@@ -14,8 +14,8 @@ def assert_span_attributes(span: ReadableSpan, expected_attrs: Dict[str, Any]):
 
         actual_value = span_attrs[key]
 
-        # Handle memoryview comparisons
-        if isinstance(expected_value, (bytes, memoryview)) and isinstance(actual_value, memoryview):
+        # Bodies set as a memoryview are stored by OpenTelemetry as a tuple of ints
+        if isinstance(expected_value, (bytes, memoryview)) and isinstance(actual_value, (memoryview, tuple)):
             assert bytes(actual_value) == bytes(expected_value), (
                 f"Binary data mismatch for '{key}': expected {bytes(expected_value)}, got {bytes(actual_value)}"
             )
@@ -38,8 +38,8 @@ def assert_binary_data_captured(span: ReadableSpan, expected_size: Optional[int]
 
     binary_data = span_attrs["spinal.response.binary_data"]
     # OpenTelemetry converts memoryview to tuple when storing as span attributes
-    assert isinstance(binary_data, (memoryview, tuple)), (
-        f"Binary data should be memoryview or tuple (after OTel processing), got {type(binary_data)}"
+    assert isinstance(binary_data, (bytes, memoryview, tuple)), (
+        f"Binary data should be bytes, memoryview or tuple (after OTel processing), got {type(binary_data)}"
     )
 
     if expected_size is not None:
@@ -54,8 +54,8 @@ def assert_request_data_captured(span: ReadableSpan, expected_size: Optional[int
     assert "spinal.request.binary_data" in span_attrs, "Request binary data not captured in span attributes"
 
     binary_data = span_attrs["spinal.request.binary_data"]
-    assert isinstance(binary_data, (memoryview, tuple)), (
-        f"Binary data should be memoryview or tuple (after OTel processing), got {type(binary_data)}"
+    assert isinstance(binary_data, (bytes, memoryview, tuple)), (
+        f"Binary data should be bytes, memoryview or tuple (after OTel processing), got {type(binary_data)}"
     )
 
     if expected_size is not None:
@@ -0,0 +1,147 @@
+"""
+Unit tests for response body decoding in SpinalSpanExporter
+"""
+
+import pytest
+
+from sp_obs._internal.config import SpinalConfig
+from sp_obs._internal.exporter import SpinalSpanExporter
+
+
+@pytest.fixture
+def exporter():
+    SpinalSpanExporter._instance = None
+    SpinalSpanExporter._initialized = False
+    exporter = SpinalSpanExporter(SpinalConfig(endpoint="https://api.example.com", api_key="test-key"))
+    yield exporter
+    exporter.shutdown()
+    SpinalSpanExporter._instance = None
+    SpinalSpanExporter._initialized = False
+
+
+class TestDecodeResponseBinaryData:
+    """Test decode_response_binary_data"""
+
+    def test_audio_size_without_body(self, exporter):
+        """Test audio responses whose body was not buffered report their recorded size"""
+        attributes = {
+            "spinal.provider": "elevenlabs",
+            "content-type": "audio/mpeg",
+            "spinal.response.size": 300,
+        }
+
+        decoded = exporter.decode_response_binary_data(attributes)
+
+        assert decoded["audio_size_bytes"] == 300
+        assert decoded["audio_format"] == "audio/mpeg"
+
+    def test_json_body(self, exporter):
+        """Test buffered JSON bodies are parsed into attributes"""
+        attributes = {
+            "spinal.provider": "voyageai",
+            "content-type": "application/json",
+            "spinal.response.binary_data": b'{"usage": {"total_tokens": 5}}',
+            "spinal.response.size": 30,
+        }
+
+        decoded = exporter.decode_response_binary_data(attributes)
+
+        assert "spinal.response.binary_data" not in decoded
+        assert decoded["content-type"] == "application/json"
+
+    def test_no_body_or_size(self, exporter):
+        """Test spans without a response body are left untouched"""
+        attributes = {"spinal.provider": "openai", "content-type": "application/json"}
+
+        assert exporter.decode_response_binary_data(dict(attributes)) == attributes
+
+    def test_json_size_without_body(self, exporter):
+        """Test JSON responses whose body was not captured keep their size without a parse error"""
+        attributes = {
+            "spinal.provider": "openai",
+            "content-type": "application/json",
+            "spinal.response.size": 120,
+        }
+
+        decoded = exporter.decode_response_binary_data(attributes)
+
+        assert decoded["spinal.response.size"] == 120
+        assert "parse_error" not in decoded
+
+    def test_event_stream_body(self, exporter):
+        """Test buffered event streams are handed to the provider and parsed from bytes"""
+        attributes = {
+            "spinal.provider": "perplexity",
+            "content-type": "text/event-stream",
+            "spinal.response.binary_data": (
+                b'data: {"model": "sonar", "usage": {"total_tokens": 7}}\n\n'
+                b'data: {"model": "sonar", "choices": [{"delta": {"content": "caf\xc3\xa9"}}]}\n\n'
+                b"data: [DONE]\n\n"
+            ),
+        }
+
+        decoded = exporter.decode_response_binary_data(attributes)
+
+        assert decoded["model"] == "sonar"
+        assert decoded["usage"] == {"total_tokens": 7}
+
+    def test_json_body_in_windows_1252(self, exporter):
+        """Test JSON bodies that are not UTF-8 are still parsed after decoding"""
+        attributes = {
+            "spinal.provider": "voyageai",
+            "content-type": "application/json",
+            "spinal.response.binary_data": b'{"model": "caf\xe9", "usage": {"total_tokens": 5}}',
+        }
+
+        decoded = exporter.decode_response_binary_data(attributes)
+
+        assert decoded["usage"] == {"total_tokens": 5}
+
+    def test_invalid_json_body_kept_as_raw_content(self, exporter):
+        """Test bodies that are not JSON despite their content type are kept as text"""
+        attributes = {
+            "spinal.provider": "openai",
+            "content-type": "application/json",
+            "spinal.response.binary_data": b"<html>not json</html>",
+        }
+
+        decoded = exporter.decode_response_binary_data(attributes)
+
+        assert decoded["raw_content"] == "<html>not json</html>"
+        assert "parse_error" in decoded
+
+    def test_response_headers_parsed_by_provider(self, exporter):
+        """Test recorded response headers are replaced by what the provider reads from them"""
+        attributes = {
+            "spinal.provider": "scrapingbee",
+            "content-type": "text/html",
+            "spinal.response.binary_data": b"<html></html>",
+            "spinal.http.response.header.Spb-cost": "5",
+        }
+
+        decoded = exporter.decode_response_binary_data(attributes)
+
+        assert decoded["cost"] == "5"
+        assert decoded["content-type"] == "text/html"
+        assert not any(key.startswith("spinal.http.response.header.") for key in decoded)
+
+    @pytest.mark.parametrize(
+        "raw_data",
+        [
+            tuple(b'{"usage": {"total_tokens": 5}}'),
+            '{"usage": {"total_tokens": 5}}',
+            b'{"usage": {"total_tokens": 5}}',
+        ],
+        ids=["memoryview", "bytes-before-otel-1.45", "bytes"],
+    )
+    def test_body_as_stored_by_each_sdk_version(self, exporter, raw_data):
+        """Test bodies are parsed whether OpenTelemetry stored them as a tuple of ints, a str or bytes"""
+        attributes = {
+            "spinal.provider": "voyageai",
+            "content-type": "application/json",
+            "spinal.response.binary_data": raw_data,
+        }
+
+        decoded = exporter.decode_response_binary_data(attributes)
+
+        assert decoded["usage"] == {"total_tokens": 5}
@@ -0,0 +1,172 @@
+"""
+Unit tests for concurrent batch export in SpinalSpanExporter
+"""
+
+import gzip
+import threading
+from types import MappingProxyType
+from unittest.mock import MagicMock
+
+import orjson
+import pytest
+from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.sdk.trace.export import SpanExportResult
+from opentelemetry.trace import SpanContext
+
+from sp_obs._internal.config import SpinalConfig
+from sp_obs._internal.exporter import SpinalSpanExporter
+
+
+@pytest.fixture
+def exporter_factory():
+    """Build fresh SpinalSpanExporter singletons and shut them down afterwards"""
+    created = []
+
+    def factory(**config_kwargs):
+        SpinalSpanExporter._instance = None
+        SpinalSpanExporter._initialized = False
+        config = SpinalConfig(endpoint="https://api.example.com", api_key="test-key", **config_kwargs)
+        exporter = SpinalSpanExporter(config)
+        created.append(exporter)
+        return exporter
+
+    yield factory
+
+    for exporter in created:
+        exporter.shutdown()
+    SpinalSpanExporter._instance = None
+    SpinalSpanExporter._initialized = False
+
+
+class TestExportConsumers:
+    """Test export dispatch with one and many consumers"""
+
+    def test_single_consumer_posts_synchronously(self, exporter_factory):
+        """Test a single consumer returns the HTTP result directly"""
+        exporter = exporter_factory(export_consumers=1)
+        exporter._session.post = MagicMock(return_value=MagicMock(status_code=500, text="error"))
+
+        assert exporter._executor is None
+        assert exporter.export([]) == SpanExportResult.FAILURE
+        exporter._session.post.assert_called_once()
+
+    def test_multiple_consumers_post_concurrently(self, exporter_factory):
+        """Test batches are in flight together and force_flush waits for them"""
+        exporter = exporter_factory(export_consumers=2)
+        both_in_flight = threading.Barrier(2, timeout=5)
+
+        def post(*args, **kwargs):
+            both_in_flight.wait()
+            return MagicMock(status_code=200)
+
+        exporter._session.post = MagicMock(side_effect=post)
+
+        assert exporter.export([]) == SpanExportResult.SUCCESS
+        assert exporter.export([]) == SpanExportResult.SUCCESS
+        assert exporter.force_flush(timeout_millis=5000)
+
+        assert exporter._session.post.call_count == 2
+        assert not exporter._pending
+
+    def test_pool_failures_reported_by_force_flush(self, exporter_factory):
+        """Test batches that fail in the export pool make the next force_flush fail, once"""
+        exporter = exporter_factory(export_consumers=2)
+        exporter._session.post = MagicMock(return_value=MagicMock(status_code=500, text="error"))
+
+        assert exporter.export([]) == SpanExportResult.SUCCESS
+        assert not exporter.force_flush(timeout_millis=5000)
+        assert exporter.force_flush(timeout_millis=5000)
+
+    def test_export_latency_average(self, exporter_factory):
+        """Test concurrent exports all feed the latency average"""
+        exporter = exporter_factory(export_consumers=4)
+        exporter._session.post = MagicMock(return_value=MagicMock(status_code=200))
+
+        for _ in range(20):
+            assert exporter.export([]) == SpanExportResult.SUCCESS
+        assert exporter.force_flush(timeout_millis=5000)
+
+        assert exporter._session.post.call_count == 20
+        assert exporter.export_latency_millis > 0
+
+    def test_payload_is_posted_as_encoded_json(self, exporter_factory):
+        """Test the batch is encoded once and posted as a JSON body"""
+        exporter = exporter_factory(export_consumers=1)
+        exporter._session.post = MagicMock(return_value=MagicMock(status_code=200))
+
+        assert exporter.export([]) == SpanExportResult.SUCCESS
+
+        body = exporter._session.post.call_args.kwargs["content"]
+        assert orjson.loads(body) == {"spans": []}
+        assert exporter._session.headers["Content-Type"] == "application/json"
+
+    def test_ids_are_zero_padded_hex(self, exporter_factory):
+        """Test trace and span IDs are posted as fixed-width lower-case hex"""
+        exporter = exporter_factory(export_consumers=1)
+        exporter._session.post = MagicMock(return_value=MagicMock(status_code=200))
+        span = ReadableSpan(
+            name="spinal.test",
+            context=SpanContext(trace_id=0xABC, span_id=0x12, is_remote=False),
+            parent=SpanContext(trace_id=0xABC, span_id=2**64 - 1, is_remote=False),
+            attributes={},
+        )
+
+        assert exporter.export([span]) == SpanExportResult.SUCCESS
+
+        (posted,) = orjson.loads(exporter._session.post.call_args.kwargs["content"])["spans"]
+        assert posted["trace_id"] == format(0xABC, "032x")
+        assert posted["span_id"] == "0000000000000012"
+        assert posted["parent_span_id"] == "ffffffffffffffff"
+
+    @pytest.mark.parametrize("span_count,compressed", [(0, False), (20, True)])
+    def test_gzip_export_compression(self, exporter_factory, span_count, compressed):
+        """Test batches past the size threshold are gzipped and sent with a Content-Encoding header"""
+        exporter = exporter_factory(export_consumers=1, export_compression="gzip")
+        exporter._session.post = MagicMock(return_value=MagicMock(status_code=200))
+        spans = [
+            ReadableSpan(name="spinal.test", context=SpanContext(trace_id=1, span_id=i + 1, is_remote=False))
+            for i in range(span_count)
+        ]
+
+        assert exporter.export(spans) == SpanExportResult.SUCCESS
+
+        kwargs = exporter._session.post.call_args.kwargs
+        if compressed:
+            assert kwargs["headers"] == {"Content-Encoding": "gzip"}
+            body = gzip.decompress(kwargs["content"])
+        else:
+            assert kwargs["headers"] is None
+            body = kwargs["content"]
+        assert len(orjson.loads(body)["spans"]) == span_count
+
+    @pytest.mark.parametrize("scrubber", [None, False])
+    def test_span_without_body_attributes_exported(self, exporter_factory, scrubber):
+        """Test attributes of spans without a body are exported with the default scrubber and without one"""
+        exporter = exporter_factory(export_consumers=1, scrubber=scrubber)
+        exporter._session.post = MagicMock(return_value=MagicMock(status_code=200))
+        span = ReadableSpan(
+            name="spinal.test",
+            context=SpanContext(trace_id=1, span_id=1, is_remote=False),
+            attributes={"spinal.provider": "openai", "spinal.user_id": "u1"},
+        )
+
+        assert exporter.export([span]) == SpanExportResult.SUCCESS
+
+        (posted,) = orjson.loads(exporter._session.post.call_args.kwargs["content"])["spans"]
+        assert posted["attributes"] == {"spinal.provider": "openai", "spinal.user_id": "u1"}
+        assert dict(span.attributes) == {"spinal.provider": "openai", "spinal.user_id": "u1"}
+
+    def test_span_attributes_passed_through_without_scrubber(self, exporter_factory):
+        """Test attributes of spans without a body are not copied when scrubbing is off"""
+        exporter = exporter_factory(export_consumers=1, scrubber=False)
+        span = ReadableSpan(
+            name="spinal.test",
+            context=SpanContext(trace_id=1, span_id=1, is_remote=False),
+            attributes={"spinal.provider": "openai"},
+        )
+
+        # ReadableSpan hands out a fresh read-only view on each access, so the view itself is checked for rather than
+        # the same object
+        attributes = exporter._span_to_dict(span, None)["attributes"]
+        assert isinstance(attributes, MappingProxyType)
+        assert attributes == span.attributes
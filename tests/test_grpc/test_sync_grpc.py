@@ -1,7 +1,8 @@
 """Tests for gRPC client instrumentation with service pattern matching"""
 
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, PropertyMock
+from weakref import WeakKeyDictionary
 
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import SimpleSpanProcessor
@@ -13,7 +14,18 @@ from sp_obs._internal.core.grpc.grpc import (
     _extract_grpc_metadata,
     _extract_service_name,
 )
-from sp_obs._internal.core.grpc.grpc_integrations import match_grpc_service
+from sp_obs._internal.core.grpc.grpc_integrations import (
+    GRPC_SERVICE_PATTERNS,
+    _compile_service_patterns,
+    match_grpc_service,
+    register_grpc_service_pattern,
+)
+from sp_obs._internal.core.grpc.grpc_utils import (
+    _add_response_metadata,
+    _attach_child_span,
+    _detach_child_span,
+    _get_child_span,
+)
 
 
 class TestGrpcServiceMatching(unittest.TestCase):
@@ -48,6 +60,65 @@ class TestGrpcServiceMatching(unittest.TestCase):
         provider = match_grpc_service(None)
         self.assertIsNone(provider)
 
+    def test_most_specific_pattern_wins(self):
+        """Test that compiled patterns prefer the most specific glob"""
+        pattern, group_providers = _compile_service_patterns(
+            {"google.cloud.*": "gcp", "google.cloud.vision.*": "gcp-vision"}
+        )
+
+        self.assertEqual(
+            group_providers[pattern.match("google.cloud.vision.v1.ImageAnnotator").lastgroup], "gcp-vision"
+        )
+        self.assertEqual(group_providers[pattern.match("google.cloud.storage.v2.Storage").lastgroup], "gcp")
+        self.assertIsNone(pattern.match("google.cloudx"))
+
+    def test_register_pattern_after_import(self):
+        """Test that patterns registered at runtime are matched, even for names already looked up"""
+        service = "acme.ocr.v1.Recognizer"
+        self.assertIsNone(match_grpc_service(service))
+
+        register_grpc_service_pattern("acme.ocr.*", "acme-ocr")
+        try:
+            self.assertEqual(match_grpc_service(service), "acme-ocr")
+            self.assertEqual(match_grpc_service("google.cloud.vision.v1.ImageAnnotator"), "gcp-vision")
+        finally:
+            del GRPC_SERVICE_PATTERNS["acme.ocr.*"]
+            register_grpc_service_pattern("google.cloud.vision.*", "gcp-vision")
+
+        self.assertIsNone(match_grpc_service(service))
+
+
+class TestGrpcChildSpanRegistry(unittest.TestCase):
+    """Test cases for associating Spinal child spans with parent gRPC spans"""
+
+    def test_child_span_stored_on_parent(self):
+        """Test child spans live on the parent span and are removed on detach"""
+        fallback = WeakKeyDictionary()
+        parent_span, child_span = Mock(), Mock()
+
+        _attach_child_span(parent_span, child_span, fallback)
+        self.assertIs(_get_child_span(parent_span, fallback), child_span)
+        self.assertEqual(len(fallback), 0)
+
+        _detach_child_span(parent_span, fallback)
+        self.assertIsNone(_get_child_span(parent_span, fallback))
+
+    def test_child_span_falls_back_without_instance_dict(self):
+        """Test parent spans without an instance dict use the weak-keyed registry"""
+
+        class SlottedSpan:
+            __slots__ = ("__weakref__",)
+
+        fallback = WeakKeyDictionary()
+        parent_span, child_span = SlottedSpan(), Mock()
+
+        _attach_child_span(parent_span, child_span, fallback)
+        self.assertIs(fallback[parent_span], child_span)
+        self.assertIs(_get_child_span(parent_span, fallback), child_span)
+
+        _detach_child_span(parent_span, fallback)
+        self.assertNotIn(parent_span, fallback)
+
 
 class TestGrpcMetadataExtraction(unittest.TestCase):
     """Test cases for gRPC metadata extraction"""
@@ -110,6 +181,38 @@ class TestGrpcMetadataExtraction(unittest.TestCase):
         self.assertNotIn("grpc.service", metadata)
 
 
+class TestGrpcResponseMetadata(unittest.TestCase):
+    """Test cases for copying response metadata onto the child span"""
+
+    def setUp(self):
+        self.tracer = TracerProvider().get_tracer(__name__)
+
+    def test_exception_events_copied_from_ended_parent(self):
+        """Test exception details are copied even after the parent span has ended"""
+        parent_span = self.tracer.start_span("grpc", attributes={"rpc.grpc.status_code": 14})
+        parent_span.record_exception(RuntimeError("unavailable"))
+        parent_span.end()
+        child_span = self.tracer.start_span(SPINAL_GRPC_REQUEST_SPAN_NAME)
+
+        _add_response_metadata(child_span, parent_span)
+
+        self.assertEqual(child_span.attributes["grpc.status_code"], 14)
+        self.assertEqual(child_span.attributes["error.type"], "RuntimeError")
+        self.assertEqual(child_span.attributes["error.message"], "unavailable")
+
+    def test_successful_call_skips_events(self):
+        """Test a zero status code marks the child OK without reading parent events"""
+        parent_span = Mock()
+        parent_span.attributes = {"rpc.grpc.status_code": 0}
+        type(parent_span).events = PropertyMock(side_effect=AssertionError("events should not be read"))
+        child_span = self.tracer.start_span(SPINAL_GRPC_REQUEST_SPAN_NAME)
+
+        _add_response_metadata(child_span, parent_span)
+
+        self.assertEqual(child_span.attributes["grpc.status_code"], 0)
+        self.assertNotIn("error", child_span.attributes)
+
+
 class TestGrpcInstrumentation(unittest.TestCase):
     """Test cases for gRPC client instrumentation"""
 
@@ -188,6 +291,19 @@ class TestGrpcInstrumentation(unittest.TestCase):
         # For now, verify the instrumentor was set up correctly
         self.assertIsNotNone(self.instrumentor)
 
+    def test_trace_result_patched_once(self):
+        """Test that re-instrumenting does not stack _trace_result wrappers and uninstrument restores it"""
+        from opentelemetry.instrumentation.grpc import _client
+
+        wrapped = _client.OpenTelemetryClientInterceptor._trace_result
+        original = wrapped._spinal_original
+
+        self.instrumentor.uninstrument()
+        self.assertIs(_client.OpenTelemetryClientInterceptor._trace_result, original)
+
+        self.instrumentor.instrument(tracer_provider=self.tracer_provider)
+        self.assertIs(_client.OpenTelemetryClientInterceptor._trace_result._spinal_original, original)
+
     def test_metadata_only_capture(self):
         """Test that only metadata is captured, not binary data"""
         # Create a test span with gRPC attributes
@@ -0,0 +1,153 @@
+"""
+Unit tests for batching in SpinalSpanProcessor
+"""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sp_obs._internal.config import SpinalConfig
+from sp_obs._internal.core import background
+from sp_obs._internal.processor import SpinalSpanProcessor
+
+
+def make_span(
+    name: str = "spinal.httpx.sync.response", provider: str | None = "openai", trace_id: int = 1
+) -> MagicMock:
+    span = MagicMock()
+    span.name = name
+    span.context.trace_id = trace_id
+    span.attributes = {"spinal.provider": provider} if provider else {}
+    return span
+
+
+@pytest.fixture
+def processor_factory():
+    """Build processors with a mocked exporter and shut them down afterwards"""
+    created = []
+
+    def factory(**config_kwargs):
+        config = SpinalConfig(endpoint="https://api.example.com", api_key="test-key", **config_kwargs)
+        with patch("sp_obs._internal.processor.SpinalSpanExporter") as mock_exporter_cls:
+            processor = SpinalSpanProcessor(config)
+        processor.exporter = mock_exporter_cls.return_value
+        processor.exporter.force_flush.return_value = True
+        processor.exporter.export_latency_millis = 0.0
+        created.append(processor)
+        return processor
+
+    yield factory
+
+    for processor in created:
+        processor.shutdown()
+
+
+class TestSpinalSpanProcessorBatching:
+    """Test the queue and batch export in SpinalSpanProcessor"""
+
+    def test_force_flush_exports_in_batches_in_order(self, processor_factory):
+        """Test queued spans are exported oldest first in batches of max_export_batch_size"""
+        processor = processor_factory(max_queue_size=100, max_export_batch_size=2, schedule_delay_millis=60000)
+        spans = [make_span() for _ in range(5)]
+        with processor._export_lock:
+            for span in spans:
+                processor.on_end(span)
+
+        assert processor.force_flush()
+
+        batches = [call.args[0] for call in processor.exporter.export.call_args_list]
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert [span for batch in batches for span in batch] == spans
+
+    def test_force_flush_waits_for_background_spans(self, processor_factory):
+        """Test spans still being recorded on the background worker are included in the flush"""
+        processor = processor_factory(schedule_delay_millis=60000)
+        span = make_span()
+        released = threading.Event()
+
+        def record():
+            released.wait(1)
+            processor.on_end(span)
+
+        background.submit(record)
+        threading.Timer(0.05, released.set).start()
+
+        assert processor.force_flush()
+        processor.exporter.export.assert_called_once_with([span])
+
+    def test_coalesce_by_trace_groups_spans(self, processor_factory):
+        """Test spans are grouped by trace, keeping arrival order within a trace"""
+        processor = processor_factory(
+            max_queue_size=100, max_export_batch_size=2, schedule_delay_millis=60000, coalesce_by_trace=True
+        )
+        spans = [make_span(trace_id=trace_id) for trace_id in (2, 1, 2, 1)]
+        with processor._export_lock:
+            for span in spans:
+                processor.on_end(span)
+
+        processor.force_flush()
+
+        batches = [call.args[0] for call in processor.exporter.export.call_args_list]
+        assert batches == [[spans[1], spans[3]], [spans[0], spans[2]]]
+
+    def test_unrelated_spans_are_not_queued(self, processor_factory):
+        """Test spans that are not Spinal spans never reach the exporter"""
+        processor = processor_factory(schedule_delay_millis=60000)
+        processor.on_end(make_span(name="http.request"))
+        processor.on_end(make_span(provider=None))
+
+        processor.force_flush()
+
+        processor.exporter.export.assert_not_called()
+
+    def test_full_queue_drops_spans(self, processor_factory):
+        """Test spans beyond max_queue_size are dropped and counted"""
+        processor = processor_factory(max_queue_size=2, max_export_batch_size=2, schedule_delay_millis=60000)
+        with processor._export_lock:
+            for _ in range(3):
+                processor.on_end(make_span())
+            assert len(processor._queue) == 2
+
+        assert processor.dropped_spans == 1
+
+    def test_shutdown_exports_remaining_spans(self, processor_factory):
+        """Test shutdown drains the queue before shutting down the exporter"""
+        processor = processor_factory(max_export_batch_size=10, schedule_delay_millis=60000)
+        processor.on_end(make_span())
+
+        processor.shutdown()
+
+        processor.exporter.export.assert_called_once()
+        processor.exporter.shutdown.assert_called_once()
+        assert not processor.force_flush()
+
+    def test_slow_exports_shed_non_billing_spans(self, processor_factory):
+        """Test non-billing spans are shed once export latency is above target, billing spans never are"""
+        processor = processor_factory(export_latency_target_millis=1000, schedule_delay_millis=60000)
+        processor.exporter.export_latency_millis = 5000.0
+        processor.force_flush()
+
+        billing_span = make_span(name="spinal.billing_span", provider=None)
+        billing_span.attributes["is_billing_span"] = True
+        with patch("sp_obs._internal.processor.random.random", return_value=0.0):
+            processor.on_end(make_span())
+            processor.on_end(billing_span)
+
+        assert processor.dropped_low_priority_spans == 1
+        assert processor._queue == [billing_span]
+
+        # Latency back under target lets everything through again
+        processor.exporter.export_latency_millis = 100.0
+        processor.force_flush()
+        with patch("sp_obs._internal.processor.random.random", return_value=0.0):
+            processor.on_end(make_span())
+        assert processor.dropped_low_priority_spans == 1
+
+    def test_invalid_batch_size_rejected(self):
+        """Test max_export_batch_size larger than max_queue_size is rejected"""
+        config = SpinalConfig(
+            endpoint="https://api.example.com", api_key="test-key", max_queue_size=10, max_export_batch_size=20
+        )
+        with pytest.raises(ValueError):
+            SpinalSpanProcessor(config)
@@ -84,3 +84,70 @@ class TestAnthropicProvider:
         response_attributes = {"metadata": "some_value"}
         parsed = provider.parse_response_attributes(response_attributes)
         assert parsed == {"metadata": "some_value"}
+
+    def test_handle_event_stream(self):
+        """Test that a streamed message is reassembled from its server-sent events"""
+        provider = get_provider("anthropic")
+
+        event_stream = (
+            "event: message_start\n"
+            'data: {"type":"message_start","message":{"id":"msg_01","type":"message","role":"assistant",'
+            '"model":"claude-sonnet-4-20250514","content":[],"usage":{"input_tokens":25,"output_tokens":1}}}\n'
+            "\n"
+            "event: content_block_start\n"
+            'data: {"type":"content_block_start","index":0,"content_block":{"type":"text","text":""}}\n'
+            "\n"
+            "event: ping\n"
+            'data: {"type": "ping"}\n'
+            "\n"
+            "event: content_block_delta\n"
+            'data: {"type":"content_block_delta","index":0,"delta":{"type":"text_delta","text":"Hello"}}\n'
+            "\n"
+            "event: content_block_delta\n"
+            'data: {"type":"content_block_delta","index":0,"delta":{"type":"text_delta","text":", world"}}\n'
+            "\n"
+            "event: content_block_stop\n"
+            'data: {"type":"content_block_stop","index":0}\n'
+            "\n"
+            "event: message_delta\n"
+            'data: {"type":"message_delta","delta":{"stop_reason":"end_turn","stop_sequence":null},'
+            '"usage":{"output_tokens":15}}\n'
+            "\n"
+            "event: message_stop\n"
+            'data: {"type":"message_stop"}\n'
+            "\n"
+        )
+
+        response = provider.handle_event_stream(event_stream.encode())
+
+        assert response == {
+            "id": "msg_01",
+            "type": "message",
+            "role": "assistant",
+            "model": "claude-sonnet-4-20250514",
+            "content": [{"type": "text", "text": "Hello, world"}],
+            "stop_reason": "end_turn",
+            "stop_sequence": None,
+            "usage": {"input_tokens": 25, "output_tokens": 15},
+        }
+        # CRLF line endings are parsed the same way
+        assert provider.handle_event_stream(event_stream.replace("\n", "\r\n").encode()) == response
+
+    def test_handle_event_stream_skips_malformed_events(self):
+        """Test that an event whose payload is not valid JSON is skipped without losing the rest of the stream"""
+        provider = get_provider("anthropic")
+
+        event_stream = (
+            "event: content_block_start\n"
+            'data: {"type":"content_block_start","index":0,"content_block":{"type":"text","text":"Hi"}}\n'
+            "\n"
+            "event: content_block_delta\n"
+            'data: {"type":"content_block_delta","index":0,"delta":{"type":"text_del\n'
+            "\n"
+            "event: content_block_delta\n"
+            'data: {"type":"content_block_delta","index":0,"delta":{"type":"text_delta","text":" there"}}\n'
+        )
+
+        response = provider.handle_event_stream(event_stream.encode())
+
+        assert response["content"] == [{"type": "text", "text": "Hi there"}]
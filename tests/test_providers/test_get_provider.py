@@ -0,0 +1,26 @@
+import pytest
+
+from sp_obs._internal.core.providers import _PROVIDERS, BaseProvider, get_provider
+
+
+class TestGetProvider:
+    """Test provider lookup by name"""
+
+    @pytest.mark.parametrize("provider_name", sorted(_PROVIDERS))
+    def test_every_provider_resolves(self, provider_name):
+        """Test that each registered name loads its provider class"""
+        provider = get_provider(provider_name)
+
+        assert isinstance(provider, BaseProvider)
+        assert get_provider(provider_name) is provider
+
+    def test_unknown_provider_raises(self):
+        """Test that an unregistered name is rejected"""
+        with pytest.raises(ValueError, match="Invalid provider name"):
+            get_provider("not-a-provider")
+
+    def test_provider_class_importable_from_package(self):
+        """Test that provider classes can still be imported from the package"""
+        from sp_obs._internal.core.providers import OpenAIProvider
+
+        assert isinstance(get_provider("openai"), OpenAIProvider)
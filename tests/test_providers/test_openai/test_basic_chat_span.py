@@ -95,3 +95,56 @@ class TestOpenAIProvider:
         response_attributes = {"metadata": "some_value"}
         parsed = provider.parse_response_attributes(response_attributes)
         assert parsed == {"metadata": "some_value"}
+
+    @pytest.fixture
+    def response_event_stream(self) -> bytes:
+        """A Responses API stream, with the completed event optionally cut off"""
+        return (
+            "event: response.created\n"
+            'data: {"type":"response.created","response":{"id":"resp_1","status":"in_progress"}}\n'
+            "\n"
+            "event: response.output_text.delta\n"
+            'data: {"type":"response.output_text.delta","delta":"Hi"}\n'
+            "\n"
+            "event: response.output_item.done\n"
+            'data: {"type":"response.output_item.done","item":{"id":"msg_1","type":"message"}}\n'
+            "\n"
+            "event: response.completed\n"
+            'data: {"type":"response.completed","response":{"id":"resp_1","usage":{"total_tokens":12}}}\n'
+            "\n"
+        ).encode()
+
+    def test_handle_event_stream_returns_completed_response(self, response_event_stream):
+        """Test that the completed response is returned from a full stream"""
+        provider = get_provider("openai")
+
+        response = provider.handle_event_stream(response_event_stream)
+
+        assert response == {"id": "resp_1", "usage": {"total_tokens": 12}}
+
+    def test_handle_event_stream_without_completed_response(self, response_event_stream):
+        """Test that the output items are collected when the stream has no completed response"""
+        provider = get_provider("openai")
+        event_stream = response_event_stream.split(b"event: response.completed")[0]
+
+        response = provider.handle_event_stream(event_stream)
+
+        assert response == {"output": [{"id": "msg_1", "type": "message"}]}
+
+    def test_handle_event_stream_completed_without_trailing_newline(self, response_event_stream):
+        """Test that the completed response is found when the stream ends on its data line"""
+        provider = get_provider("openai")
+
+        response = provider.handle_event_stream(response_event_stream.rstrip(b"\n"))
+
+        assert response == {"id": "resp_1", "usage": {"total_tokens": 12}}
+
+    def test_handle_event_stream_malformed_completed_response(self, response_event_stream):
+        """Test that a completed event whose data cannot be parsed falls back to the output items"""
+        provider = get_provider("openai")
+        event_stream = response_event_stream.split(b"event: response.completed")[0]
+        event_stream += b"event: response.completed\ndata: {not json\n\n"
+
+        response = provider.handle_event_stream(event_stream)
+
+        assert response == {"output": [{"id": "msg_1", "type": "message"}]}
@@ -157,3 +157,32 @@ class TestPerplexityProvider:
         assert "choices" not in parsed
         assert "delta" not in parsed
         assert "object" not in parsed
+
+    @pytest.fixture
+    def event_stream(self) -> bytes:
+        """A streamed completion whose chunks repeat the model and the usage so far"""
+        return (
+            b'data: {"model": "sonar", "usage": {"total_tokens": 10}, "choices": [{"delta": {"content": "data: x"}}]}\n'
+            b"\n"
+            b'data: {"model": "sonar", "usage": {"total_tokens": 12}, "choices": [{"delta": {"content": "Hi"}}]}\n'
+            b"\n"
+            b"data: [DONE]\n"
+            b"\n"
+        )
+
+    def test_handle_event_stream_uses_last_chunk(self, event_stream):
+        """Test that the usage and model are taken from the last chunk before [DONE]"""
+        provider = get_provider("perplexity")
+
+        response = provider.handle_event_stream(event_stream)
+
+        assert response == {"usage": {"total_tokens": 12}, "model": "sonar"}
+
+    def test_handle_event_stream_without_usage_in_last_chunk(self, event_stream):
+        """Test that the whole stream is read when the last chunk carries no usage"""
+        provider = get_provider("perplexity")
+        event_stream = event_stream.replace(b"data: [DONE]", b'data: {"choices": []}\n\ndata: [DONE]')
+
+        response = provider.handle_event_stream(event_stream)
+
+        assert response == {"usage": {"total_tokens": 12}, "model": "sonar"}
@@ -114,6 +114,18 @@ class TestDefaultScrubber(unittest.TestCase):
 
         _ = DefaultScrubber(extra_patterns=["credit_card", "house", "personal_attributes"])
 
+    def test_repeated_keys_scrub_consistently(self):
+        """Test that memoised key lookups give the same result as the first match"""
+        attributes = {"password": "secret123", "model": "gpt-4", "nested": {"api_key": "key", "model": "gpt-4"}}
+
+        first = self.scrubber.scrub_attributes(attributes)
+        second = self.scrubber.scrub_attributes(attributes)
+
+        self.assertEqual(first, second)
+        self.assertEqual(second["password"], "[Scrubbed due to password]")
+        self.assertEqual(second["nested"]["api_key"], "[Scrubbed due to api_key]")
+        self.assertEqual(second["nested"]["model"], "gpt-4")
+
 
 class TestNoOpScrubber(unittest.TestCase):
     """Test NoOpScrubber class"""